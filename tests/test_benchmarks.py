@@ -0,0 +1,84 @@
+from utils.benchmarks import (BENCHMARKS, run_benchmarks, time_benchmark,
+                              time_calibration, relative_to,
+                              find_regressions, load_baseline, save_baseline)
+
+
+def test_run_benchmarks_std():
+    """
+    Test run_benchmarks() function\n
+    This test targets the standard use case
+    """
+    results = run_benchmarks([2, 10], repeat=1, min_time=0)
+    assert set(results) == {f"{name}@{size}" for name in BENCHMARKS
+                            for size in (2, 10)}
+    assert all(elapsed > 0 for elapsed in results.values())
+
+
+def test_run_benchmarks_names():
+    """
+    Test run_benchmarks() function\n
+    This test targets running only chosen benchmarks
+    """
+    results = run_benchmarks([2], ["board.hit", "ai.turn"], repeat=1,
+                             min_time=0)
+    assert list(results) == ["board.hit@2", "ai.turn@2"]
+
+
+def test_time_benchmark_min_time(monkeypatch):
+    """
+    Test time_benchmark() function\n
+    This test targets the minimum duration, the benchmark should be
+    run on fresh boards until it has taken long enough
+    """
+    ticks = iter(range(100))
+    monkeypatch.setattr("utils.benchmarks.perf_counter",
+                        lambda: next(ticks))
+    calls = []
+
+    def bench(size, random):
+        calls.append(size)
+        return lambda: 2
+    monkeypatch.setitem(BENCHMARKS, "fake", bench)
+    assert time_benchmark("fake", 5, repeat=1, min_time=3) == 0.5
+    assert calls == [5, 5, 5]
+
+
+def test_time_calibration_std():
+    """
+    Test time_calibration() and relative_to() functions\n
+    This test targets the standard use case, times should
+    become multiples of the calibration
+    """
+    calibration = time_calibration(repeat=1, min_time=0)
+    assert calibration > 0
+    relative = relative_to({"board.hit@10": 4 * calibration}, calibration)
+    assert relative == {"board.hit@10": 4.0}
+
+
+def test_find_regressions_std():
+    """
+    Test find_regressions() function\n
+    This test targets the standard use case
+    """
+    baseline = {"board.hit@10": 1.0, "ai.turn@10": 2.0}
+    results = {"board.hit@10": 1.5, "ai.turn@10": 2.2}
+    assert find_regressions(results, baseline, 0.25) == {"board.hit@10": 0.5}
+
+
+def test_find_regressions_missing_baseline():
+    """
+    Test find_regressions() function\n
+    This test targets skipping benchmarks missing from the baseline
+    """
+    assert find_regressions({"board.hit@10": 5.0}, {}, 0.25) == {}
+
+
+def test_save_load_baseline_std(tmp_path):
+    """
+    Test save_baseline() and load_baseline() functions\n
+    This test targets the standard use case
+    """
+    path = tmp_path / "baseline.json"
+    results = {"board.hit@10": 1e-6, "ai.turn@2": 2e-5}
+    save_baseline(path, results)
+    assert load_baseline(path) == results
@@ -1,6 +1,12 @@
 from classes.board import Board
+from classes.output_sink import BufferedSink
+from utils.board_io import print_board_io
 from classes.board import (InvalidWarshipCountError, InvalidWarshipError,
-                           CoordinatesOutOfRangeError)
+                           CoordinatesOutOfRangeError,
+                           NoAvailableLocationError,
+                           FleetPlacementNotFoundError)
+from utils.placements import placement_blocks
+from random import Random
 import pytest
 
 
@@ -25,7 +31,7 @@ def test_create_board_invalid():
     with pytest.raises(ValueError):
         Board(1, 1)
     with pytest.raises(ValueError):
-        Board(27, 1)
+        Board(1001, 1)
     with pytest.raises(InvalidWarshipCountError):
         Board(2, 0)
     with pytest.raises(ValueError):
@@ -312,3 +318,289 @@ def test_board_print_board_std():
     board.hit((0, 0))
     assert "x" in board.print_board()
     assert "x" in board.print_board(True)
+
+
+def test_board_is_placement_available():
+    """
+    Test board's _is_placement_available() method\n
+    This test targets the standard use case
+    """
+    board = Board(3, 3)
+    assert board._is_placement_available(0, 0, 3, False)
+    assert board._is_placement_available(0, 0, 3, True)
+    assert not board._is_placement_available(0, 1, 3, False)
+    assert not board._is_placement_available(1, 0, 3, True)
+    board.add_warship([(1, 0), (1, 1)])
+    assert not board._is_placement_available(0, 0, 3, True)
+    assert board._is_placement_available(0, 2, 3, True)
+    assert not board._is_placement_available(1, 1, 2, False)
+    assert board._is_placement_available(2, 0, 3, False)
+
+
+def test_board_hit_warship_negative_coordinates():
+    """
+    Test board's hit_warship() method\n
+    This test targets the case, when a hit
+    has negative coordinates
+    """
+    board = Board(2, 2)
+    board.add_warship([(1, 0), (1, 1)])
+    with pytest.raises(CoordinatesOutOfRangeError):
+        board.hit((-1, 0))
+    with pytest.raises(CoordinatesOutOfRangeError):
+        board.hit((1, -1))
+    assert board.hit((1, 1)) == (True, False, 2)
+
+
+def test_board_placements_std():
+    """
+    Test board's placements() method\n
+    This test targets the standard use case
+    """
+    board = Board(2, 2)
+    board.add_warship([(0, 0)])
+    placements = [tuple(placement) for placement in board.placements(2)]
+    assert placements == [(0, 1, 1), (1, 0, 0)]
+    assert len(board.placements(3)) == 0
+
+
+def test_board_placements_available_locations():
+    """
+    Test board's placements() method\n
+    This test targets the case, when some warships are placed,
+    placements should match the available locations
+    """
+    board = Board(4, 4)
+    for locations in ([(0, 1), (1, 1)], [(3, 0), (3, 1), (3, 2)]):
+        board.add_warship(locations)
+    for size in range(1, 5):
+        placements = board.placements(size)
+        assert [placement_blocks(x, y, vertical, size)
+                for x, y, vertical in placements if vertical] == (
+            board.get_available_locations_vertical(size))
+        assert [placement_blocks(x, y, vertical, size)
+                for x, y, vertical in placements if not vertical] == (
+            board.get_available_locations_horizontal(size))
+        assert len(placements) == (
+            board.count_available_locations_vertical(size)
+            + board.count_available_locations_horizontal(size))
+
+
+def test_board_print_board_matches_print_board_io():
+    """
+    Test board's print_board() method\n
+    This test targets the case, when the board is rendered
+    after every hit, the incremental rendering should match
+    the full one
+    """
+    board = Board(5, 5)
+    board.draw_locations()
+    warships = [(x, y) for x, y in board.all_locations()
+                if not board._is_location_available(x, y)]
+    hits = []
+    for location in [(0, 0), (4, 3), (2, 2), (1, 4), (3, 0), (0, 0)]:
+        board.resolve_hit(location)
+        hits.append(location)
+        for show_warships in (False, True):
+            assert board.print_board(show_warships) == print_board_io(
+                5, warships, hits, show_warships)
+
+
+def test_board_placement_sequence_std():
+    """
+    Test board's placement_sequence() method\n
+    This test targets the standard use case, the lazy sequence
+    should match the placements
+    """
+    board = Board(4, 4)
+    board.add_warship([(0, 1), (1, 1)])
+    board.add_warship([(3, 0), (3, 1), (3, 2)])
+    for size in range(1, 5):
+        placements = [tuple(placement) for placement in board.placements(size)]
+        sequence = board.placement_sequence(size)
+        assert len(sequence) == len(placements)
+        assert list(sequence) == placements
+        assert [sequence[index] for index in range(len(sequence))] == \
+            placements
+    with pytest.raises(IndexError):
+        board.placement_sequence(1)[100]
+
+
+def test_board_draw_location_no_available():
+    """
+    Test board's draw_location() method\n
+    This test targets the case, when the warship doesn't fit
+    anywhere on the board
+    """
+    board = Board(2, 2)
+    with pytest.raises(NoAvailableLocationError):
+        board.draw_location(3)
+    board.add_warship([(0, 0), (0, 1)])
+    board.add_warship([(1, 0), (1, 1)])
+    with pytest.raises(NoAvailableLocationError):
+        board.draw_location(1)
+
+
+def test_board_large_std():
+    """
+    Test board's constructor and draw_locations() methods\n
+    This test targets the case, when the board is much bigger
+    than the alphabet
+    """
+    board = Board(1000, 5)
+    board.draw_locations()
+    assert len(board.warships_str().splitlines()) == 5
+    was_hit = not board._is_location_available(999, 999)
+    board.resolve_hit((999, 999))
+    assert board.print_board(False, (999, 998, 5, 5)) == (
+        "    ALL\n"
+        "998 [ ]\n"
+        "999 " + ("[x]" if was_hit else "[#]") + "\n")
+
+
+def test_board_print_board_viewport():
+    """
+    Test board's print_board() method\n
+    This test targets the case, when only a part of the board
+    is printed, labeled with multi-letter column labels
+    """
+    board = Board(100, 1)
+    board.add_warship([(27, 99)])
+    board.hit((26, 99))
+    assert board.print_board(True, (26, 98, 2, 2)) == (
+        "   AA AB \n"
+        "98 [ ][ ]\n"
+        "99 [#][o]\n")
+    assert board.print_board(False, (98, 0, 5, 1)) == (
+        "   CU CV \n"
+        "0  [ ][ ]\n")
+    assert board.print_board().splitlines()[0].startswith("    A  B  C ")
+
+
+def test_create_board_fleet():
+    """
+    Test board's constructor method\n
+    This test targets the case, when the fleet is configured
+    """
+    board = Board(4, fleet=[1, 2, 1, 1, 2, 1])
+    assert board.fleet == (2, 2, 1, 1, 1, 1)
+    assert board.num_warships == 6
+    assert Board(6, 6).fleet == (5, 4, 3, 2, 1, 1)
+    with pytest.raises(InvalidWarshipCountError):
+        Board(4, 2, fleet=[1])
+    with pytest.raises(InvalidWarshipCountError):
+        Board(4, fleet=[])
+    with pytest.raises(InvalidWarshipCountError):
+        Board(4, fleet=[5])
+    with pytest.raises(InvalidWarshipCountError):
+        Board(2, fleet=[2, 2, 1])
+
+
+def test_board_draw_locations_dense_fleet():
+    """
+    Test board's draw_locations() method\n
+    This test targets the case, when warships fill up the whole board
+    """
+    board = Board(6, fleet=[4] * 8 + [2] * 2)
+    board.draw_locations()
+    assert len(board.placements(1)) == 0
+    assert len(board.warships_str().splitlines()) == 2
+    with pytest.raises(InvalidWarshipCountError):
+        Board(6, fleet=[4] * 9).draw_locations()
+
+
+def test_board_draw_locations_unsolvable_fleet():
+    """
+    Test board's draw_locations() method\n
+    This test targets the case, when the fleet fits the number of locations
+    but the solver cannot place it within its budget
+    """
+    board = Board(15, fleet=[6] * 37)
+    with pytest.raises(FleetPlacementNotFoundError):
+        board.draw_locations()
+
+
+def test_board_draw_locations_packed_fleet():
+    """
+    Test board's draw_locations() method\n
+    This test targets dense fleets, that fit on the board,
+    all of their warships should be placed
+    """
+    for size, fleet in ((26, [5] * 105), (15, [5] * 40)):
+        board = Board(size, fleet=fleet, random=Random(3))
+        board.draw_locations()
+        assert len(board.placed_warships()) == len(fleet)
+        assert board.count_available_locations_horizontal(1) == (
+            size * size - sum(fleet))
+
+
+def test_board_afloat_std():
+    """
+    Test board's afloat() method\n
+    This test targets the standard use case, numbers of warships
+    afloat should follow the hits
+    """
+    board = Board(3, fleet=[2, 2, 1])
+    board.add_warship([(0, 0), (0, 1)])
+    board.add_warship([(2, 0)])
+    board.add_warship([(1, 2), (2, 2)])
+    assert board.afloat() == {2: 2, 1: 1}
+    assert board.warships_str() == "2 mast warship: x2\n1 mast warship: x1\n"
+    board.resolve_hit((0, 0))
+    assert board.afloat() == {2: 2, 1: 1}
+    assert board.resolve_hit((0, 1)) == (True, True, 2)
+    assert board.afloat() == {2: 1, 1: 1}
+    assert board.warships_str() == "2 mast warship: x1\n1 mast warship: x1\n"
+    board.resolve_hit((2, 0))
+    board.resolve_hit((1, 2))
+    assert not board.all_sunk()
+    assert board.resolve_hit((2, 2)) == (True, True, 2)
+    assert board.afloat() == {}
+    assert board.warships_str() == ""
+    assert board.all_sunk()
+
+
+def test_board_iter_and_count_available_locations():
+    """
+    Test board's iter_available_locations_*() and
+    count_available_locations_*() methods\n
+    This test targets the standard use case, they should match
+    the lists of available locations
+    """
+    board = Board(4, 4)
+    board.add_warship([(0, 1), (1, 1)])
+    board.add_warship([(3, 0), (3, 1), (3, 2)])
+    for size in range(1, 6):
+        horizontal = board.get_available_locations_horizontal(size)
+        vertical = board.get_available_locations_vertical(size)
+        assert list(board.iter_available_locations_horizontal(size)) == \
+            horizontal
+        assert list(board.iter_available_locations_vertical(size)) == \
+            vertical
+        assert board.count_available_locations_horizontal(size) == \
+            len(horizontal)
+        assert board.count_available_locations_vertical(size) == \
+            len(vertical)
+
+
+def test_board_hit_sink(capsys):
+    """
+    Test board's hit() method\n
+    This test targets messages of hits, they should be written
+    to the board's sink and never printed by default
+    """
+    board = Board(3, 1)
+    board.add_warship([(0, 0)])
+    board.hit((1, 1))
+    board.hit((0, 0))
+    assert capsys.readouterr().out == ""
+    sink = BufferedSink()
+    board = Board(3, 1, sink=sink)
+    board.add_warship([(0, 0), (0, 1)])
+    board.hit((1, 1))
+    board.hit((0, 0))
+    board.hit((0, 0))
+    board.hit((0, 1))
+    assert sink.drain() == ["Miss", "2 mast warship hit",
+                            "You've already hit here before",
+                            "2 mast warship sunk"]
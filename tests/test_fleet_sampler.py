@@ -0,0 +1,113 @@
+from classes.fleet_sampler import FleetSampler
+from utils.fleet_sampling import sample_fleet, count_samples
+from utils.placements import placement_blocks
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+import pytest
+
+
+def test_sample_fleet_std():
+    """
+    Test sample_fleet() function\n
+    This test targets the standard use case, sampled warships
+    don't overlap each other nor blocked locations and cover all hits
+    with warships of their sizes
+    """
+    random = Random(0)
+    blocked = [0b1, 0, 0b100, 0, 0]
+    hits = {3: [(1, 1)], 2: [(4, 4)]}
+    for _ in range(50):
+        placements = sample_fleet(5, {3: 1, 2: 2, 1: 1}, blocked, hits,
+                                  random)
+        assert sorted(size for *_, size in placements) == [1, 2, 2, 3]
+        taken = {}
+        for x, y, vertical, size in placements:
+            for block in placement_blocks(x, y, vertical, size):
+                assert block not in taken
+                taken[block] = size
+        assert (0, 0) not in taken and (2, 2) not in taken
+        assert taken[(1, 1)] == 3
+        assert taken[(4, 4)] == 2
+
+
+def test_sample_fleet_impossible():
+    """
+    Test sample_fleet() function\n
+    This test targets the case when the hits cannot be covered
+    """
+    random = Random(0)
+    assert sample_fleet(3, {2: 1}, [0b010, 0b101, 0b010], {2: [(1, 1)]},
+                        random) is None
+    assert sample_fleet(3, {1: 1}, [0] * 3, {2: [(1, 1)]}, random) is None
+
+
+def test_count_samples_std():
+    """
+    Test count_samples() function\n
+    This test targets the standard use case
+    """
+    successful, counts = count_samples(4, {4: 1}, [0b1111, 0, 0, 0], {},
+                                       20, 0)
+    assert successful == 20
+    assert counts[:4] == [0, 0, 0, 0]
+    assert sum(counts) == 20 * 4
+
+
+def test_count_samples_time_budget():
+    """
+    Test count_samples() function\n
+    This test targets the case when the time budget is spent at once,
+    a single arrangement is still sampled
+    """
+    successful, counts = count_samples(10, {5: 1, 4: 1}, [0] * 10, {},
+                                       1000, 0, time_budget=0)
+    assert successful == 1
+    assert sum(counts) == 9
+
+
+def test_fleet_sampler_best_std():
+    """
+    Test fleet sampler's best() method\n
+    This test targets the standard use case, the most covered location
+    is chosen among those that weren't hit before
+    """
+    sampler = FleetSampler(3, Random(0), samples=50)
+    blocked = [0b001, 0b000, 0b001]
+    shot = [0b001, 0b001, 0b001]
+    assert sampler.best({2: 1}, blocked, {2: [(1, 0)]}, shot) == (1, 1)
+    assert sampler.last_samples == 50
+
+
+def test_fleet_sampler_best_impossible():
+    """
+    Test fleet sampler's best() method\n
+    This test targets the case when no arrangement can be sampled
+    """
+    sampler = FleetSampler(2, Random(0), samples=5)
+    assert sampler.best({3: 1}, [0] * 2, {}, [0] * 2) is None
+    assert sampler.last_samples == 0
+
+
+def test_fleet_sampler_invalid():
+    """
+    Test fleet sampler's constructor method\n
+    This test targets the incorrect use case
+    """
+    with pytest.raises(ValueError):
+        FleetSampler(3, samples=0)
+    with pytest.raises(ValueError):
+        FleetSampler(3, chunks=-1)
+
+
+def test_fleet_sampler_executor():
+    """
+    Test fleet sampler's estimate() method\n
+    This test targets sampling chunks in a pool of worker processes,
+    the estimate shouldn't depend on where the chunks are sampled
+    """
+    arguments = ({3: 1, 2: 1}, [0] * 6, {2: [(3, 3)]})
+    local = FleetSampler(6, Random(1), samples=40, chunks=2)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = FleetSampler(6, Random(1), samples=40, executor=executor,
+                              chunks=2)
+        assert pooled.estimate(*arguments) == local.estimate(*arguments)
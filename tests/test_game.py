@@ -1,4 +1,9 @@
 from classes.game import Game, GameEnded
+from classes.output_sink import BufferedSink, NullSink
+from classes.profiler import Profiler, NullProfiler
+from classes.game_log import (GameLog, GameReplay, AI, iter_games,
+                              read_game_log)
+from random import Random
 import pytest
 
 
@@ -92,10 +97,173 @@ def test_game_ai_won(monkeypatch):
     game = Game("2")
     monkeypatch.setattr("classes.player.sleep", lambda _: None)
     monkeypatch.setattr("classes.game.sleep", lambda _: None)
-    monkeypatch.setattr("classes.player.pick_location", lambda a, b: 0)
+    monkeypatch.setattr("classes.player.pick_location", lambda a, b, c: 0)
     game.player.place_warships()
     game.ai_turn()
     game.ai_turn()
     with pytest.raises(GameEnded):
         game.ai_turn()
         game.ai_turn()
+
+
+def play_ai_shots(game, shots):
+    """
+    Lets the Ai of a game make a number of recorded shots
+    """
+    for _ in range(shots):
+        hit = game.ai.smart_hit()
+        hit_result = game.player.board.resolve_hit(hit)
+        game.record_shot(AI, hit, hit_result)
+        game.ai.set_next_hit(hit_result)
+
+
+def test_game_snapshot_restore_std(monkeypatch):
+    """
+    Test game's snapshot() and restore() methods\n
+    This test targets the standard use case, the restored game
+    should be in the same state and continue from it
+    """
+    monkeypatch.setattr("classes.game.sleep", lambda _: None)
+    monkeypatch.setattr("builtins.print", lambda *_: None)
+    monkeypatch.setattr("builtins.input", lambda _: "B1")
+    game = Game("8")
+    game.player.board.draw_locations()
+    game.players_turn()
+    play_ai_shots(game, 20)
+    snapshot = game.snapshot()
+    assert len(snapshot) < 100
+    restored = Game.restore(snapshot)
+    assert restored.snapshot() == snapshot
+    for board, restored_board in ((game.player.board, restored.player.board),
+                                  (game.ai.board, restored.ai.board)):
+        assert restored_board.print_board(True) == board.print_board(True)
+        assert restored_board.afloat() == board.afloat()
+    [events] = iter_games(snapshot)
+    shots = {event.location for event in GameReplay(events).shots
+             if event.side == AI}
+    while not restored.player.board.all_sunk():
+        hit = restored.ai.smart_hit()
+        assert hit not in shots
+        shots.add(hit)
+        restored.ai.set_next_hit(restored.player.board.resolve_hit(hit))
+
+
+def test_game_restore_seeded(monkeypatch):
+    """
+    Test game's restore() method\n
+    This test targets the case when the restored Ai is given a random
+    number generator, its hits should be reproducible
+    """
+    monkeypatch.setattr("classes.game.sleep", lambda _: None)
+    monkeypatch.setattr("builtins.print", lambda *_: None)
+    monkeypatch.setattr("builtins.input", lambda _: "B1")
+    game = Game("8")
+    game.player.board.draw_locations()
+    game.players_turn()
+    play_ai_shots(game, 5)
+    snapshot = game.snapshot()
+    hits = []
+    for _ in range(2):
+        restored = Game.restore(snapshot, random=Random(11))
+        shots = []
+        for _ in range(10):
+            hit = restored.ai.smart_hit()
+            shots.append(hit)
+            restored.ai.set_next_hit(restored.player.board.resolve_hit(hit))
+        hits.append(shots)
+    assert hits[0] == hits[1]
+
+
+def test_game_restore_invalid():
+    """
+    Test game's restore() method\n
+    This test targets the case when the snapshot is incorrect
+    """
+    snapshot = Game("5").snapshot()
+    for invalid in (b"", snapshot + snapshot, snapshot[:-1]):
+        with pytest.raises(ValueError):
+            Game.restore(invalid)
+
+
+def test_game_restore_log(tmp_path):
+    """
+    Test game's restore() method\n
+    This test targets the case when the restored game is recorded
+    """
+    game = Game("6")
+    game.player.board.draw_locations()
+    play_ai_shots(game, 5)
+    path = tmp_path / "games.log"
+    with GameLog(path) as log:
+        restored = Game.restore(game.snapshot(), log)
+        play_ai_shots(restored, 5)
+    [events] = read_game_log(path)
+    assert len(GameReplay(events).shots) == 10
+
+
+def test_game_fork_std():
+    """
+    Test game's fork() method\n
+    This test targets the standard use case, both games
+    should continue independently
+    """
+    game = Game("6")
+    game.player.board.draw_locations()
+    play_ai_shots(game, 5)
+    snapshot = game.snapshot()
+    fork = game.fork()
+    assert fork.snapshot() == snapshot
+    assert fork.player.board.fleet is game.player.board.fleet
+    play_ai_shots(fork, 10)
+    assert game.snapshot() == snapshot
+    assert (fork.player.board.print_board(True)
+            != game.player.board.print_board(True))
+
+
+def test_game_sink(capsys):
+    """
+    Test game's methods with a buffered sink\n
+    This test targets the case when messages are kept instead of printed
+    """
+    sink = BufferedSink()
+    game = Game("4", sink=sink)
+    game.player.board.draw_locations()
+    location, hit_result = game.ai_shot()
+    x, y = location
+    messages = sink.drain()
+    assert messages[0] == "ABCD"[x] + str(y)
+    assert len(messages) == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_game_profiler(monkeypatch):
+    """
+    Test game's methods with a profiler\n
+    This test targets the case when phases of the game are measured
+    """
+    profiler = Profiler()
+    game = Game("4", sink=NullSink(), profiler=profiler)
+    game.player.board.draw_locations()
+    monkeypatch.setattr("classes.game.sleep", lambda _: None)
+    monkeypatch.setattr("builtins.input", lambda _: "A0")
+    game.players_turn()
+    game.ai_turn()
+    report = profiler.report()
+    assert list(report) == ["placement", "render", "parse", "hit",
+                            "smart_hit", "set_next_hit"]
+    assert report["render"].calls == 3
+    assert all(report[phase].calls == 1 for phase in
+               ("placement", "parse", "hit", "smart_hit", "set_next_hit"))
+    assert all(stats.seconds >= 0 for stats in report.values())
+
+
+def test_game_profiler_default():
+    """
+    Test game's methods without a profiler\n
+    This test targets the case when nothing is measured
+    """
+    game = Game("4", sink=NullSink())
+    game.player.board.draw_locations()
+    game.ai_shot()
+    assert isinstance(game.profiler, NullProfiler)
+    assert game.profiler.report() == {}
@@ -0,0 +1,195 @@
+from classes.board import Board
+from classes.player import Ai
+from classes.game import Game
+from classes.game_log import (GameLog, GameReplay, GameStarted,
+                              WarshipPlaced, ShotFired, PLAYER, AI,
+                              read_game_log)
+from utils.event_codec import (write_varint, read_varint, encode_shot,
+                               decode_events)
+from random import Random
+import pytest
+
+
+def test_varint_std():
+    """
+    Test write_varint() and read_varint() functions\n
+    This test targets the standard use case
+    """
+    buffer = bytearray()
+    values = [0, 1, 127, 128, 300, 10 ** 12]
+    for value in values:
+        write_varint(buffer, value)
+    assert buffer[2:6] == b"\x7f\x80\x01\xac"
+    offset = 0
+    for value in values:
+        decoded, offset = read_varint(buffer, offset)
+        assert decoded == value
+    assert offset == len(buffer)
+
+
+def test_read_varint_truncated():
+    """
+    Test read_varint() function\n
+    This test targets the case when the data ends within an integer
+    """
+    with pytest.raises(ValueError):
+        read_varint(b"\x80\x80", 0)
+
+
+def test_encode_shot_compact():
+    """
+    Test encode_shot() function\n
+    This test targets the size of encoded shots, it should take
+    a few bytes even on the largest board
+    """
+    buffer = bytearray()
+    encode_shot(buffer, 10, AI, (9, 9), (False, False, 0))
+    assert len(buffer) == 2
+    buffer = bytearray()
+    encode_shot(buffer, 1000, PLAYER, (999, 999), (True, True, 5))
+    assert len(buffer) == 5
+
+
+def test_decode_events_invalid():
+    """
+    Test decode_events() function\n
+    This test targets the case when a shot comes before the game's start
+    """
+    buffer = bytearray()
+    encode_shot(buffer, 10, AI, (1, 2), (False, False, 0))
+    with pytest.raises(ValueError):
+        list(decode_events(buffer))
+
+
+def test_game_log_round_trip(tmp_path):
+    """
+    Test game log's methods and read_game_log() function\n
+    This test targets the standard use case, recorded events
+    should be read back in the same order
+    """
+    board = Board(5, fleet=[3, 1])
+    board.add_warship([(0, 0), (1, 0), (2, 0)])
+    board.add_warship([(4, 4)])
+    path = tmp_path / "games.log"
+    with GameLog(path) as log:
+        for _ in range(2):
+            log.start(5, board.fleet)
+            log.placements(AI, board)
+            log.shot(PLAYER, (1, 0), (True, False, 3))
+            log.shot(AI, (3, 2), (False, False, 0))
+    expected = [
+        GameStarted(5, (3, 1)),
+        WarshipPlaced(AI, 0, 0, True, 3),
+        WarshipPlaced(AI, 4, 4, False, 1),
+        ShotFired(PLAYER, (1, 0), (True, False, 3)),
+        ShotFired(AI, (3, 2), (False, False, 0)),
+    ]
+    assert read_game_log(path) == [expected, expected]
+
+
+def test_game_log_records_game(tmp_path, monkeypatch):
+    """
+    Test game's methods with a game log\n
+    This test targets the standard use case, the replayed game
+    should match the played one
+    """
+    monkeypatch.setattr("classes.game.sleep", lambda _: None)
+    monkeypatch.setattr("classes.player.sleep", lambda _: None)
+    monkeypatch.setattr("builtins.print", lambda *_: None)
+    monkeypatch.setattr("builtins.input", lambda _: "A0")
+    path = tmp_path / "games.log"
+    with GameLog(path) as log:
+        game = Game("5", log=log)
+        game.player.board.draw_locations()
+        game.record_start()
+        game.players_turn()
+        game.ai_turn()
+    [events] = read_game_log(path)
+    assert events[0] == GameStarted(5, (5, 4, 3, 2, 1))
+    assert len(events) == 1 + 10 + 2
+    state = GameReplay(events).replay()
+    assert (state.player.board.print_board(True)
+            == game.player.board.print_board(True))
+    assert state.ai.board.print_board(True) == game.ai.board.print_board(True)
+
+
+def test_game_replay_std(tmp_path):
+    """
+    Test game replay's replay() method\n
+    This test targets the standard use case, the Ai rebuilt at any turn
+    should continue the game without repeating recorded shots
+    """
+    for targeting in ("random", "heatmap"):
+        random = Random(3)
+        boards = [Board(8, fleet=[4, 3, 3, 2], random=random)
+                  for _ in range(2)]
+        for board in boards:
+            board.draw_locations()
+        ai = Ai(boards[AI], random, targeting)
+        path = tmp_path / f"{targeting}.log"
+        with GameLog(path) as log:
+            log.start(8, boards[PLAYER].fleet)
+            log.placements(PLAYER, boards[PLAYER])
+            log.placements(AI, boards[AI])
+            while not boards[PLAYER].all_sunk():
+                location = ai.smart_hit()
+                hit_result = boards[PLAYER].resolve_hit(location)
+                ai.set_next_hit(hit_result)
+                log.shot(AI, location, hit_result)
+        [events] = read_game_log(path)
+        replay = GameReplay(events, targeting)
+        state = replay.replay()
+        assert state.player.board.all_sunk()
+        assert (state.player.board.print_board(True)
+                == boards[PLAYER].print_board(True))
+        state = replay.replay(12)
+        shots = {shot.location for shot in replay.shots[:12]}
+        assert not state.player.board.all_sunk()
+        for _ in range(10):
+            if state.player.board.all_sunk():
+                break
+            location = state.ai.smart_hit()
+            assert location not in shots
+            shots.add(location)
+            state.ai.set_next_hit(state.player.board.resolve_hit(location))
+
+
+def test_game_replay_seeded(tmp_path):
+    """
+    Test game replay's replay() method\n
+    This test targets the case when the replayed Ai is given a random
+    number generator, the continuation should be reproducible
+    """
+    random = Random(5)
+    boards = [Board(8, fleet=[4, 3, 3, 2], random=random) for _ in range(2)]
+    for board in boards:
+        board.draw_locations()
+    path = tmp_path / "seeded.log"
+    with GameLog(path) as log:
+        log.start(8, boards[PLAYER].fleet)
+        log.placements(PLAYER, boards[PLAYER])
+        log.placements(AI, boards[AI])
+    [events] = read_game_log(path)
+    continuations = []
+    for _ in range(2):
+        state = GameReplay(events, random=Random(7)).replay()
+        shots = []
+        while not state.player.board.all_sunk():
+            location = state.ai.smart_hit()
+            shots.append(location)
+            state.ai.set_next_hit(state.player.board.resolve_hit(location))
+        continuations.append(shots)
+    assert continuations[0] == continuations[1]
+
+
+def test_game_replay_invalid():
+    """
+    Test game replay's methods\n
+    This test targets the cases when the events are incorrect
+    """
+    with pytest.raises(ValueError):
+        GameReplay([ShotFired(AI, (0, 0), (False, False, 0))])
+    events = [GameStarted(3, (1,)), WarshipPlaced(PLAYER, 0, 0, False, 1),
+              ShotFired(AI, (0, 0), (False, False, 0))]
+    with pytest.raises(ValueError):
+        GameReplay(events).replay()
@@ -0,0 +1,111 @@
+from classes.game_server import GameSession, GameServer, format_shot
+import asyncio
+
+
+def test_format_shot_std():
+    """
+    Test format_shot() function\n
+    This test targets the standard use case
+    """
+    assert format_shot("YOU", (0, 3), (False, False, 0)) == "YOU A3 MISS"
+    assert format_shot("AI", (27, 1), (True, False, 2)) == "AI AB1 HIT 2"
+    assert format_shot("AI", (1, 1), (True, True, 1)) == "AI B1 SUNK 1"
+
+
+def test_game_session_std():
+    """
+    Test game session's handle() method\n
+    This test targets the standard use case, a whole game
+    should be played with commands
+    """
+    async def play():
+        session = GameSession(fleet=[2, 1])
+        assert await session.handle("new 3") == ["GAME 3", "PLACE 2"]
+        assert await session.handle("PLACE A0 V") == ["PLACE 1"]
+        assert await session.handle("PLACE C2") == ["READY"]
+        board = await session.handle("BOARD")
+        assert board[1:] == ["0  [o][ ][ ]", "1  [o][ ][ ]",
+                             "2  [ ][ ][o]", "END"]
+        result = []
+        for x in "ABC":
+            for y in range(3):
+                lines = await session.handle(f"FIRE {x}{y}")
+                assert lines[0].startswith(f"YOU {x}{y} ")
+                result = lines
+                if result[-1] in ("WON", "LOST"):
+                    break
+            if result[-1] in ("WON", "LOST"):
+                break
+        assert result[-1] in ("WON", "LOST")
+        assert (await session.handle("FIRE A0"))[0].startswith("ERROR")
+        messages = await session.handle("MESSAGES")
+        assert "Miss" in messages or "1 mast warship sunk" in messages
+        assert messages[-1] == "END"
+        assert await session.handle("MESSAGES") == ["END"]
+        assert await session.handle("QUIT") == ["BYE"]
+        assert session.closed
+
+    asyncio.run(play())
+
+
+def test_game_session_invalid():
+    """
+    Test game session's handle() method\n
+    This test targets the cases when commands are incorrect
+    """
+    async def play():
+        session = GameSession()
+        for command in ("JUMP", "FIRE A0", "NEW x", "NEW 1001"):
+            [line] = await session.handle(command)
+            assert line.startswith("ERROR")
+        await session.handle("NEW 5")
+        for command in ("FIRE A0", "PLACE A0", "PLACE A4 V", "PLACE F0 H"):
+            [line] = await session.handle(command)
+            assert line.startswith("ERROR")
+        assert await session.handle("AUTO") == ["READY"]
+        for command in ("AUTO", "PLACE A0 H", "FIRE 0A", "FIRE A5"):
+            [line] = await session.handle(command)
+            assert line.startswith("ERROR")
+
+    asyncio.run(play())
+
+
+def test_game_server_concurrent_sessions():
+    """
+    Test game server's methods\n
+    This test targets many concurrent sessions over TCP, a paced Ai
+    shouldn't block the other sessions
+    """
+    async def client(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(command):
+            writer.write(f"{command}\n".encode())
+            await writer.drain()
+            return (await reader.readline()).decode().strip()
+
+        assert await send("NEW 4") == "GAME 4"
+        await reader.readline()
+        assert await send("AUTO") == "READY"
+        assert (await send("FIRE A0")).startswith("YOU A0 ")
+        line = (await reader.readline()).decode()
+        assert line.startswith("AI ")
+        assert await send("QUIT") == "BYE"
+        writer.close()
+
+    async def run():
+        server = GameServer(pace=0.2)
+        tcp_server = await server.start()
+        port = tcp_server.sockets[0].getsockname()[1]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with tcp_server:
+            await asyncio.gather(*(client(port) for _ in range(100)))
+        assert loop.time() - start < 5
+        for _ in range(100):
+            if not server.sessions:
+                break
+            await asyncio.sleep(0.01)
+        assert server.sessions == 0
+
+    asyncio.run(run())
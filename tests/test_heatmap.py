@@ -0,0 +1,140 @@
+from classes.board import Board
+from classes.heatmap import Heatmap
+from utils.consts import HEATMAP_HIT_WEIGHT
+from random import Random
+import pytest
+
+
+def rebuilt_scores(size, warship_sizes, results):
+    """
+    Returns the heatmap scores computed from scratch
+    """
+    misses = {location for location, (hit, _, _) in results.items()
+              if not hit}
+    hits = {location: hit_size for location, (hit, _, hit_size)
+            in results.items() if hit}
+    sunk = {hit_size for (hit, was_sunk, hit_size) in results.values()
+            if was_sunk}
+    scores = {}
+    for warship_size in warship_sizes:
+        if warship_size in sunk:
+            continue
+        for x in range(size):
+            for y in range(size):
+                for vertical in (False, True):
+                    if vertical:
+                        cells = [(x + i, y) for i in range(warship_size)]
+                    else:
+                        cells = [(x, y + i) for i in range(warship_size)]
+                    if any(cx >= size or cy >= size for cx, cy in cells):
+                        continue
+                    if any(cell in misses for cell in cells):
+                        continue
+                    if any(hits.get(cell, warship_size) != warship_size
+                           for cell in cells):
+                        continue
+                    weight = HEATMAP_HIT_WEIGHT ** sum(
+                        cell in hits for cell in cells)
+                    for cell in cells:
+                        scores[cell] = scores.get(cell, 0) + weight
+    return scores
+
+
+def test_create_heatmap_std():
+    """
+    Test heatmap's constructor method\n
+    This test targets the standard use case
+    """
+    heatmap = Heatmap(3, [2, 1])
+    assert heatmap.size == 3
+    assert heatmap.score((0, 0)) == 2 + 2
+    assert heatmap.score((1, 1)) == 4 + 2
+    assert heatmap.best() == (1, 1)
+
+
+def test_heatmap_update_miss():
+    """
+    Test heatmap's update() method\n
+    This test targets the case, when a hit was a miss
+    """
+    heatmap = Heatmap(3, [2])
+    heatmap.update((1, 1), (False, False, 0))
+    assert heatmap.score((1, 1)) == 0
+    assert heatmap.score((0, 1)) == 2
+    assert heatmap.score((0, 0)) == 2
+    assert heatmap.best() != (1, 1)
+
+
+def test_heatmap_update_hit():
+    """
+    Test heatmap's update() method\n
+    This test targets the case, when a hit was successful,
+    its neighbours should be chosen next
+    """
+    heatmap = Heatmap(3, [2, 1])
+    heatmap.update((0, 0), (True, False, 2))
+    assert heatmap.best() in [(0, 1), (1, 0)]
+    heatmap.update((0, 1), (False, False, 0))
+    assert heatmap.best() == (1, 0)
+
+
+def test_heatmap_update_sink():
+    """
+    Test heatmap's update() method\n
+    This test targets the case, when a warship was sunk
+    """
+    heatmap = Heatmap(2, [2, 1])
+    heatmap.update((0, 0), (True, False, 2))
+    heatmap.update((0, 1), (True, True, 2))
+    assert heatmap.score((0, 0)) == heatmap.score((0, 1)) == 0
+    assert heatmap.score((1, 0)) == heatmap.score((1, 1)) == 2
+    heatmap.update((1, 0), (False, False, 0))
+    assert heatmap.best() == (1, 1)
+
+
+def test_heatmap_update_repeated():
+    """
+    Test heatmap's update() method\n
+    This test targets the case, when a hit was repeated
+    """
+    heatmap = Heatmap(3, [2])
+    heatmap.update((0, 0), (True, False, 2))
+    score = heatmap.score((0, 1))
+    heatmap.update((0, 0), (False, False, 0))
+    assert heatmap.score((0, 1)) == score
+
+
+def test_heatmap_best_no_locations_left():
+    """
+    Test heatmap's best() method\n
+    This test targets the case, when every location was hit before
+    """
+    heatmap = Heatmap(2, [1])
+    for location in [(0, 0), (0, 1), (1, 0), (1, 1)]:
+        heatmap.update(location, (False, False, 0))
+    with pytest.raises(IndexError):
+        heatmap.best()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_heatmap_incremental_matches_rebuilt(seed):
+    """
+    Test heatmap's update() method\n
+    This test targets the case of a whole game, incrementally updated
+    scores should always match the ones computed from scratch
+    """
+    random = Random(seed)
+    size = 6
+    warship_sizes = [5, 4, 3, 2, 1]
+    board = Board(size, 5, random)
+    board.draw_locations()
+    heatmap = Heatmap(size, warship_sizes, random)
+    results = {}
+    while not board.all_sunk():
+        location = heatmap.best()
+        results[location] = board.resolve_hit(location)
+        heatmap.update(location, results[location])
+        expected = rebuilt_scores(size, warship_sizes, results)
+        for x in range(size):
+            for y in range(size):
+                assert heatmap.score((x, y)) == expected.get((x, y), 0)
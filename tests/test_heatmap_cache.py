@@ -0,0 +1,118 @@
+from classes.heatmap import Heatmap, build_heatmap_cache, prior_scores
+from classes.heatmap_cache import HeatmapCache
+from classes.tournament import run_tournament
+import pytest
+
+
+def test_heatmap_cache_get_std(tmp_path):
+    """
+    Test heatmap cache's get() method\n
+    This test targets the standard use case, cached scores should match
+    computed ones
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(6, [4, 3, 3, 2]), (10, [5, 4, 3, 2, 1])])
+    with HeatmapCache(path) as cache:
+        assert cache.keys() == [(6, (2, 3, 4)), (10, (1, 2, 3, 4, 5))]
+        assert cache.get(6, [4, 3, 3, 2]) == prior_scores(6, [4, 3, 3, 2])
+        assert cache.get(6, [2, 3, 4]) == prior_scores(6, [2, 3, 4])
+        assert (cache.get(10, [5, 4, 3, 2, 1])
+                == prior_scores(10, [5, 4, 3, 2, 1]))
+
+
+def test_heatmap_cache_get_missing(tmp_path):
+    """
+    Test heatmap cache's get() method\n
+    This test targets the case when the cache doesn't contain the scores
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(6, [4, 3, 3, 2])])
+    with HeatmapCache(path) as cache:
+        assert cache.get(7, [4, 3, 3, 2]) is None
+        assert cache.get(6, [4, 3, 2, 1]) is None
+
+
+def test_heatmap_cache_get_copies(tmp_path):
+    """
+    Test heatmap cache's get() method\n
+    This test targets the case when returned scores are modified,
+    the cache should stay intact
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(4, [2, 1])])
+    with HeatmapCache(path) as cache:
+        scores, size_scores = cache.get(4, [2, 1])
+        scores[0] += 100
+        size_scores[2][0] += 100
+        assert cache.get(4, [2, 1]) == prior_scores(4, [2, 1])
+
+
+def test_heatmap_cache_invalid(tmp_path):
+    """
+    Test heatmap cache's constructor method\n
+    This test targets the incorrect use case
+    """
+    empty = tmp_path / "empty.cache"
+    empty.write_bytes(b"")
+    invalid = tmp_path / "invalid.cache"
+    invalid.write_bytes(b"not a heatmap cache")
+    truncated = tmp_path / "truncated.cache"
+    build_heatmap_cache(truncated, [(6, [4, 3])])
+    truncated.write_bytes(truncated.read_bytes()[:-4])
+    unaligned = tmp_path / "unaligned.cache"
+    build_heatmap_cache(unaligned, [(6, [4, 3])])
+    unaligned.write_bytes(unaligned.read_bytes() + b"\0")
+    trailing = tmp_path / "trailing.cache"
+    build_heatmap_cache(trailing, [(6, [4, 3])])
+    trailing.write_bytes(trailing.read_bytes() + bytes(4))
+    for path in (empty, invalid, truncated, unaligned, trailing):
+        with pytest.raises(ValueError):
+            HeatmapCache(path)
+
+
+def test_build_heatmap_cache_merge(tmp_path):
+    """
+    Test build_heatmap_cache() function\n
+    This test targets adding entries to an existing cache file
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(6, [4, 3])])
+    build_heatmap_cache(path, [(8, [4, 3]), (6, [3, 4])])
+    with HeatmapCache(path) as cache:
+        assert cache.keys() == [(6, (3, 4)), (8, (3, 4))]
+        assert cache.get(6, [4, 3]) == prior_scores(6, [4, 3])
+
+
+def test_heatmap_cache_heatmap(tmp_path):
+    """
+    Test heatmap's constructor method\n
+    This test targets initial scores loaded from the cache,
+    the heatmap should behave the same way
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(8, [4, 3, 3, 2])])
+    with HeatmapCache(path) as cache:
+        cached = Heatmap(8, [4, 3, 3, 2], cache=cache)
+    computed = Heatmap(8, [4, 3, 3, 2])
+    for heatmap in (cached, computed):
+        heatmap.update((3, 3), (True, False, 4))
+        heatmap.update((3, 4), (False, False, 0))
+    assert all(cached.score((x, y)) == computed.score((x, y))
+               for x in range(8) for y in range(8))
+
+
+def test_heatmap_cache_tournament(tmp_path):
+    """
+    Test run_tournament() function\n
+    This test targets the heatmap targeting with the cache shared
+    by worker processes, the results shouldn't change
+    """
+    path = tmp_path / "heatmap.cache"
+    build_heatmap_cache(path, [(5, [5, 4, 3, 2, 1])])
+    targeting = ("heatmap", "heatmap")
+    stats = run_tournament(5, 6, seed=3, workers=1, shards=2,
+                           targeting=targeting)
+    stats_cached = run_tournament(5, 6, seed=3, workers=2, shards=2,
+                                  targeting=targeting,
+                                  heatmap_cache=str(path))
+    assert str(stats_cached) == str(stats)
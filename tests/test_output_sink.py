@@ -0,0 +1,60 @@
+from classes.output_sink import (OutputSink, ConsoleSink, NullSink,
+                                 BufferedSink)
+from utils.board_io import format_hit_warships_io
+from classes.warship import Warship
+import pytest
+
+
+def test_output_sink_abstract():
+    """
+    Test output sink's constructor method\n
+    This test targets the abstract base class, it can't be instantiated
+    """
+    with pytest.raises(TypeError):
+        OutputSink()
+
+
+def test_console_sink_std(capsys):
+    """
+    Test console sink's write() method\n
+    This test targets the standard use case
+    """
+    ConsoleSink().write("Miss")
+    assert capsys.readouterr().out == "Miss\n"
+
+
+def test_null_sink_std(capsys):
+    """
+    Test null sink's write() method\n
+    This test targets the standard use case, nothing should be printed
+    """
+    NullSink().write("Miss")
+    assert capsys.readouterr().out == ""
+
+
+def test_buffered_sink_std():
+    """
+    Test buffered sink's write() and drain() methods\n
+    This test targets the standard use case
+    """
+    sink = BufferedSink()
+    sink.write("Miss")
+    sink.write("1 mast warship sunk")
+    assert sink.messages == ["Miss", "1 mast warship sunk"]
+    assert sink.drain() == ["Miss", "1 mast warship sunk"]
+    assert sink.drain() == []
+
+
+def test_format_hit_warships_io_std():
+    """
+    Test format_hit_warships_io() function\n
+    This test targets all results of a hit
+    """
+    warship = Warship([(0, 0), (0, 1)])
+    assert format_hit_warships_io(True, True, warship) == (
+        "2 mast warship sunk")
+    assert format_hit_warships_io(True, False, warship) == (
+        "2 mast warship hit")
+    assert format_hit_warships_io(False, False) == "Miss"
+    assert format_hit_warships_io(False, False, 0) == (
+        "You've already hit here before")
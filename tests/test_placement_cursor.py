@@ -0,0 +1,89 @@
+from classes.board import Board
+from classes.placement_cursor import PlacementCursor
+
+
+def test_create_placement_cursor_std():
+    """
+    Test placement cursor's constructor method\n
+    This test targets the standard use case, the cursor should be
+    moved to fit within the board
+    """
+    cursor = PlacementCursor(Board(5, 1), 3, (4, 4))
+    assert cursor.location == (2, 4)
+    assert cursor.vertical
+    assert cursor.blocks() == [(2, 4), (3, 4), (4, 4)]
+
+
+def test_placement_cursor_move_std():
+    """
+    Test placement cursor's move() method\n
+    This test targets the standard use case, the cursor should stop
+    at the board's edges
+    """
+    cursor = PlacementCursor(Board(5, 1), 2)
+    cursor.move(1, 2)
+    assert cursor.location == (1, 2)
+    cursor.move(-3, 10)
+    assert cursor.location == (0, 4)
+    cursor.move(10, 0)
+    assert cursor.location == (3, 4)
+
+
+def test_placement_cursor_rotate_std():
+    """
+    Test placement cursor's rotate() method\n
+    This test targets the standard use case, the warship sticking
+    out of the board should be moved back
+    """
+    cursor = PlacementCursor(Board(5, 1), 3, (0, 4))
+    cursor.rotate()
+    assert not cursor.vertical
+    assert cursor.blocks() == [(0, 2), (0, 3), (0, 4)]
+    cursor.rotate()
+    assert cursor.blocks() == [(0, 2), (1, 2), (2, 2)]
+
+
+def test_placement_cursor_is_valid_std():
+    """
+    Test placement cursor's is_valid() method\n
+    This test targets the standard use case
+    """
+    board = Board(5, 2)
+    board.add_warship([(1, 0), (1, 1)])
+    cursor = PlacementCursor(board, 2)
+    assert not cursor.is_valid()
+    cursor.rotate()
+    assert cursor.is_valid()
+    cursor.move(1, 0)
+    assert not cursor.is_valid()
+
+
+def test_placement_cursor_render_std():
+    """
+    Test placement cursor's render() method\n
+    This test targets the standard use case
+    """
+    board = Board(3, 2)
+    board.add_warship([(2, 0)])
+    cursor = PlacementCursor(board, 2, (0, 1))
+    assert cursor.render() == (
+        "    A  B  C \n"
+        "0  [ ][ ][o]\n"
+        "1  [*][*][ ]\n"
+        "2  [ ][ ][ ]\n")
+    cursor.move(1, -1)
+    assert cursor.render().split("\n")[1] == "0  [ ][!][!]"
+
+
+def test_placement_cursor_render_large_board():
+    """
+    Test placement cursor's render() method\n
+    This test targets the case when the board is large,
+    only the part around the cursor should be rendered
+    """
+    cursor = PlacementCursor(Board(1000, 1), 5, (500, 700))
+    lines = cursor.render().split("\n")
+    assert len(lines) == 28
+    assert lines[0].split()[0] == "RV"
+    assert lines[1].startswith("687")
+    assert lines[14] == "700 " + "[ ]" * 11 + "[*]" * 5 + "[ ]" * 10
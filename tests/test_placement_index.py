@@ -0,0 +1,78 @@
+from classes.placement_index import PlacementIndex
+
+
+def test_create_placement_index_std():
+    """
+    Test placement index's constructor method\n
+    This test targets the standard use case
+    """
+    index = PlacementIndex(3, [3, 2])
+    assert index.size == 3
+    assert index.sizes() == [3, 2]
+    assert index.horizontal(2) == [0b11, 0b11, 0b11]
+    assert index.vertical(3) == [0b1, 0b1, 0b1]
+
+
+def test_placement_index_covering_std():
+    """
+    Test placement index's covering() method\n
+    This test targets the standard use case
+    """
+    index = PlacementIndex(3, [2])
+    assert index.covering(2, 0, 1) == [
+        (0, 0, False), (0, 1, False), (0, 1, True)]
+    assert index.covering(2, 1, 1) == [
+        (1, 0, False), (1, 1, False), (0, 1, True), (1, 1, True)]
+
+
+def test_placement_index_update_miss():
+    """
+    Test placement index's update() method\n
+    This test targets the case, when a hit was a miss
+    """
+    index = PlacementIndex(3, [2, 1])
+    index.update((1, 1), (False, False, 0))
+    assert index.covering(2, 1, 1) == []
+    assert index.covering(1, 1, 1) == []
+    assert index.covering(2, 0, 1) == [(0, 0, False), (0, 1, False)]
+
+
+def test_placement_index_update_hit():
+    """
+    Test placement index's update() method\n
+    This test targets the case, when a hit was successful
+    """
+    index = PlacementIndex(3, [2, 1])
+    index.update((1, 1), (True, False, 2))
+    assert len(index.covering(2, 1, 1)) == 4
+    assert index.covering(1, 1, 1) == []
+
+
+def test_placement_index_update_sink():
+    """
+    Test placement index's update() method\n
+    This test targets the case, when a warship was sunk
+    """
+    index = PlacementIndex(3, [2, 1])
+    index.update((1, 1), (True, True, 1))
+    assert index.sizes() == [2]
+    assert index.covering(2, 1, 1) == []
+
+
+def test_placement_index_update_sink_same_size():
+    """
+    Test placement index's update() method\n
+    This test targets the case, when one of many warships
+    of the same size was sunk
+    """
+    index = PlacementIndex(3, [2, 2, 1])
+    assert index.count(2) == 2
+    index.update((0, 0), (True, False, 2))
+    index.update((0, 1), (True, True, 2), [(0, 0), (0, 1)])
+    assert index.sizes() == [2, 1]
+    assert index.count(2) == 1
+    assert index.covering(2, 0, 0) == []
+    assert index.covering(2, 0, 2) == [(0, 2, True)]
+    index.update((2, 2), (True, True, 2))
+    assert index.sizes() == [1]
+    assert index.count(2) == 0
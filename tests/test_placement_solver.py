@@ -0,0 +1,117 @@
+from utils.placement_solver import solve_fleet, FleetSolver
+from utils.placements import placement_blocks
+from utils.consts import FLEET_SOLVER_MAX_NODES, FLEET_SOLVER_FIRST_PASS_NODES
+from random import Random
+
+
+def blocks_of(fleet, placements):
+    """
+    Returns blocks of all warships placed by the solver
+    """
+    return [block for (x, y, vertical), size in zip(placements, fleet)
+            for block in placement_blocks(x, y, vertical, size)]
+
+
+def test_solve_fleet_std():
+    """
+    Test solve_fleet() function\n
+    This test targets the standard use case, warships should
+    neither overlap nor leave the board
+    """
+    fleet = [1, 2, 3, 2, 1, 4]
+    placements = solve_fleet(6, fleet, choose=Random(0).choice)
+    assert len(placements) == len(fleet)
+    blocks = blocks_of(fleet, placements)
+    assert len(set(blocks)) == sum(fleet)
+    assert all(0 <= x < 6 and 0 <= y < 6 for x, y in blocks)
+
+
+def test_solve_fleet_chosen():
+    """
+    Test solve_fleet() function\n
+    This test targets the case, when the first placement
+    is always chosen
+    """
+    assert solve_fleet(2, [2, 1], choose=lambda x: x[0]) == [
+        (0, 0, True), (0, 1, False)]
+
+
+def test_solve_fleet_occupied():
+    """
+    Test solve_fleet() function\n
+    This test targets the case, when some locations are already taken
+    """
+    rows = [0b011, 0b011, 0b011]
+    assert solve_fleet(3, [3], rows) == [(0, 2, True)]
+    assert solve_fleet(3, [3, 1], rows) is None
+    rows = [0b011, 0b000, 0b111]
+    placements = solve_fleet(3, [3, 1], rows, lambda x: x[0])
+    assert placements == [(1, 0, False), (0, 2, False)]
+
+
+def test_solve_fleet_tight():
+    """
+    Test solve_fleet() function\n
+    This test targets the case, when warships fill up the whole board
+    """
+    fleet = [4] * 8 + [2] * 2
+    blocks = blocks_of(fleet, solve_fleet(6, fleet))
+    assert len(set(blocks)) == 36
+
+
+def test_solve_fleet_impossible():
+    """
+    Test solve_fleet() function\n
+    This test targets the cases, when the fleet cannot be placed
+    """
+    assert solve_fleet(2, [2, 2, 1]) is None
+    assert solve_fleet(6, [4] * 9) is None
+    assert solve_fleet(10, [4] * 25) is None
+
+
+def test_solve_fleet_budget():
+    """
+    Test fleet solver's solve() method\n
+    This test targets the case, when the search runs out of its budget,
+    the fleet should be reported as exhausted instead of searched for ever
+    """
+    solver = FleetSolver(15, [6] * 37, choose=Random(0).choice)
+    assert solver.solve() is None
+    assert solver.exhausted
+    assert solver.nodes == FLEET_SOLVER_MAX_NODES
+    solver = FleetSolver(15, [6] * 37, max_nodes=50)
+    assert solver.solve() is None
+    assert solver.exhausted
+    assert solver.nodes == 50
+    solver = FleetSolver(6, [4] * 9)
+    assert solver.solve() is None
+    assert not solver.exhausted
+
+
+def test_solve_fleet_dense():
+    """
+    Test fleet solver's solve() method\n
+    This test targets dense fleets, that fit on the board but
+    take the search long to place, they should be packed instead
+    """
+    for size, fleet in ((26, [5] * 105), (26, [3] * 200), (15, [5] * 40),
+                        (26, [5] * 130)):
+        solver = FleetSolver(size, fleet, choose=Random(0).choice)
+        placements = solver.solve()
+        assert not solver.exhausted
+        assert solver.nodes <= FLEET_SOLVER_FIRST_PASS_NODES
+        blocks = blocks_of(fleet, placements)
+        assert len(set(blocks)) == sum(fleet)
+        assert all(0 <= x < size and 0 <= y < size for x, y in blocks)
+
+
+def test_solve_fleet_pack_occupied():
+    """
+    Test fleet solver's solve() method\n
+    This test targets packing warships around ones already placed,
+    the rest of them should go into columns
+    """
+    rows = [0b011, 0b011, 0b000]
+    solver = FleetSolver(3, [3, 2], rows, Random(0).choice, max_nodes=0)
+    assert solver.solve() == [(2, 0, False), (0, 2, True)]
+    assert not solver.exhausted
@@ -0,0 +1,49 @@
+from utils.placements import (placement_blocks, placement_table,
+                              table_blocks)
+from utils.consts import MAX_PLACEMENT_TABLE_BOARD_SIZE
+
+
+def test_placement_table_std():
+    """
+    Test placement_table() function\n
+    This test targets the standard use case
+    """
+    assert placement_table(3, 2, False) == (
+        ((0, 0), (0, 1)), ((0, 1), (0, 2)),
+        ((1, 0), (1, 1)), ((1, 1), (1, 2)),
+        ((2, 0), (2, 1)), ((2, 1), (2, 2)))
+    assert placement_table(3, 2, True) == (
+        ((0, 0), (1, 0)), ((0, 1), (1, 1)), ((0, 2), (1, 2)),
+        ((1, 0), (2, 0)), ((1, 1), (2, 1)), ((1, 2), (2, 2)))
+
+
+def test_placement_table_too_big():
+    """
+    Test placement_table() function\n
+    This test targets the case when the warship doesn't fit on the board
+    """
+    assert placement_table(2, 3, False) == ()
+    assert placement_table(2, 3, True) == ()
+
+
+def test_placement_table_shared():
+    """
+    Test placement_table() function\n
+    This test targets memoization, the same table should be returned
+    for the same board's and warship's size
+    """
+    assert placement_table(7, 3, True) is placement_table(7, 3, True)
+    assert placement_table(7, 3, True) is not placement_table(7, 3, False)
+
+
+def test_table_blocks_std():
+    """
+    Test table_blocks() function\n
+    This test targets the standard use case, blocks should match
+    placement_blocks() both with and without the memoized table
+    """
+    for board_size in (5, MAX_PLACEMENT_TABLE_BOARD_SIZE + 1):
+        for vertical in (True, False):
+            for x, y in ((0, 0), (1, 2), (2, 1)):
+                assert table_blocks(board_size, x, y, vertical, 3) == tuple(
+                    placement_blocks(x, y, vertical, 3))
@@ -1,7 +1,10 @@
 from classes.board import Board
 from classes.board import CoordinatesOutOfRangeError
 from classes.player import Player, Ai
-from classes.player import InvalidHitInputError
+from classes.player import InvalidHitInputError, InvalidPlacementInputError
+from classes.output_sink import BufferedSink
+from utils.player_io import pick_location
+from random import Random
 import pytest
 
 
@@ -71,6 +74,114 @@ def test_format_locations_std():
     assert player._format_locations(locations) == formatted_locations
 
 
+def test_player_parse_placement_std():
+    """
+    Test player's parse_placement() method\n
+    This test targets the standard use case
+    """
+    player = Player(Board(30, 2))
+    assert player.parse_placement("A0 H", 3) == [(0, 0), (1, 0), (2, 0)]
+    assert player.parse_placement("ab12 v", 2) == [(27, 12), (27, 13)]
+    assert player.parse_placement("C4", 1) == [(2, 4)]
+
+
+def test_player_parse_placement_invalid_input():
+    """
+    Test player's parse_placement() method\n
+    This test targets the case when passed input is incorrect
+    """
+    player = Player(Board(5, 2))
+    for placement_input in ("A0", "A0 X", "00 H", "A-1 H", "A0 H V", ""):
+        with pytest.raises(InvalidPlacementInputError):
+            player.parse_placement(placement_input, 2)
+
+
+def test_player_place_warships_typed(monkeypatch):
+    """
+    Test player's place_warships() method\n
+    This test targets the typed placement mode, invalid placements
+    should be entered again
+    """
+    inputs = iter(["A0 H", "XX", "GR0 H", "A0 V", "B1 V"])
+    monkeypatch.setattr("classes.player.sleep", lambda _: None)
+    monkeypatch.setattr("classes.player.clear", lambda: None)
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    monkeypatch.setattr("builtins.print", lambda *_: None)
+    player = Player(Board(200, fleet=[3, 2]))
+    player.place_warships("typed")
+    taken = [(0, 0), (1, 0), (2, 0), (1, 1), (1, 2)]
+    for x, y in taken:
+        assert not player.board._is_location_available(x, y)
+    assert player.board.count_available_locations_horizontal(1) == (
+        200 * 200 - len(taken))
+
+
+def test_player_place_warships_sink(monkeypatch, capsys):
+    """
+    Test player's place_warships() method\n
+    This test targets the case when the board has a sink, placement
+    messages should be written to it instead of being printed
+    """
+    inputs = iter(["A0 H", "XX", "A4 H"])
+    monkeypatch.setattr("classes.player.sleep", lambda _: None)
+    monkeypatch.setattr("classes.player.clear", lambda: None)
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    sink = BufferedSink()
+    player = Player(Board(5, fleet=[3, 2], sink=sink))
+    player.place_warships("typed")
+    messages = sink.drain()
+    assert len(messages) == 3
+    assert messages[1] == str(InvalidPlacementInputError())
+    assert messages[2] == player.board.print_board(True)
+    assert capsys.readouterr().out == ""
+
+
+def test_pick_location_sink(monkeypatch, capsys):
+    """
+    Test pick_location() function\n
+    This test targets entering the index on Windows, options and
+    messages should be written to the sink instead of being printed
+    """
+    inputs = iter(["5", "1"])
+    monkeypatch.setattr("utils.player_io.name", "nt")
+    monkeypatch.setattr("builtins.input", lambda _: next(inputs))
+    sink = BufferedSink()
+    assert pick_location([[(0, 0)], [(0, 1)]], 1, sink) == 1
+    assert sink.drain() == [
+        "Place your 1 mast warship\n", "  0: [(0, 0)]", "  1: [(0, 1)]",
+        "\n", "Invalid choice. Enter a number between 1 and 1\n"]
+    assert capsys.readouterr().out == ""
+
+
+def test_player_place_warships_cursor(monkeypatch):
+    """
+    Test player's place_warships() method\n
+    This test targets the cursor placement mode
+    """
+    def move(cursor):
+        cursor.move(1000, 1000)
+        return cursor.blocks()
+
+    monkeypatch.setattr("classes.player.sleep", lambda _: None)
+    monkeypatch.setattr("classes.player.clear", lambda: None)
+    monkeypatch.setattr("classes.player.cursor_location", move)
+    monkeypatch.setattr("builtins.print", lambda *_: None)
+    player = Player(Board(1000, fleet=[4]))
+    player.place_warships()
+    for x in range(996, 1000):
+        assert not player.board._is_location_available(x, 999)
+    assert player.board.warships() == "4 mast warship "
+
+
+def test_player_place_warships_invalid_mode():
+    """
+    Test player's place_warships() method\n
+    This test targets the case when passed mode is incorrect
+    """
+    with pytest.raises(ValueError):
+        Player(Board(2, 2)).place_warships("menu")
+
+
 def test_create_ai_player_std():
     """
     Test ai's constructor method\n
@@ -239,8 +350,10 @@ def test_ai_draw_coordinates_random_coors_some_hits_before(monkeypatch):
     hit_before = [(1, 0), (1, 1)]
     available = [hit for hit in all_coordinates if hit not in hit_before]
     assert available == [(0, 0), (0, 1)]
-    monkeypatch.setattr(ai, "remove_hit_before", lambda list: available)
-    assert ai.draw_coordinates() in available
+    for location in hit_before:
+        ai.record_hit(location, (False, False, 0))
+    for _ in range(10):
+        assert ai.draw_coordinates() in available
 
 
 def test_ai_draw_coordinates_chosen_coors(monkeypatch):
@@ -254,9 +367,10 @@ def test_ai_draw_coordinates_chosen_coors(monkeypatch):
     all_coordinates = [(0, 0), (0, 1), (1, 0), (1, 1)]
     hit_before = [(1, 0), (1, 1)]
     available = [hit for hit in all_coordinates if hit not in hit_before]
-    monkeypatch.setattr(ai, "remove_hit_before", lambda list: available)
+    for location in hit_before:
+        ai.record_hit(location, (False, False, 0))
     monkeypatch.setattr("classes.player.choice", lambda list: list[0])
-    assert ai.draw_coordinates() == (0, 0)
+    assert ai.draw_coordinates() == available[0]
 
 
 def test_ai_draw_coordinates_no_available(monkeypatch):
@@ -267,7 +381,8 @@ def test_ai_draw_coordinates_no_available(monkeypatch):
     """
     board = Board(2, 2)
     ai = Ai(board)
-    monkeypatch.setattr(ai, "remove_hit_before", lambda list: [])
+    for location in board.all_locations():
+        ai.record_hit(location, (False, False, 0))
     with pytest.raises(IndexError):
         ai.draw_coordinates()
 
@@ -568,3 +683,189 @@ def test_ai_set_next_hit_sink_and_draw_coordinates(monkeypatch):
     ai.set_next_hit(hit_result)
     hit = ai.smart_hit()
     assert hit in [(0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def test_create_ai_invalid_targeting():
+    """
+    Test ai's constructor method\n
+    This test targets the case, when the targeting mode is invalid
+    """
+    with pytest.raises(ValueError):
+        Ai(Board(2, 2), targeting="unknown")
+
+
+def test_ai_heatmap_targeting_sinks_all():
+    """
+    Test ai's smart_hit() and set_next_hit() methods\n
+    This test targets the heatmap targeting mode,
+    every hit should be made at a different location
+    """
+    board_ai = Board(4, 4)
+    board_player = Board(4, 4)
+    ai = Ai(board_ai, targeting="heatmap")
+    assert ai.targeting == "heatmap"
+    board_player.draw_locations()
+    hits = set()
+    while not board_player.all_sunk():
+        hit = ai.smart_hit()
+        assert hit not in hits
+        hits.add(hit)
+        ai.set_next_hit(board_player.hit(hit))
+    assert len(hits) <= 16
+
+
+def test_ai_monte_carlo_targeting_sinks_all():
+    """
+    Test ai's smart_hit() and set_next_hit() methods\n
+    This test targets the Monte Carlo targeting mode,
+    every hit should be made at a different location
+    """
+    random = Random(4)
+    board_ai = Board(6, 5)
+    board_player = Board(6, 5, random)
+    ai = Ai(board_ai, random, targeting="monte_carlo")
+    assert ai.targeting == "monte_carlo"
+    board_player.draw_locations()
+    hits = set()
+    while not board_player.all_sunk():
+        hit = ai.smart_hit()
+        assert hit not in hits
+        hits.add(hit)
+        ai.set_next_hit(board_player.hit(hit))
+    assert len(hits) < 36
+
+
+def test_ai_monte_carlo_targeting_fallback(monkeypatch):
+    """
+    Test ai's smart_hit() method\n
+    This test targets the Monte Carlo targeting mode,
+    when no fleet is sampled the hit is chosen as with the random targeting
+    """
+    ai = Ai(Board(3, 3), Random(0), targeting="monte_carlo")
+    monkeypatch.setattr(ai, "_sampled_hit", lambda: None)
+    hit = ai.smart_hit()
+    assert hit in Board(3, 3).all_locations()
+
+
+def test_ai_open_cells_match_possible_locations():
+    """
+    Test ai's open_cells() method\n
+    This test targets the case of a whole game, open candidate
+    locations should always match all possible locations
+    of warships that haven't been sunk yet
+    """
+    board_ai = Board(6, 5)
+    board_player = Board(6, 5)
+    ai = Ai(board_ai)
+    board_player.draw_locations()
+    while not board_player.all_sunk():
+        expected = set(ai.get_all_possible_locations())
+        assert set(ai.open_cells()) == expected
+        hit = ai.smart_hit()
+        ai.set_next_hit(board_player.resolve_hit(hit))
+    assert ai.open_cells() == []
+
+
+def test_player_hit_multi_letter_column():
+    """
+    Test player's hit() method\n
+    This test targets the case when the column's label
+    is made of more than one letter
+    """
+    board = Board(1000, 1)
+    player = Player(board)
+    assert player.hit("Z9") == (25, 9)
+    assert player.hit("aa10") == (26, 10)
+    assert player.hit("ALL999") == (999, 999)
+    assert player._format_locations([[(26, 0), (27, 0)]]) == [["AA0", "AB0"]]
+    with pytest.raises(InvalidHitInputError):
+        player.hit("10")
+    with pytest.raises(InvalidHitInputError):
+        player.hit("A1B")
+
+
+def test_create_player_fleet():
+    """
+    Test player's constructor method\n
+    This test targets the case, when the fleet is configured
+    """
+    player = Player(Board(4, fleet=[1, 2, 1, 3]))
+    assert player.warship_types == {3: 1, 2: 1, 1: 2}
+
+
+def test_ai_sinks_fleet_of_same_sizes():
+    """
+    Test ai's smart_hit() and set_next_hit() methods\n
+    This test targets the case, when there are many warships
+    of the same size, every hit should be made at a different location
+    """
+    fleet = [3, 2, 2, 2, 1, 1, 1]
+    for targeting in ("random", "heatmap"):
+        for seed in range(10):
+            random = Random(seed)
+            board_player = Board(6, fleet=fleet, random=random)
+            board_player.draw_locations()
+            ai = Ai(Board(6, fleet=fleet), random, targeting)
+            hits = set()
+            while not board_player.all_sunk():
+                hit = ai.smart_hit()
+                assert hit not in hits
+                hits.add(hit)
+                ai.set_next_hit(board_player.resolve_hit(hit))
+
+
+def test_ai_iter_and_count_possible_locations():
+    """
+    Test ai's iter_possible_locations_*() and
+    count_possible_locations_*() methods\n
+    This test targets the standard use case, they should match
+    the lists of possible locations
+    """
+    ai = Ai(Board(4, 4))
+    for size in range(1, 6):
+        horizontal = ai.get_possible_locations_horizontal(size)
+        vertical = ai.get_possible_locations_vertical(size)
+        assert list(ai.iter_possible_locations_horizontal(size)) == horizontal
+        assert list(ai.iter_possible_locations_vertical(size)) == vertical
+        assert ai.count_possible_locations_horizontal(size) == len(horizontal)
+        assert ai.count_possible_locations_vertical(size) == len(vertical)
+
+
+def test_ai_possible_locations_large_board():
+    """
+    Test ai's get_possible_locations_*() methods\n
+    This test targets boards too large for the memoized placement tables,
+    locations should be built the same way
+    """
+    ai = Ai(Board(70, 5))
+    horizontal = ai.get_possible_locations_horizontal(5)
+    vertical = ai.get_possible_locations_vertical(5)
+    assert len(horizontal) == ai.count_possible_locations_horizontal(5)
+    assert horizontal[1] == [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5)]
+    assert vertical[1] == [(0, 1), (1, 1), (2, 1), (3, 1), (4, 1)]
+    small = Ai(Board(10, 5))
+    assert small.get_possible_locations_horizontal(5)[1] == horizontal[1]
+    assert small.get_possible_locations_vertical(5)[1] == vertical[1]
+
+
+def test_ai_record_hit_std():
+    """
+    Test ai's record_hit() method\n
+    This test targets the standard use case, recorded hits should leave
+    the ai in the same state as hits made with smart_hit()
+    """
+    random = Random(5)
+    board = Board(8, fleet=[4, 3, 2, 2], random=random)
+    board.draw_locations()
+    replayed_board = Board(8, fleet=[4, 3, 2, 2])
+    for warship in board.placed_warships():
+        replayed_board.add_warship(warship.blocks)
+    ai = Ai(Board(8, fleet=[4, 3, 2, 2]), random)
+    replayed = Ai(Board(8, fleet=[4, 3, 2, 2]), random)
+    for _ in range(25):
+        location = ai.smart_hit()
+        ai.set_next_hit(board.resolve_hit(location))
+        replayed.record_hit(location, replayed_board.resolve_hit(location))
+        assert replayed.open_cells() == ai.open_cells()
+    assert ai.get_all_possible_locations() == (
+        replayed.get_all_possible_locations())
@@ -0,0 +1,80 @@
+from classes.profiler import Profiler, NullProfiler, PhaseStats
+import pytest
+
+
+def test_profiler_measure_std():
+    """
+    Test profiler's measure() method\n
+    This test targets the standard use case
+    """
+    profiler = Profiler()
+    for _ in range(3):
+        with profiler.measure("hit"):
+            pass
+    with profiler.measure("render"):
+        pass
+    report = profiler.report()
+    assert list(report) == ["hit", "render"]
+    assert report["hit"].calls == 3
+    assert report["render"].calls == 1
+    assert report["hit"].seconds >= 0
+
+
+def test_profiler_measure_error():
+    """
+    Test profiler's measure() method\n
+    This test targets the case when the measured call raises an exception
+    """
+    profiler = Profiler()
+    with pytest.raises(ValueError):
+        with profiler.measure("parse"):
+            raise ValueError()
+    assert profiler.report()["parse"].calls == 1
+
+
+def test_profiler_record_std():
+    """
+    Test profiler's record() and report() methods\n
+    This test targets the standard use case
+    """
+    profiler = Profiler()
+    profiler.record("smart_hit", 0.5)
+    profiler.record("smart_hit", 1.5)
+    stats = profiler.report()["smart_hit"]
+    assert stats == PhaseStats(2, 2.0)
+    assert stats.mean == 1.0
+
+
+def test_profiler_reset_std():
+    """
+    Test profiler's reset() method\n
+    This test targets the standard use case
+    """
+    profiler = Profiler()
+    profiler.record("hit", 1.0)
+    profiler.reset()
+    assert profiler.report() == {}
+
+
+def test_profiler_format_report_std():
+    """
+    Test profiler's format_report() method\n
+    This test targets the standard use case
+    """
+    profiler = Profiler()
+    profiler.record("hit", 0.002)
+    lines = profiler.format_report().splitlines()
+    assert len(lines) == 2
+    assert lines[1].split() == ["hit", "1", "2.000", "2000.00"]
+
+
+def test_null_profiler_std():
+    """
+    Test null profiler's measure() and record() methods\n
+    This test targets the case when nothing is measured
+    """
+    profiler = NullProfiler()
+    with profiler.measure("hit"):
+        pass
+    profiler.record("hit", 1.0)
+    assert profiler.report() == {}
@@ -0,0 +1,49 @@
+from classes.simulation import Simulation, SimulationResult, simulate_game
+import pytest
+
+
+def test_create_simulation_std():
+    """
+    Test simulation's constructor method\n
+    This test targets the standard use case
+    """
+    simulation = Simulation(4)
+    assert simulation.board_size == 4
+    for ai in simulation.ais:
+        assert ai.board.warships() == (
+            "4 mast warship 3 mast warship 2 mast warship 1 mast warship ")
+
+
+def test_create_simulation_invalid():
+    """
+    Test simulation's constructor method\n
+    This test targets the incorrect use case
+    """
+    with pytest.raises(ValueError):
+        Simulation(1)
+
+
+def test_simulation_run_std(capsys):
+    """
+    Test simulation's run() method\n
+    This test targets the standard use case,
+    nothing should be printed out
+    """
+    simulation = Simulation(5)
+    result = simulation.run()
+    assert isinstance(result, SimulationResult)
+    assert result.winner in (0, 1)
+    assert simulation.ais[1 - result.winner].board.all_sunk()
+    assert not simulation.ais[result.winner].board.all_sunk()
+    assert result.shots[0] == result.turns
+    assert result.shots[1] == result.turns - 1 + result.winner
+    assert capsys.readouterr().out == ""
+
+
+def test_simulate_game_smallest_board():
+    """
+    Test simulate_game() function\n
+    This test targets the case of the smallest board
+    """
+    result = simulate_game(2)
+    assert 3 <= result.shots[result.winner] <= 4
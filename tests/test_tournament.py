@@ -0,0 +1,108 @@
+from classes.simulation import SimulationResult
+from classes.tournament import (TournamentStats, derive_seed, shard_sizes,
+                                play_shard, run_tournament)
+from utils.consts import TOURNAMENT_SHARD_GAMES
+import pytest
+
+
+def test_tournament_stats_add_std():
+    """
+    Test tournament stats' add() method\n
+    This test targets the standard use case
+    """
+    stats = TournamentStats()
+    stats.add(SimulationResult(0, 5, (5, 4)))
+    stats.add(SimulationResult(1, 7, (7, 7)))
+    assert stats.games == 2
+    assert stats.wins == [1, 1]
+    assert stats.turns == 12
+    assert stats.shots == [12, 11]
+    assert stats.winning_shots == 12
+    assert stats.average_turns() == 6
+    assert stats.average_shots(1) == 5.5
+
+
+def test_tournament_stats_merge_std():
+    """
+    Test tournament stats' merge() method\n
+    This test targets the standard use case
+    """
+    stats = TournamentStats()
+    other = TournamentStats()
+    stats.add(SimulationResult(0, 5, (5, 4)))
+    other.add(SimulationResult(1, 7, (7, 7)))
+    stats.merge(other)
+    assert stats.games == 2
+    assert stats.wins == [1, 1]
+    assert stats.shots == [12, 11]
+    assert TournamentStats().average_turns() == 0
+
+
+def test_derive_seed_std():
+    """
+    Test derive_seed() function\n
+    This test targets the standard use case
+    """
+    assert derive_seed(1, 0) == derive_seed(1, 0)
+    assert derive_seed(1, 0) != derive_seed(1, 1)
+    assert derive_seed(1, 0) != derive_seed(2, 0)
+
+
+def test_shard_sizes_std():
+    """
+    Test shard_sizes() function\n
+    This test targets the standard use case
+    """
+    assert shard_sizes(10, 3) == [4, 3, 3]
+    assert shard_sizes(2, 4) == [1, 1, 0, 0]
+
+
+def test_play_shard_reproducible():
+    """
+    Test play_shard() function\n
+    This test targets the case, when the same seed is used twice
+    """
+    stats = play_shard(3, 5, 42)
+    stats_again = play_shard(3, 5, 42)
+    assert stats.games == 5
+    assert stats.wins == stats_again.wins
+    assert stats.shots == stats_again.shots
+
+
+def test_run_tournament_workers_independent():
+    """
+    Test run_tournament() function\n
+    This test targets the case, when the same tournament
+    is played with a different number of workers
+    """
+    stats = run_tournament(3, 8, seed=7, workers=1, shards=2)
+    stats_pool = run_tournament(3, 8, seed=7, workers=2, shards=2)
+    assert stats.games == stats_pool.games == 8
+    assert stats.wins == stats_pool.wins
+    assert stats.shots == stats_pool.shots
+
+
+def test_run_tournament_default_shards():
+    """
+    Test run_tournament() function\n
+    This test targets the default number of shards, derived from
+    the number of games, results shouldn't depend on the number of workers
+    """
+    games = 2 * TOURNAMENT_SHARD_GAMES + 3
+    stats = run_tournament(3, games, seed=7, workers=1)
+    stats_pool = run_tournament(3, games, seed=7, workers=3)
+    stats_shards = run_tournament(3, games, seed=7, workers=1, shards=3)
+    assert stats.games == stats_pool.games == games
+    assert stats.wins == stats_pool.wins == stats_shards.wins
+    assert stats.shots == stats_pool.shots == stats_shards.shots
+
+
+def test_run_tournament_invalid():
+    """
+    Test run_tournament() function\n
+    This test targets the incorrect use cases
+    """
+    with pytest.raises(ValueError):
+        run_tournament(1, 8, workers=1)
+    with pytest.raises(ValueError):
+        run_tournament(3, -1, workers=1)
@@ -96,3 +96,47 @@ def test_warship_hit_sink():
     assert warship.was_hit((0, 2))
     assert warship.hits == 3
     assert warship.was_sunk() is True
+
+
+def test_create_warship_compact():
+    """
+    Test warships's constructor method\n
+    This test targets the case of a straight warship, which is
+    stored as its first block and direction only
+    """
+    warship = Warship([(3, 1), (2, 1), (1, 1)])
+    assert warship.origin == (3, 1)
+    assert warship.direction == (-1, 0)
+    assert warship.blocks == [(3, 1), (2, 1), (1, 1)]
+    assert not hasattr(warship, "__dict__")
+    with pytest.raises(AttributeError):
+        warship.color = "grey"
+
+
+def test_warship_hit_not_straight():
+    """
+    Test warships's hit() method\n
+    This test targets the case of a warship, that isn't straight
+    """
+    blocks = [(0, 0), (0, 1), (1, 1)]
+    warship = Warship(blocks)
+    assert warship.direction is None
+    assert warship.blocks == blocks
+    assert not warship.was_hit((1, 0))
+    assert warship.was_hit((1, 1))
+    assert warship.hit_mask == 0b100
+    assert warship.was_hit((0, 0))
+    assert warship.was_hit((0, 1))
+    assert warship.was_sunk()
+
+
+def test_warship_block_index():
+    """
+    Test warships's block_index() method\n
+    This test targets the standard use case
+    """
+    warship = Warship([(2, 0), (2, 1), (2, 2)])
+    assert warship.block_index((2, 2)) == 2
+    assert warship.block_index((2, 3)) is None
+    assert warship.block_index((1, 1)) is None
+    assert warship.block_index((3, 0)) is None
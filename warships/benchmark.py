@@ -0,0 +1,68 @@
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from utils.benchmarks import (BENCHMARKS, run_benchmarks, time_calibration,
+                              relative_to, find_regressions, load_baseline,
+                              save_baseline)
+from utils.consts import BENCHMARK_MIN_TIME
+
+
+BASELINE_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / (
+    "baseline.json")
+
+
+def main() -> None:
+    """
+    Runs benchmarks of the engine's hot paths, compares them with
+    the stored baseline and exits with status 1 if any of them
+    is slower than the baseline by more than the threshold.\n
+    Times are compared as multiples of the calibration benchmark
+    measured in the same session, so a baseline recorded on one machine
+    can be checked on another one.
+    """
+    parser = ArgumentParser(description="Warships engine benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[2, 10, 26, 100], help="boards' sizes")
+    parser.add_argument("--names", nargs="+", default=None,
+                        choices=list(BENCHMARKS), help="benchmarks to run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="measurements of every benchmark")
+    parser.add_argument("--min-time", type=float, default=BENCHMARK_MIN_TIME,
+                        help="minimum duration of a measurement in seconds")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH),
+                        help="path of the baseline file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown e.g. 0.25 for 25%%")
+    parser.add_argument("--save", action="store_true",
+                        help="store the results as the new baseline")
+    args = parser.parse_args()
+    calibration = time_calibration(args.repeat, min_time=args.min_time)
+    results = run_benchmarks(args.sizes, args.names, args.repeat,
+                             args.min_time)
+    relative = relative_to(results, calibration)
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        baseline = {}
+    regressions = find_regressions(relative, baseline, args.threshold)
+    print(f"{'calibration':<36} {calibration * 1e6:>12.3f} us")
+    for key, elapsed in results.items():
+        line = (f"{key:<36} {elapsed * 1e6:>12.2f} us"
+                f" {relative[key]:>12.1f} x")
+        if key in baseline:
+            change = relative[key] / baseline[key] - 1
+            line += f" {baseline[key]:>12.1f} x {change:>+8.1%}"
+        if key in regressions:
+            line += "  REGRESSION"
+        print(line)
+    if args.save:
+        baseline.update(relative)
+        save_baseline(args.baseline, baseline)
+        print(f"Baseline saved to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
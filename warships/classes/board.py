@@ -1,8 +1,15 @@
 from .warship import Warship
-from utils.board_io import (print_board_io,
-                            print_warships_io, print_hit_warships_io)
-from random import choice
-from utils.consts import MAX_NUM_OF_WARSHIPS, MAX_BOARD_SIZE
+from .output_sink import OutputSink, NullSink
+from utils.board_io import (format_warships_io, format_hit_warships_io,
+                            BoardRenderer, WARSHIP, MISS, HIT)
+from random import choice, Random
+from utils.bitboard import (run_mask, locations_masks,
+                            window_starts, iter_bits, start_masks)
+from utils.placements import (placement_blocks, table_available,
+                              table_blocks, PlacementSequence)
+from utils.placement_solver import FleetSolver
+from utils.fleet import default_fleet
+from utils.consts import MAX_BOARD_SIZE
 
 
 class InvalidWarshipCountError(Exception):
@@ -19,6 +26,21 @@ class InvalidWarshipCountError(Exception):
         self.value = value
 
 
+class FleetPlacementNotFoundError(Exception):
+    """
+    FleetPlacementNotFoundError Exception.\n
+    Raised when the placement solver runs out of its budget before
+    finding locations of the fleet, which may still fit on the board
+
+    :param value: number of warships of the fleet
+    :type value: int
+    """
+
+    def __init__(self, value: int) -> None:
+        super().__init__("Cannot find locations of that many warships")
+        self.value = value
+
+
 class InvalidWarshipError(Exception):
     """
     InvalidWarshipError Exception.\n
@@ -47,6 +69,22 @@ class CoordinatesOutOfRangeError(Exception):
         self.cordinates = coordinates
 
 
+class NoAvailableLocationError(Exception):
+    """
+    NoAvailableLocationError Exception.\n
+    Raised when there is no place left on the board
+    for a warship of a specified size
+
+    :param warship_size: size of the warship
+    :type warship_size: int
+    """
+
+    def __init__(self, warship_size: int) -> None:
+        super().__init__(
+            f"No available location for a warship of size {warship_size}")
+        self.warship_size = warship_size
+
+
 class Board():
     """
     Board class. Contains attributes:
@@ -54,44 +92,122 @@ class Board():
     :param size: number of either rows/columns
     :type size: int
 
-    :param num_warships: number of warships situated on the board, <= size
+    :param num_warships: number of warships situated on the board,
+    <= size unless the fleet is configured
     :type num_warships: int
 
+    :param fleet: sizes of all warships situated on the board,
+    ordered from the biggest one
+    :type fleet: tuple[int]
+
     :param warships: warship objects situated on the board
     :type warships: list[Warship]
 
-    :param hit: list of hit locations
-    :type hit: list[tuple[int, int]]
+    :param hit: set of hit locations, indexed by x * size + y
+    :type hit: set[int]
+
+    :param ship_ids: indexes of warships assigned to the locations
+    of their blocks, indexed by x * size + y
+    :type ship_ids: dict[int, int]
+
+    :param remaining: number of blocks not hit yet of every warship
+    :type remaining: list[int]
+
+    :param afloat: number of warships of every size,
+    that haven't been sunk yet
+    :type afloat: dict[int, int]
+
+    :param afloat_total: number of warships, that haven't been sunk yet
+    :type afloat_total: int
+
+    :param warships_str: cached string representation of the warships
+    afloat, None if it has to be built again
+    :type warships_str: str
+
+    :param rows: occupancy bitboard, bit y of rows[x] is set
+    if (x, y) is taken by a warship
+    :type rows: list[int]
+
+    :param columns: transposed occupancy bitboard, bit x of columns[y]
+    is set if (x, y) is taken by a warship
+    :type columns: list[int]
+
+    :param random: random number generator used for drawing locations,
+    None if the global one is used
+    :type random: Random
+
+    :param renderer: incremental renderer of the board
+    :type renderer: BoardRenderer
+
+    :param sink: sink of messages presented by the board
+    :type sink: OutputSink
     """
 
-    def __init__(self, size: int, num_warships: int) -> None:
+    def __init__(self, size: int, num_warships: int = None,
+                 random: Random = None, fleet: list[int] = None,
+                 sink: OutputSink = None) -> None:
         """
         Creates an instance of the board class.\n
         Raises ValueError if size is less/equal 1.\n
         Raises ValueError if size is greater than MAX_BOARD_SIZE.\n
         Raises InvalidWarshipCountError if number of warships is less/equal 0\n
         Raises InvalidWarshipCountError if number of warships is greater
-        than size.\n
-        Initially 'warships' and 'hit' lists are empty.
+        than size and the fleet isn't configured.\n
+        Raises InvalidWarshipCountError if the configured fleet doesn't
+        match the number of warships, any of its warships doesn't fit
+        on the board or they need more locations than the board has.\n
+        Initially 'warships' list and 'hit' set are empty
+        and the occupancy bitboards are clear.
 
         :param size: board's size
         :type size: int
 
-        :param num_warships: number of warships on the board
+        :param num_warships: number of warships on the board,
+        defaults to None (the fleet's size)
         :type num_warships: int
+
+        :param random: random number generator, defaults to None
+        (the global one)
+        :type random: Random
+
+        :param fleet: sizes of all warships on the board, defaults to None
+        (num_warships warships of sizes given by default_fleet())
+        :type fleet: list[int]
+
+        :param sink: sink of messages presented by the board,
+        defaults to None (NullSink, messages are discarded)
+        :type sink: OutputSink
         """
         if size <= 1 or size > MAX_BOARD_SIZE:
             raise ValueError(size)
         else:
             self.__size = size
-        if (num_warships <= 0):
-            raise InvalidWarshipCountError(num_warships)
-        elif num_warships > self.__size:
+        if fleet is None:
+            if num_warships is None or num_warships <= 0:
+                raise InvalidWarshipCountError(num_warships)
+            elif num_warships > self.__size:
+                raise InvalidWarshipCountError(num_warships)
+            fleet = default_fleet(self.__size, num_warships)
+        elif not fleet or num_warships not in (None, len(fleet)):
             raise InvalidWarshipCountError(num_warships)
-        else:
-            self.__num_warships = num_warships
+        elif (any(warship_size <= 0 or warship_size > self.__size
+                  for warship_size in fleet)
+              or sum(fleet) > self.__size * self.__size):
+            raise InvalidWarshipCountError(len(fleet))
+        self.__fleet = tuple(sorted(fleet, reverse=True))
+        self.__num_warships = len(self.__fleet)
         self.__warships = []
-        self.__hit = []
+        self.__hit = set()
+        self.__ship_ids = {}
+        self.__remaining = []
+        self.__afloat = {}
+        self.__afloat_total = 0
+        self.__warships_str = ""
+        self.__rows = [0] * self.__size
+        self.__columns = [0] * self.__size
+        self.__random = random
+        self.__renderer = BoardRenderer(self.__size)
+        self.__sink = sink or NullSink()
 
     @property
     def size(self) -> int:
@@ -101,6 +217,30 @@ class Board():
     def num_warships(self) -> int:
         return self.__num_warships
 
+    @property
+    def fleet(self) -> tuple[int]:
+        return self.__fleet
+
+    @property
+    def random(self) -> Random:
+        return self.__random
+
+    @property
+    def sink(self) -> OutputSink:
+        return self.__sink
+
+    def _choice(self, sequence):
+        """
+        Returns a random element of a non-empty sequence, drawn with
+        the board's random number generator if it has one
+
+        :param sequence: sequence to choose from
+        :type sequence: Sequence
+        """
+        if self.__random is None:
+            return choice(sequence)
+        return self.__random.choice(sequence)
+
     def all_locations(self) -> list[tuple[int, int]]:
         """
         Returns a list of all possible coordinates on the board e.g. (x,y)
@@ -121,6 +261,13 @@ class Board():
             warships_str += f"{str(warship)} "
         return warships_str
 
+    def placed_warships(self) -> list[Warship]:
+        """
+        Returns all warships on the board in the order
+        they were added
+        """
+        return list(self.__warships)
+
     def evaluate_warship(self, warship_to_add: Warship) -> None:
         """
         Checks if a warship can be added to the board.\n
@@ -136,8 +283,22 @@ class Board():
         for x, y in warship_to_add.blocks:
             if x >= self.__size or y >= self.__size:
                 raise InvalidWarshipError(warship_to_add)
-            if not self._is_location_available(x, y):
-                raise InvalidWarshipError(warship_to_add)
+        if self._overlaps(locations_masks(warship_to_add.blocks)):
+            raise InvalidWarshipError(warship_to_add)
+
+    def _overlaps(self, masks: dict[int, int]) -> bool:
+        """
+        Checks if any of the locations described by the masks
+        is already taken by a warship
+
+        :param masks: occupancy masks split into rows
+        :type masks: dict[int, int]
+        """
+        rows = self.__rows
+        for x, mask in masks.items():
+            if rows[x] & mask:
+                return True
+        return False
 
     def _is_location_available(self, x: int, y: int) -> bool:
         """
@@ -150,11 +311,80 @@ class Board():
         :param y: vertical axis coordinate
         :type y: int
         """
-        for warship in self.__warships:
-            for x_warship, y_warship in warship.blocks:
-                if x == x_warship and y == y_warship:
-                    return False
-        return True
+        if not (0 <= x < self.__size and 0 <= y < self.__size):
+            return True
+        return not (self.__rows[x] >> y) & 1
+
+    def _is_placement_available(self, x: int, y: int,
+                                warship_size: int, vertical: bool) -> bool:
+        """
+        Checks if a straight warship starting at (x, y) fits on the board
+        and doesn't overlap any other warship
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param y: vertical axis coordinate of the first block
+        :type y: int
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+        """
+        if x < 0 or y < 0:
+            return False
+        if vertical:
+            if x + warship_size > self.__size or y >= self.__size:
+                return False
+            return not self.__columns[y] & run_mask(warship_size, x)
+        if y + warship_size > self.__size or x >= self.__size:
+            return False
+        return not self.__rows[x] & run_mask(warship_size, y)
+
+    def is_placement_available(self, x: int, y: int,
+                               warship_size: int, vertical: bool) -> bool:
+        """
+        Checks if a straight warship starting at (x, y) can be added
+        to the board, in constant time
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param y: vertical axis coordinate of the first block
+        :type y: int
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+        """
+        return self._is_placement_available(x, y, warship_size, vertical)
+
+    def _blocks(self, x: int, y: int, vertical: bool,
+                warship_size: int) -> list[tuple[int, int]]:
+        """
+        Returns blocks of a straight warship starting at (x, y),
+        copied from the memoized placement table on small boards
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param y: vertical axis coordinate of the first block
+        :type y: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        if table_available(self.__size):
+            return list(table_blocks(self.__size, x, y, vertical,
+                                     warship_size))
+        return placement_blocks(x, y, vertical, warship_size)
 
     def get_available_locations_horizontal(self,
                                            warship_size: int) -> list[list[tuple[int, int]]]:
@@ -165,16 +395,8 @@ class Board():
         :param warship_size: size of a warship
         :type warship_size: int
         """
-        locations = []
-        for x in range(self.__size):
-            for y in range(self.__size - warship_size + 1):
-                locations_inner = []
-                for size in range(warship_size):
-                    if self._is_location_available(x, y+size):
-                        locations_inner.append((x, y+size))
-                if (len(locations_inner) == warship_size):
-                    locations.append(locations_inner)
-        return locations
+        return [self._blocks(x, y, False, warship_size)
+                for x, y in self._placement_starts(warship_size, False)]
 
     def get_available_locations_vertical(self,
                                          warship_size: int) -> list[list[tuple[int, int]]]:
@@ -185,48 +407,160 @@ class Board():
         :param warship_size: size of a warship
         :type warship_size: int
         """
-        locations = []
+        return [self._blocks(x, y, True, warship_size)
+                for x, y in self._placement_starts(warship_size, True)]
+
+    def iter_available_locations_horizontal(self, warship_size: int):
+        """
+        Yields all possible horizontal locations for warships
+        of a specified size, in the same order as
+        get_available_locations_horizontal() returns them
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        for x, row in enumerate(self.__rows):
+            for y in iter_bits(window_starts(row, warship_size, self.__size)):
+                yield self._blocks(x, y, False, warship_size)
+
+    def iter_available_locations_vertical(self, warship_size: int):
+        """
+        Yields all possible vertical locations for warships
+        of a specified size, in the same order as
+        get_available_locations_vertical() returns them
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
         for x in range(self.__size - warship_size + 1):
-            for y in range(self.__size):
-                locations_inner = []
-                for size in range(warship_size):
-                    if self._is_location_available(x+size, y):
-                        locations_inner.append((x+size, y))
-                if (len(locations_inner) == warship_size):
-                    locations.append(locations_inner)
-        return locations
+            for y in iter_bits(self._vertical_starts(x, warship_size)):
+                yield self._blocks(x, y, True, warship_size)
+
+    def count_available_locations_horizontal(self, warship_size: int) -> int:
+        """
+        Returns the number of all possible horizontal locations
+        for warships of a specified size, without building them
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return sum(window_starts(row, warship_size, self.__size).bit_count()
+                   for row in self.__rows)
+
+    def count_available_locations_vertical(self, warship_size: int) -> int:
+        """
+        Returns the number of all possible vertical locations
+        for warships of a specified size, without building them
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return sum(self._vertical_starts(x, warship_size).bit_count()
+                   for x in range(self.__size - warship_size + 1))
+
+    def _placement_starts(self, warship_size: int,
+                          vertical: bool) -> list[tuple[int, int]]:
+        """
+        Returns coordinates of the first blocks of all available
+        placements of a specified size and orientation,
+        ordered by x and then y
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+        """
+        starts = []
+        if vertical:
+            for x in range(self.__size - warship_size + 1):
+                for y in iter_bits(self._vertical_starts(x, warship_size)):
+                    starts.append((x, y))
+        else:
+            for x in range(self.__size):
+                for y in iter_bits(window_starts(
+                        self.__rows[x], warship_size, self.__size)):
+                    starts.append((x, y))
+        return starts
+
+    def placements(self, warship_size: int):
+        """
+        Returns all available placements of a specified size
+        in a compact form of tuples (x, y, vertical),
+        where (x, y) is the first block of a warship.\n
+        Vertical placements go first.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return [(x, y, vertical) for vertical in (True, False)
+                for x, y in self._placement_starts(warship_size, vertical)]
+
+    def placement_sequence(self, warship_size: int) -> PlacementSequence:
+        """
+        Returns all available placements of a specified size
+        as a lazy sequence of rows (x, y, vertical), ordered
+        the same way as placements().\n
+        Only one mask per row is computed, placements themselves
+        are located on access.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return PlacementSequence(*start_masks(
+            self.__rows, warship_size, self.__size))
+
+    def _vertical_starts(self, x: int, warship_size: int) -> int:
+        """
+        Returns a mask of columns y, for which a vertical warship
+        of a specified size can start at (x, y)
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        taken = 0
+        for row in self.__rows[x:x+warship_size]:
+            taken |= row
+        return ~taken & run_mask(self.__size)
 
     def draw_location(self, warship_size: int) -> list[tuple[int, int]]:
         """
         Randomly chooses one of all possible locations
-        for a warship of a specified size
+        for a warship of a specified size.\n
+        Raises NoAvailableLocationError if the warship doesn't fit
+        anywhere on the board.
 
         :param warship_size: size of a warship
         :type warship_size: int
         """
-        available_locations_h = self.get_available_locations_horizontal(
-            warship_size)
-        available_locations_v = self.get_available_locations_vertical(
-            warship_size)
-        available_locations = available_locations_v + available_locations_h
-        return choice(available_locations)
+        placements = self.placement_sequence(warship_size)
+        if not placements:
+            raise NoAvailableLocationError(warship_size)
+        x, y, vertical = self._choice(placements)
+        return placement_blocks(x, y, vertical, warship_size)
 
     def draw_locations(self) -> None:
         """
-        Randomly chooses locations for all warships
-        to be added to the board
-        """
-        warships_sizes = [size for size in range(
-            self.__size if self.__size < MAX_NUM_OF_WARSHIPS
-            else MAX_NUM_OF_WARSHIPS, 0, -1)]
-        warships_to_add = self.__num_warships
-        warships_added = 0
-        while warships_added < warships_to_add:
-            to_add = warships_sizes[warships_added]
-            drawed_locations = self.draw_location(
-                to_add)
-            self.add_warship(drawed_locations)
-            warships_added += 1
+        Randomly chooses locations for all warships of the fleet
+        to be added to the board.\n
+        Locations are found all at once by the placement solver,
+        so a dense fleet cannot get stuck halfway.\n
+        Raises InvalidWarshipCountError if the fleet cannot be placed.\n
+        Raises FleetPlacementNotFoundError if the solver runs out of
+        its budget before finding locations of the fleet.
+        """
+        solver = FleetSolver(self.__size, self.__fleet, self.__rows,
+                             self._choice)
+        placements = solver.solve()
+        if placements is None and solver.exhausted:
+            raise FleetPlacementNotFoundError(self.__num_warships)
+        if placements is None:
+            raise InvalidWarshipCountError(self.__num_warships)
+        for (x, y, vertical), warship_size in zip(placements, self.__fleet):
+            self.add_warship(placement_blocks(x, y, vertical, warship_size))
 
     def add_warship(self, locations: list[tuple[int, int]]) -> None:
         """
@@ -237,19 +571,37 @@ class Board():
         """
         warship_to_add = Warship(locations)
         self.evaluate_warship(warship_to_add)
+        ship_id = len(self.__warships)
         self.__warships.append(
             warship_to_add
         )
+        blocks = warship_to_add.blocks
+        for x, mask in locations_masks(blocks).items():
+            self.__rows[x] |= mask
+        for x, y in blocks:
+            self.__columns[y] |= 1 << x
+        for x, y in blocks:
+            self.__ship_ids[x * self.__size + y] = ship_id
+            self.__renderer.set_state((x, y), WARSHIP)
+        size = warship_to_add.size
+        self.__remaining.append(size)
+        self.__afloat[size] = self.__afloat.get(size, 0) + 1
+        self.__afloat_total += 1
+        self.__warships_str = None
 
     def all_sunk(self) -> bool:
         """
         Checks if all warships had been sunk.
         (Returns false if the board is empty)
         """
-        for warship in self.__warships:
-            if not warship.was_sunk():
-                return False
-        return len(self.__warships) > 0
+        return not self.__afloat_total and len(self.__warships) > 0
+
+    def afloat(self) -> dict[int, int]:
+        """
+        Returns the number of warships of every size,
+        that haven't been sunk yet
+        """
+        return dict(self.__afloat)
 
     def hit(self, coordinates: tuple[int, int]) -> tuple[bool, bool, int]:
         """
@@ -259,27 +611,61 @@ class Board():
         Raises CoordinatesOutOfRangeError if passed coordinates
         out of the board's bounds
 
+        :param coordinates: coordinates of a location on the board
+        :type coordinates: tuple[int, int]
+        """
+        result, warship = self._resolve_hit(coordinates)
+        was_hit, was_sunk, _ = result
+        self.__sink.write(format_hit_warships_io(was_hit, was_sunk, warship))
+        return result
+
+    def resolve_hit(self,
+                    coordinates: tuple[int, int]) -> tuple[bool, bool, int]:
+        """
+        Hits specified coordinates without presenting any messages.\n
+        Returns the same result as hit()\n
+        Raises CoordinatesOutOfRangeError if passed coordinates
+        out of the board's bounds
+
+        :param coordinates: coordinates of a location on the board
+        :type coordinates: tuple[int, int]
+        """
+        return self._resolve_hit(coordinates)[0]
+
+    def _resolve_hit(self, coordinates: tuple[int, int]) -> tuple[
+            tuple[bool, bool, int], Warship]:
+        """
+        Hits specified coordinates.\n
+        Returns the hit's result together with the hit warship,
+        None if the hit was a miss or 0 if that hit was
+        already made before
+
         :param coordinates: coordinates of a location on the board
         :type coordinates: tuple[int, int]
         """
         x, y = coordinates
-        if (x, y) not in self.all_locations():
+        if not (0 <= x < self.__size and 0 <= y < self.__size):
             raise CoordinatesOutOfRangeError((x, y))
-        else:
-            if (x, y) not in self.__hit:
-                self.__hit.append((x, y))
-            else:
-                print_hit_warships_io(False, False, 0)
-                return (False, False, 0)
-            for warship in self.__warships:
-                if warship.was_hit(coordinates):
-                    if warship.was_sunk():
-                        print_hit_warships_io(True, True, warship)
-                        return (True, True, warship.size)
-                    print_hit_warships_io(True, False, warship)
-                    return (True, False, warship.size)
-            print_hit_warships_io(False, False)
-            return (False, False, 0)
+        index = x * self.__size + y
+        if index in self.__hit:
+            return (False, False, 0), 0
+        self.__hit.add(index)
+        ship_id = self.__ship_ids.get(index)
+        if ship_id is None:
+            self.__renderer.set_state((x, y), MISS)
+            return (False, False, 0), None
+        warship = self.__warships[ship_id]
+        warship.was_hit((x, y))
+        self.__renderer.set_state((x, y), HIT)
+        self.__remaining[ship_id] -= 1
+        if self.__remaining[ship_id]:
+            return (True, False, warship.size), warship
+        self.__afloat[warship.size] -= 1
+        if not self.__afloat[warship.size]:
+            del self.__afloat[warship.size]
+        self.__afloat_total -= 1
+        self.__warships_str = None
+        return (True, True, warship.size), warship
 
     def warships_str(self) -> str:
         """
@@ -288,23 +674,24 @@ class Board():
         warships left on the board\n
         e.g. 1 mast warship: x1
         """
-        return print_warships_io(self.__warships)
+        if self.__warships_str is None:
+            self.__warships_str = format_warships_io(self.__afloat)
+        return self.__warships_str
 
-    def print_board(self, show_warships: bool = False) -> str:
+    def print_board(self, show_warships: bool = False,
+                    viewport: tuple[int, int, int, int] = None) -> str:
         """
         Prints the board in the console window.\n
         If show_warships param is True, then it
         shows the locations of warships, otherwise
-        they remain hidden
+        they remain hidden.\n
+        Large boards can be printed partially, within a viewport.
 
         :param show_warships: determines the visibility of printed warships
         :type show_warships: bool
+
+        :param viewport: printed part of the board (x, y, width, height),
+        defaults to None (the whole board)
+        :type viewport: tuple[int, int, int, int]
         """
-        size = self.__size
-        locations_warships = []
-        for warship in self.__warships:
-            for (x, y) in warship.blocks:
-                locations_warships.append((x, y))
-        locations_hit = self.__hit
-        return print_board_io(size, locations_warships,
-                              locations_hit, show_warships)
+        return self.__renderer.render(show_warships, viewport)
@@ -0,0 +1,194 @@
+from concurrent.futures import Executor
+from os import cpu_count
+from random import choice, getrandbits, Random
+from utils.consts import MONTE_CARLO_SAMPLES
+from utils.fleet_sampling import count_samples
+
+
+class FleetSampler():
+    """
+    FleetSampler class. Monte Carlo estimate of the opponent's warships,
+    used by the Ai to choose its hits. Complete arrangements of the
+    remaining warships consistent with the shots made so far are sampled
+    and every location is scored with the number of samples covering it.\n
+    Samples are split into chunks with their own seeds, which can be
+    sampled by a pool of worker processes. Sampling of a chunk stops once
+    the time budget is spent, so a tight budget yields fewer samples.
+    Contains attributes:
+
+    :param size: board's size
+    :type size: int
+
+    :param samples: maximal number of attempted arrangements per hit
+    :type samples: int
+
+    :param time_budget: time budget of a chunk in seconds per hit,
+    None if the number of samples isn't limited by time
+    :type time_budget: float
+
+    :param executor: pool sampling the chunks,
+    None if they're sampled in the current process
+    :type executor: Executor
+
+    :param chunks: number of chunks the samples are split into
+    :type chunks: int
+
+    :param last_samples: number of successful samples
+    of the last estimate
+    :type last_samples: int
+    """
+
+    def __init__(self, size: int, random: Random = None,
+                 samples: int = MONTE_CARLO_SAMPLES,
+                 time_budget: float = None, executor: Executor = None,
+                 chunks: int = None) -> None:
+        """
+        Creates an instance of the FleetSampler class.\n
+        Raises ValueError if the number of samples or chunks is invalid.
+
+        :param size: board's size
+        :type size: int
+
+        :param random: random number generator used for seeding chunks
+        and breaking ties, defaults to None (the global one)
+        :type random: Random
+
+        :param samples: maximal number of attempted arrangements per hit,
+        defaults to MONTE_CARLO_SAMPLES
+        :type samples: int
+
+        :param time_budget: time budget of a chunk in seconds per hit,
+        defaults to None (no limit)
+        :type time_budget: float
+
+        :param executor: pool sampling the chunks, defaults to None
+        (the current process)
+        :type executor: Executor
+
+        :param chunks: number of chunks the samples are split into,
+        defaults to the number of cores with an executor, 1 without it
+        :type chunks: int
+        """
+        if samples <= 0:
+            raise ValueError(samples)
+        self.__size = size
+        self.__random = random
+        self.__samples = samples
+        self.__time_budget = time_budget
+        self.__executor = executor
+        self.__chunks = chunks or ((cpu_count() or 1) if executor else 1)
+        if self.__chunks <= 0:
+            raise ValueError(chunks)
+        self.__last_samples = 0
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def samples(self) -> int:
+        return self.__samples
+
+    @property
+    def time_budget(self) -> float:
+        return self.__time_budget
+
+    @property
+    def last_samples(self) -> int:
+        return self.__last_samples
+
+    def _seed(self) -> int:
+        """
+        Returns a seed of a chunk drawn with the sampler's
+        random number generator if it has one
+        """
+        if self.__random is None:
+            return getrandbits(64)
+        return self.__random.getrandbits(64)
+
+    def estimate(self, remaining: dict[int, int], blocked: list[int],
+                 hits: dict[int, list[tuple[int, int]]]) -> tuple[
+                     int, list[int]]:
+        """
+        Returns the number of successful samples together with
+        the number of samples covering every location,
+        indexed by x * size + y
+
+        :param remaining: number of warships of every size, that haven't
+        been sunk yet
+        :type remaining: dict[int, int]
+
+        :param blocked: bitboard of locations, that cannot be occupied:
+        misses and blocks of sunk warships
+        :type blocked: list[int]
+
+        :param hits: unresolved hits assigned to the sizes of hit warships
+        :type hits: dict[int, list[tuple[int, int]]]
+        """
+        chunks = min(self.__chunks, self.__samples)
+        sizes = [self.__samples // chunks
+                 + (1 if chunk < self.__samples % chunks else 0)
+                 for chunk in range(chunks)]
+        seeds = [self._seed() for _ in range(chunks)]
+        arguments = ([self.__size] * chunks, [remaining] * chunks,
+                     [blocked] * chunks, [hits] * chunks, sizes, seeds,
+                     [self.__time_budget] * chunks)
+        if self.__executor is None:
+            results = map(count_samples, *arguments)
+        else:
+            results = self.__executor.map(count_samples, *arguments)
+        successful = 0
+        counts = [0] * (self.__size * self.__size)
+        for chunk_successful, chunk_counts in results:
+            successful += chunk_successful
+            counts = [count + chunk_count for count, chunk_count
+                      in zip(counts, chunk_counts)]
+        self.__last_samples = successful
+        return successful, counts
+
+    def best(self, remaining: dict[int, int], blocked: list[int],
+             hits: dict[int, list[tuple[int, int]]],
+             shot: list[int]) -> tuple[int, int]:
+        """
+        Returns one of the locations, that weren't hit before,
+        covered by the most samples, None if no arrangement
+        was sampled successfully
+
+        :param remaining: number of warships of every size, that haven't
+        been sunk yet
+        :type remaining: dict[int, int]
+
+        :param blocked: bitboard of locations, that cannot be occupied:
+        misses and blocks of sunk warships
+        :type blocked: list[int]
+
+        :param hits: unresolved hits assigned to the sizes of hit warships
+        :type hits: dict[int, list[tuple[int, int]]]
+
+        :param shot: bitboard of locations already hit at
+        :type shot: list[int]
+        """
+        successful, counts = self.estimate(remaining, blocked, hits)
+        if not successful:
+            return None
+        size = self.__size
+        best_count = 0
+        best = []
+        for index, count in enumerate(counts):
+            if count < best_count or not count:
+                continue
+            x, y = divmod(index, size)
+            if shot[x] >> y & 1:
+                continue
+            if count > best_count:
+                best_count = count
+                best = [index]
+            else:
+                best.append(index)
+        if not best:
+            return None
+        if self.__random is None:
+            index = choice(best)
+        else:
+            index = self.__random.choice(best)
+        return divmod(index, size)
@@ -2,8 +2,18 @@ from .board import Board
 from .board import CoordinatesOutOfRangeError
 from .player import Player, Ai
 from .player import InvalidHitInputError
+from .output_sink import OutputSink, ConsoleSink
+from .profiler import (Profiler, NullProfiler, PHASE_PLACEMENT, PHASE_PARSE,
+                       PHASE_HIT, PHASE_SMART_HIT, PHASE_SET_NEXT_HIT,
+                       PHASE_RENDER)
+from .game_log import (GameLog, GameReplay, ShotFired, PLAYER, AI,
+                       encode_board, iter_games)
+from copy import deepcopy
+from random import Random
 from time import sleep
-from utils.consts import MAX_NUM_OF_WARSHIPS
+from utils.consts import MAX_NUM_OF_WARSHIPS, VIEWPORT_SIZE
+from utils.board_io import column_label, viewport_around
+from utils.event_codec import encode_start, encode_shot
 from utils.system_io import clear
 
 
@@ -28,31 +38,105 @@ class Game():
 
     :param ai: a player, the user plays against
     :type ai: Ai
+
+    :param last_hit: location of the player's last shot
+    :type last_hit: tuple[int, int]
+
+    :param last_ai_hit: location of the Ai's last shot
+    :type last_ai_hit: tuple[int, int]
+
+    :param log: log, the game is recorded to, None if it isn't recorded
+    :type log: GameLog
+
+    :param sink: sink of messages presented by the game and both boards
+    :type sink: OutputSink
+
+    :param shots: all shots made so far, encoded as events
+    :type shots: bytearray
+
+    :param profiler: profiler measuring phases of the game
+    :type profiler: Profiler
     """
 
-    def __init__(self, board_size: int) -> None:
+    def __init__(self, board_size: int, fleet: list[int] = None,
+                 log: GameLog = None, sink: OutputSink = None,
+                 profiler: Profiler = None) -> None:
         """
         Creates an instance of the Game class.\n
         Randomly draws locations for the Ai's warships
 
         :param board_size: board's size
         :type board_size: int
+
+        :param fleet: sizes of both players' warships, defaults to None
+        (the default fleet of the board's size)
+        :type fleet: list[int]
+
+        :param log: log, the game is recorded to, defaults to None
+        :type log: GameLog
+
+        :param sink: sink of messages presented by the game and both boards,
+        defaults to None (ConsoleSink, messages are printed)
+        :type sink: OutputSink
+
+        :param profiler: profiler measuring phases of the game,
+        defaults to None (NullProfiler, nothing is measured)
+        :type profiler: Profiler
         """
         self.__board_size = int(board_size)
-        self.__player = Player(
-            Board(self.__board_size, self.__board_size
-                  if self.__board_size < MAX_NUM_OF_WARSHIPS
-                  else MAX_NUM_OF_WARSHIPS))
-        self.__ai = Ai(
-            Board(self.__board_size, self.__board_size
-                  if self.__board_size < MAX_NUM_OF_WARSHIPS
-                  else MAX_NUM_OF_WARSHIPS))
-        self.__ai.board.draw_locations()
+        self.__sink = sink or ConsoleSink()
+        self.__profiler = profiler or NullProfiler()
+        num_warships = None if fleet else (
+            self.__board_size if self.__board_size < MAX_NUM_OF_WARSHIPS
+            else MAX_NUM_OF_WARSHIPS)
+        self.__player = Player(Board(self.__board_size, num_warships,
+                                     fleet=fleet, sink=self.__sink))
+        self.__ai = Ai(Board(self.__board_size, num_warships,
+                             fleet=fleet, sink=self.__sink))
+        with self.__profiler.measure(PHASE_PLACEMENT):
+            self.__ai.board.draw_locations()
+        self.__last_hit = (0, 0)
+        self.__last_ai_hit = (0, 0)
+        self.__log = log
+        self.__shots = bytearray()
 
     @property
     def player(self) -> Player:
         return self.__player
 
+    @property
+    def ai(self) -> Ai:
+        return self.__ai
+
+    @property
+    def sink(self) -> OutputSink:
+        return self.__sink
+
+    @property
+    def profiler(self) -> Profiler:
+        return self.__profiler
+
+    @property
+    def last_hit(self) -> tuple[int, int]:
+        return self.__last_hit
+
+    @property
+    def last_ai_hit(self) -> tuple[int, int]:
+        return self.__last_ai_hit
+
+    def viewport(self, location: tuple[int, int]) -> tuple[
+            int, int, int, int]:
+        """
+        Returns the part of the board to be printed around a location,
+        None if the board is small enough to be printed whole
+
+        :param location: coordinates of the viewport's center
+        :type location: tuple[int, int]
+        """
+        if self.__board_size <= VIEWPORT_SIZE:
+            return None
+        return viewport_around(self.__board_size, location)
+
     def players_turn(self) -> None:
         """
         Lets the player choose locations for next hits.\n
@@ -60,23 +144,26 @@ class Game():
         are out of the board's bounds.\n
         Raises InvalidHitInputError if entered hit is invalid.
         """
-        print("\nYOUR TURN")
+        self.__sink.write("\nYOUR TURN")
         sleep(1)
-        print(self.__ai.board.warships_str())
-        print("AI's BOARD")
-        print(self.__ai.board.print_board())
+        self.__sink.write(self.__ai.board.warships_str())
+        self.__sink.write("AI's BOARD")
+        self.__sink.write(self.render(self.__ai.board, False,
+                                      self.__last_hit))
         while True:
             try:
-                hit = self.__player.hit(
-                    input("Where would you like to hit: "))
-                self.__ai.board.hit(hit)
+                hit_input = input("Where would you like to hit: ")
+                with self.__profiler.measure(PHASE_PARSE):
+                    hit = self.__player.hit(hit_input)
+                self.player_shot(hit)
                 break
             except CoordinatesOutOfRangeError as e:
-                print(str(e))
+                self.__sink.write(str(e))
             except InvalidHitInputError as e:
-                print(str(e))
+                self.__sink.write(str(e))
         sleep(1)
-        print(self.__ai.board.print_board())
+        self.__sink.write(self.render(self.__ai.board, False,
+                                      self.__last_hit))
         sleep(1)
         self.result_player()
 
@@ -84,18 +171,183 @@ class Game():
         """
         Lets the Ai make hits\n
         """
-        print("\nAI'S TURN")
-        sleep(1)
-        hit = self.__ai.smart_hit()
-        print(chr(int(hit[0])+65) + str(hit[1]))
+        self.__sink.write("\nAI'S TURN")
         sleep(1)
-        self.__ai.set_next_hit(self.__player.board.hit(hit))
+        hit, _ = self.ai_shot()
         sleep(1)
-        print("\nYOUR BOARD")
-        print(self.__player.board.print_board(True))
+        self.__sink.write("\nYOUR BOARD")
+        self.__sink.write(self.render(self.__player.board, True, hit))
         sleep(1)
         self.result_ai()
 
+    def render(self, board: Board, visible: bool,
+               location: tuple[int, int]) -> str:
+        """
+        Returns a board printed around a location
+
+        :param board: board to be printed
+        :type board: Board
+
+        :param visible: True if warships are shown
+        :type visible: bool
+
+        :param location: coordinates of the viewport's center
+        :type location: tuple[int, int]
+        """
+        with self.__profiler.measure(PHASE_RENDER):
+            return board.print_board(visible, self.viewport(location))
+
+    def winner(self) -> int:
+        """
+        Returns the side, that has sunk all of the opponent's warships,
+        PLAYER or AI, None if the game hasn't ended yet
+        """
+        if self.__ai.board.all_sunk():
+            return PLAYER
+        if self.__player.board.all_sunk():
+            return AI
+        return None
+
+    def player_shot(self, location: tuple[int, int]) -> tuple[
+            bool, bool, int]:
+        """
+        Makes the player's shot at a location, without waiting for
+        anything, and records it.\n
+        Returns the result of the shot.\n
+        Raises CoordinatesOutOfRangeError if passed coordinates
+        are out of the board's bounds.
+
+        :param location: coordinates of the shot
+        :type location: tuple[int, int]
+        """
+        with self.__profiler.measure(PHASE_HIT):
+            hit_result = self.__ai.board.hit(location)
+        self.__last_hit = location
+        self.record_shot(PLAYER, location, hit_result)
+        return hit_result
+
+    def ai_shot(self) -> tuple[tuple[int, int], tuple[bool, bool, int]]:
+        """
+        Makes the Ai's shot, without waiting for anything,
+        and records it.\n
+        Returns the location and the result of the shot.
+        """
+        with self.__profiler.measure(PHASE_SMART_HIT):
+            location = self.__ai.smart_hit()
+        x, y = location
+        self.__sink.write(column_label(x) + str(y))
+        hit_result = self.__player.board.hit(location)
+        self.__last_ai_hit = location
+        self.record_shot(AI, location, hit_result)
+        with self.__profiler.measure(PHASE_SET_NEXT_HIT):
+            self.__ai.set_next_hit(hit_result)
+        return location, hit_result
+
+    def record_start(self) -> None:
+        """
+        Records the start of the game and placements of
+        both players' warships, if the game is recorded
+        """
+        if self.__log is None:
+            return
+        self.__log.start(self.__board_size, self.__player.board.fleet)
+        self.__log.placements(PLAYER, self.__player.board)
+        self.__log.placements(AI, self.__ai.board)
+
+    def record_shot(self, side: int, location: tuple[int, int],
+                    hit_result: tuple[bool, bool, int]) -> None:
+        """
+        Records a shot and its result, if the game is recorded
+
+        :param side: shooting side, PLAYER or AI
+        :type side: int
+
+        :param location: coordinates of the shot
+        :type location: tuple[int, int]
+
+        :param hit_result: result of the shot
+        :type hit_result: tuple[bool, bool, int]
+        """
+        encode_shot(self.__shots, self.__board_size, side, location,
+                    hit_result)
+        if self.__log is not None:
+            self.__log.shot(side, location, hit_result)
+
+    def snapshot(self) -> bytes:
+        """
+        Returns the state of the game in a compact binary form:
+        the start of the game, placements of both players' warships
+        and all shots made so far, encoded the same way as in the game log
+        """
+        data = bytearray()
+        encode_start(data, self.__board_size, self.__player.board.fleet)
+        encode_board(data, PLAYER, self.__player.board)
+        encode_board(data, AI, self.__ai.board)
+        data += self.__shots
+        return bytes(data)
+
+    @classmethod
+    def restore(cls, snapshot: bytes, log: GameLog = None,
+                sink: OutputSink = None,
+                profiler: Profiler = None,
+                random: Random = None) -> "Game":
+        """
+        Returns a game restored from its snapshot, the Ai continues
+        with all recorded hits, its next hit is chosen again.\n
+        Raises ValueError if the snapshot is invalid.
+
+        :param snapshot: snapshot returned by snapshot()
+        :type snapshot: bytes
+
+        :param log: log, the restored game is recorded to, defaults to None,
+        the snapshot is recorded there as a new game
+        :type log: GameLog
+
+        :param sink: sink of messages presented by the restored game,
+        defaults to None (ConsoleSink)
+        :type sink: OutputSink
+
+        :param profiler: profiler measuring phases of the restored game,
+        defaults to None (NullProfiler)
+        :type profiler: Profiler
+
+        :param random: random number generator of the restored Ai,
+        defaults to None (the global one)
+        :type random: Random
+        """
+        games = list(iter_games(snapshot))
+        if len(games) != 1:
+            raise ValueError("A snapshot has to contain a single game")
+        events = games[0]
+        game = cls.__new__(cls)
+        game.__sink = sink or ConsoleSink()
+        game.__profiler = profiler or NullProfiler()
+        state = GameReplay(events, random=random).replay(sink=game.__sink)
+        game.__board_size = state.player.board.size
+        game.__player, game.__ai = state
+        game.__last_hit = (0, 0)
+        game.__last_ai_hit = (0, 0)
+        game.__log = log
+        game.__shots = bytearray()
+        for event in events:
+            if isinstance(event, ShotFired):
+                encode_shot(game.__shots, game.__board_size, *event)
+                if event.side == PLAYER:
+                    game.__last_hit = event.location
+                else:
+                    game.__last_ai_hit = event.location
+        if log is not None:
+            log.append(snapshot)
+        return game
+
+    def fork(self) -> "Game":
+        """
+        Returns an independent copy of the game in its current state,
+        made in memory without replaying it.\n
+        Immutable data is shared by both games, the copy isn't recorded.
+        """
+        return deepcopy(self, {id(self.__log): None})
+
     def result_player(self) -> None:
         """
         Prints the result of the game if all
@@ -107,11 +359,11 @@ class Game():
             sleep(1)
             clear()
             sleep(1)
-            print("ALL AI'S SHIPS HAVE BEEN SUNK")
+            self.__sink.write("ALL AI'S SHIPS HAVE BEEN SUNK")
             sleep(2)
             clear()
             sleep(1)
-            print("YOU'VE WON!")
+            self.__sink.write("YOU'VE WON!")
             sleep(1)
             raise GameEnded()
         sleep(1)
@@ -127,11 +379,11 @@ class Game():
             sleep(1)
             clear()
             sleep(1)
-            print("ALL YOUR SHIPS HAVE BEEN SUNK!")
+            self.__sink.write("ALL YOUR SHIPS HAVE BEEN SUNK!")
             sleep(2)
             clear()
             sleep(1)
-            print("YOU'VE LOST")
+            self.__sink.write("YOU'VE LOST")
             sleep(1)
             raise GameEnded()
         sleep(1)
@@ -145,14 +397,17 @@ class Game():
         """
         round = 1
         self.__player.place_warships()
+        self.record_start()
         while True:
             try:
-                print(f"Round {round}.")
+                self.__sink.write(f"Round {round}.")
                 self.players_turn()
                 self.ai_turn()
                 clear()
                 round += 1
             except GameEnded:
+                if self.__log is not None:
+                    self.__log.flush()
                 sleep(1)
                 clear()
                 break
@@ -0,0 +1,355 @@
+from typing import NamedTuple
+from random import Random
+from .board import Board
+from .player import Player, Ai
+from .output_sink import OutputSink
+from utils.consts import TARGETING_RANDOM
+from utils.placements import placement_blocks
+from utils.event_codec import (START, PLACEMENT, encode_start,
+                               encode_placement, encode_shot, decode_events)
+
+
+PLAYER = 0
+AI = 1
+
+
+class GameStarted(NamedTuple):
+    """
+    GameStarted event. Contains attributes:
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param fleet: sizes of both players' warships
+    :type fleet: tuple[int]
+    """
+    board_size: int
+    fleet: tuple[int]
+
+
+class WarshipPlaced(NamedTuple):
+    """
+    WarshipPlaced event. Contains attributes:
+
+    :param side: side owning the board, PLAYER or AI
+    :type side: int
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+
+    :param warship_size: size of the warship
+    :type warship_size: int
+    """
+    side: int
+    x: int
+    y: int
+    vertical: bool
+    warship_size: int
+
+
+class ShotFired(NamedTuple):
+    """
+    ShotFired event. Contains attributes:
+
+    :param side: shooting side, PLAYER or AI
+    :type side: int
+
+    :param location: coordinates of the shot
+    :type location: tuple[int, int]
+
+    :param hit_result: result of the shot
+    :type hit_result: tuple[bool, bool, int]
+    """
+    side: int
+    location: tuple[int, int]
+    hit_result: tuple[bool, bool, int]
+
+
+class ReplayState(NamedTuple):
+    """
+    ReplayState record. Contains attributes:
+
+    :param player: the player with their board
+    :type player: Player
+
+    :param ai: the Ai with its board and all its recorded shots
+    :type ai: Ai
+    """
+    player: Player
+    ai: Ai
+
+
+class GameLog():
+    """
+    GameLog class. Append-only binary log of games, every game is
+    recorded as its start, placements of both players' warships and
+    all shots with their results, a shot takes a few bytes.\n
+    Events are written through a buffered file, so flush() or close()
+    has to be called for them to reach the disk. Contains attributes:
+
+    :param file: binary file opened for appending
+    :type file: BufferedWriter
+
+    :param board_size: board's size of the game being recorded,
+    None before the first game starts
+    :type board_size: int
+    """
+
+    def __init__(self, path: str, buffering: int = -1) -> None:
+        """
+        Creates an instance of the GameLog class,
+        opens the file for appending.
+
+        :param path: path of the log file
+        :type path: str
+
+        :param buffering: buffer's size in bytes, defaults to -1
+        (the default buffer's size)
+        :type buffering: int
+        """
+        self.__file = open(path, "ab", buffering=buffering)
+        self.__board_size = None
+
+    def __enter__(self) -> "GameLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self, board_size: int, fleet: list[int]) -> None:
+        """
+        Records the start of a new game
+
+        :param board_size: board's size
+        :type board_size: int
+
+        :param fleet: sizes of both players' warships
+        :type fleet: list[int]
+        """
+        buffer = bytearray()
+        encode_start(buffer, board_size, fleet)
+        self.__board_size = board_size
+        self.__file.write(buffer)
+
+    def placements(self, side: int, board: Board) -> None:
+        """
+        Records placements of all warships on a board.\n
+        Raises ValueError if any of them isn't straight.
+
+        :param side: side owning the board, PLAYER or AI
+        :type side: int
+
+        :param board: board with all warships placed
+        :type board: Board
+        """
+        buffer = bytearray()
+        encode_board(buffer, side, board)
+        self.__file.write(buffer)
+
+    def shot(self, side: int, location: tuple[int, int],
+             hit_result: tuple[bool, bool, int]) -> None:
+        """
+        Records a shot and its result
+
+        :param side: shooting side, PLAYER or AI
+        :type side: int
+
+        :param location: coordinates of the shot
+        :type location: tuple[int, int]
+
+        :param hit_result: result of the shot
+        :type hit_result: tuple[bool, bool, int]
+        """
+        buffer = bytearray()
+        encode_shot(buffer, self.__board_size, side, location, hit_result)
+        self.__file.write(buffer)
+
+    def append(self, data: bytes) -> None:
+        """
+        Records already encoded events, e.g. a game's snapshot.\n
+        Raises ValueError if they don't start with the start of a game.
+
+        :param data: encoded events
+        :type data: bytes
+        """
+        events = decode_events(data)
+        first = next(events, None)
+        if first is None or first[0] != START:
+            raise ValueError("A game has to start with GameStarted")
+        board_size = first[1]
+        for event in events:
+            if event[0] == START:
+                board_size = event[1]
+        self.__board_size = board_size
+        self.__file.write(data)
+
+    def flush(self) -> None:
+        """
+        Writes all buffered events to the file
+        """
+        self.__file.flush()
+
+    def close(self) -> None:
+        """
+        Writes all buffered events and closes the file
+        """
+        self.__file.close()
+
+
+def encode_board(buffer: bytearray, side: int, board: Board) -> None:
+    """
+    Appends placements of all warships on a board to a buffer.\n
+    Raises ValueError if any of them isn't straight.
+
+    :param buffer: buffer, the events are appended to
+    :type buffer: bytearray
+
+    :param side: side owning the board, PLAYER or AI
+    :type side: int
+
+    :param board: board with warships placed
+    :type board: Board
+    """
+    for warship in board.placed_warships():
+        if warship.direction is None:
+            raise ValueError("Only straight warships can be recorded")
+        x, y = warship.origin
+        encode_placement(buffer, board.size, side, x, y,
+                         warship.direction == (1, 0), warship.size)
+
+
+def iter_games(data: bytes):
+    """
+    Yields events of every game recorded in the data,
+    as lists of GameStarted, WarshipPlaced and ShotFired events.\n
+    Raises ValueError if the data is malformed.
+
+    :param data: content of a log file
+    :type data: bytes
+    """
+    events = None
+    for event in decode_events(data):
+        kind = event[0]
+        if kind == START:
+            if events is not None:
+                yield events
+            events = [GameStarted(*event[1:])]
+        elif kind == PLACEMENT:
+            events.append(WarshipPlaced(*event[1:]))
+        else:
+            events.append(ShotFired(*event[1:]))
+    if events is not None:
+        yield events
+
+
+def read_game_log(path: str) -> list[list[tuple]]:
+    """
+    Returns events of all games recorded in a log file.\n
+    Raises ValueError if the file is malformed.
+
+    :param path: path of the log file
+    :type path: str
+    """
+    with open(path, "rb") as file:
+        return list(iter_games(file.read()))
+
+
+class GameReplay():
+    """
+    GameReplay class. Rebuilds the state of a recorded game at
+    any turn, without any console output. Contains attributes:
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param fleet: sizes of both players' warships
+    :type fleet: tuple[int]
+
+    :param placements: placements of all warships
+    :type placements: list[WarshipPlaced]
+
+    :param shots: all shots in the order they were made
+    :type shots: list[ShotFired]
+
+    :param targeting: targeting mode of the replayed Ai
+    :type targeting: str
+
+    :param random: random number generator of the replayed Ai,
+    None if the global one is used
+    :type random: Random
+    """
+
+    def __init__(self, events: list[tuple],
+                 targeting: str = TARGETING_RANDOM,
+                 random: Random = None) -> None:
+        """
+        Creates an instance of the GameReplay class.\n
+        Raises ValueError if the events don't start with GameStarted.
+
+        :param events: events of a single game
+        :type events: list[tuple]
+
+        :param targeting: targeting mode of the replayed Ai,
+        defaults to TARGETING_RANDOM
+        :type targeting: str
+
+        :param random: random number generator of the replayed Ai, used by
+        its hits made after the replay, defaults to None (the global one)
+        :type random: Random
+        """
+        if not events or not isinstance(events[0], GameStarted):
+            raise ValueError("A game has to start with GameStarted")
+        self.__board_size, self.__fleet = events[0]
+        self.__placements = [event for event in events
+                             if isinstance(event, WarshipPlaced)]
+        self.__shots = [event for event in events
+                        if isinstance(event, ShotFired)]
+        self.__targeting = targeting
+        self.__random = random
+
+    @property
+    def board_size(self) -> int:
+        return self.__board_size
+
+    @property
+    def fleet(self) -> tuple[int]:
+        return self.__fleet
+
+    @property
+    def shots(self) -> list[ShotFired]:
+        return list(self.__shots)
+
+    def replay(self, turns: int = None,
+               sink: OutputSink = None) -> ReplayState:
+        """
+        Returns the state of the game after a number of shots.\n
+        Raises ValueError if a recorded result doesn't match the board.
+
+        :param turns: number of replayed shots made by both sides,
+        defaults to None (all of them)
+        :type turns: int
+
+        :param sink: sink of messages presented by the rebuilt boards
+        later on, defaults to None (NullSink)
+        :type sink: OutputSink
+        """
+        boards = (Board(self.__board_size, fleet=self.__fleet, sink=sink),
+                  Board(self.__board_size, fleet=self.__fleet, sink=sink))
+        for side, x, y, vertical, warship_size in self.__placements:
+            boards[side].add_warship(
+                placement_blocks(x, y, vertical, warship_size))
+        player = Player(boards[PLAYER])
+        ai = Ai(boards[AI], self.__random, self.__targeting)
+        for side, location, hit_result in self.__shots[:turns]:
+            target = boards[AI] if side == PLAYER else boards[PLAYER]
+            if target.resolve_hit(location) != hit_result:
+                raise ValueError(f"Invalid result of a shot at {location}")
+            if side == AI:
+                ai.record_hit(location, hit_result)
+        return ReplayState(player, ai)
@@ -0,0 +1,357 @@
+import asyncio
+from .board import (CoordinatesOutOfRangeError, InvalidWarshipCountError,
+                    InvalidWarshipError, NoAvailableLocationError,
+                    FleetPlacementNotFoundError)
+from .game import Game
+from .game_log import PLAYER
+from .output_sink import BufferedSink
+from .player import InvalidHitInputError, InvalidPlacementInputError
+from utils.board_io import column_label
+
+
+HELP = [
+    "NEW <size> - start a new game",
+    "PLACE <location> <H|V> - place the next warship e.g. PLACE A0 H",
+    "AUTO - place all warships randomly",
+    "FIRE <location> - hit the Ai's board e.g. FIRE B2",
+    "BOARD - show your board",
+    "TARGET - show the Ai's board",
+    "MESSAGES - show the game's messages since the last MESSAGES",
+    "QUIT - end the session",
+]
+
+
+def format_shot(side: str, location: tuple[int, int],
+                hit_result: tuple[bool, bool, int]) -> str:
+    """
+    Returns a protocol line describing a shot
+    e.g. YOU A0 MISS, AI B2 HIT 3, AI C1 SUNK 1
+
+    :param side: shooting side, YOU or AI
+    :type side: str
+
+    :param location: coordinates of the shot
+    :type location: tuple[int, int]
+
+    :param hit_result: result of the shot
+    :type hit_result: tuple[bool, bool, int]
+    """
+    x, y = location
+    was_hit, was_sunk, size = hit_result
+    if was_sunk:
+        result = f"SUNK {size}"
+    elif was_hit:
+        result = f"HIT {size}"
+    else:
+        result = "MISS"
+    return f"{side} {column_label(x)}{y} {result}"
+
+
+class GameSession():
+    """
+    GameSession class. A single game played over a line protocol,
+    every command is answered with a list of lines.\n
+    Nothing blocks the event loop, the Ai's shot is delayed
+    with asyncio.sleep(). Contains attributes:
+
+    :param pace: delay between the player's and the Ai's shot in seconds
+    :type pace: float
+
+    :param fleet: sizes of both players' warships, None for the default
+    fleet of the board's size
+    :type fleet: list[int]
+
+    :param game: the game being played, None before it's started
+    :type game: Game
+
+    :param to_place: sizes of the player's warships left to be placed
+    :type to_place: list[int]
+
+    :param sink: messages presented by the game, kept until they're shown
+    :type sink: BufferedSink
+
+    :param closed: True if the session has ended
+    :type closed: bool
+    """
+
+    def __init__(self, pace: float = 0.0, fleet: list[int] = None) -> None:
+        """
+        Creates an instance of the GameSession class without a game.
+
+        :param pace: delay between the player's and the Ai's shot
+        in seconds, defaults to 0.0
+        :type pace: float
+
+        :param fleet: sizes of both players' warships, defaults to None
+        (the default fleet of the board's size)
+        :type fleet: list[int]
+        """
+        self.__pace = pace
+        self.__fleet = fleet
+        self.__game = None
+        self.__to_place = []
+        self.__sink = BufferedSink()
+        self.__closed = False
+
+    @property
+    def game(self) -> Game:
+        return self.__game
+
+    @property
+    def closed(self) -> bool:
+        return self.__closed
+
+    async def handle(self, line: str) -> list[str]:
+        """
+        Executes a single command, returns lines of the response.\n
+        Invalid commands are answered with an ERROR line.
+
+        :param line: command e.g. FIRE A0
+        :type line: str
+        """
+        command, _, argument = line.strip().partition(" ")
+        argument = argument.strip()
+        handlers = {
+            "NEW": self._new,
+            "PLACE": self._place,
+            "AUTO": self._auto,
+            "FIRE": self._fire,
+            "BOARD": self._board,
+            "TARGET": self._target,
+            "MESSAGES": self._messages,
+            "HELP": self._help,
+            "QUIT": self._quit,
+        }
+        handler = handlers.get(command.upper())
+        if handler is None:
+            return [f"ERROR Unknown command {command}"]
+        try:
+            return await handler(argument)
+        except (ValueError, CoordinatesOutOfRangeError,
+                InvalidHitInputError, InvalidPlacementInputError,
+                InvalidWarshipError, InvalidWarshipCountError,
+                NoAvailableLocationError,
+                FleetPlacementNotFoundError) as error:
+            return [f"ERROR {error}"]
+
+    def _placing(self) -> list[str]:
+        """
+        Returns the line asking for the next warship,
+        READY if all of them were placed
+        """
+        if self.__to_place:
+            return [f"PLACE {self.__to_place[0]}"]
+        return ["READY"]
+
+    def _started(self) -> Game:
+        """
+        Returns the game being played.\n
+        Raises ValueError if no game was started.
+        """
+        if self.__game is None:
+            raise ValueError("No game, start one with NEW <size>")
+        return self.__game
+
+    async def _new(self, argument: str) -> list[str]:
+        """
+        Starts a new game on a board of a specified size
+
+        :param argument: board's size
+        :type argument: str
+        """
+        self.__game = Game(argument, self.__fleet, sink=self.__sink)
+        self.__to_place = list(self.__game.player.board.fleet)
+        return [f"GAME {self.__game.player.board.size}"] + self._placing()
+
+    async def _place(self, argument: str) -> list[str]:
+        """
+        Places the next warship of the player
+
+        :param argument: placement e.g. A0 H
+        :type argument: str
+        """
+        game = self._started()
+        if not self.__to_place:
+            raise ValueError("All warships are placed")
+        size = self.__to_place[0]
+        game.player.board.add_warship(
+            game.player.parse_placement(argument, size))
+        self.__to_place.pop(0)
+        return self._placing()
+
+    async def _auto(self, argument: str) -> list[str]:
+        """
+        Places all warships of the player randomly
+
+        :param argument: ignored
+        :type argument: str
+        """
+        game = self._started()
+        if len(self.__to_place) != len(game.player.board.fleet):
+            raise ValueError("Some warships are already placed")
+        game.player.board.draw_locations()
+        self.__to_place = []
+        return self._placing()
+
+    async def _fire(self, argument: str) -> list[str]:
+        """
+        Makes the player's shot and, unless the game has ended,
+        the Ai's shot
+
+        :param argument: location e.g. A0
+        :type argument: str
+        """
+        game = self._started()
+        if self.__to_place:
+            raise ValueError("Place all warships first")
+        if game.winner() is not None:
+            raise ValueError("The game has ended")
+        location = game.player.hit(argument)
+        lines = [format_shot("YOU", location, game.player_shot(location))]
+        if game.winner() == PLAYER:
+            return lines + ["WON"]
+        await asyncio.sleep(self.__pace)
+        lines.append(format_shot("AI", *game.ai_shot()))
+        if game.winner() is not None:
+            lines.append("LOST")
+        return lines
+
+    async def _board(self, argument: str) -> list[str]:
+        """
+        Returns the player's board with warships visible
+
+        :param argument: ignored
+        :type argument: str
+        """
+        game = self._started()
+        return (game.render(game.player.board, True, game.last_ai_hit)
+                .splitlines() + ["END"])
+
+    async def _target(self, argument: str) -> list[str]:
+        """
+        Returns the Ai's board with warships hidden
+
+        :param argument: ignored
+        :type argument: str
+        """
+        game = self._started()
+        return (game.render(game.ai.board, False, game.last_hit)
+                .splitlines() + ["END"])
+
+    async def _messages(self, argument: str) -> list[str]:
+        """
+        Returns messages presented by the game since they were
+        returned last time
+
+        :param argument: ignored
+        :type argument: str
+        """
+        lines = []
+        for message in self.__sink.drain():
+            lines.extend(message.strip("\n").splitlines())
+        return lines + ["END"]
+
+    async def _help(self, argument: str) -> list[str]:
+        """
+        Returns descriptions of all commands
+
+        :param argument: ignored
+        :type argument: str
+        """
+        return HELP + ["END"]
+
+    async def _quit(self, argument: str) -> list[str]:
+        """
+        Ends the session
+
+        :param argument: ignored
+        :type argument: str
+        """
+        self.__closed = True
+        return ["BYE"]
+
+
+class GameServer():
+    """
+    GameServer class. Hosts many concurrent game sessions, one for
+    every connection, in a single asyncio event loop.
+    Contains attributes:
+
+    :param pace: delay between the player's and the Ai's shot in seconds
+    :type pace: float
+
+    :param fleet: sizes of both players' warships, None for the default
+    fleet of the board's size
+    :type fleet: list[int]
+
+    :param sessions: number of active sessions
+    :type sessions: int
+    """
+
+    def __init__(self, pace: float = 0.0, fleet: list[int] = None) -> None:
+        """
+        Creates an instance of the GameServer class.
+
+        :param pace: delay between the player's and the Ai's shot
+        in seconds, defaults to 0.0
+        :type pace: float
+
+        :param fleet: sizes of both players' warships, defaults to None
+        (the default fleet of the board's size)
+        :type fleet: list[int]
+        """
+        self.__pace = pace
+        self.__fleet = fleet
+        self.__sessions = 0
+
+    @property
+    def sessions(self) -> int:
+        return self.__sessions
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter) -> None:
+        """
+        Plays a session with a connected client, every line
+        sent by the client is a command
+
+        :param reader: stream of the client's commands
+        :type reader: asyncio.StreamReader
+
+        :param writer: stream of the responses
+        :type writer: asyncio.StreamWriter
+        """
+        session = GameSession(self.__pace, self.__fleet)
+        self.__sessions += 1
+        try:
+            while not session.closed:
+                line = await reader.readline()
+                if not line:
+                    break
+                lines = await session.handle(line.decode(errors="replace"))
+                writer.write(("\n".join(lines) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__sessions -= 1
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0,
+                    path: str = None) -> asyncio.AbstractServer:
+        """
+        Starts accepting connections, returns the started server.
+
+        :param host: TCP host, defaults to 127.0.0.1
+        :type host: str
+
+        :param port: TCP port, defaults to 0 (any free port)
+        :type port: int
+
+        :param path: path of a Unix socket used instead of TCP,
+        defaults to None
+        :type path: str
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(
+                self.handle_connection, path)
+        return await asyncio.start_server(self.handle_connection, host, port)
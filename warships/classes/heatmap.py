@@ -0,0 +1,333 @@
+import os
+from random import choice, Random
+from .placement_index import PlacementIndex
+from .heatmap_cache import HeatmapCache, write_heatmap_cache
+from utils.consts import HEATMAP_HIT_WEIGHT
+
+
+def prior_scores(size: int, warship_sizes: list[int]) -> tuple[
+        list[int], dict[int, list[int]]]:
+    """
+    Returns initial scores of an empty board's cells, indexed by
+    x * size + y, summed over all sizes and contributed by every size.\n
+    Every cell is scored with the number of placements covering it,
+    computed arithmetically, without enumerating any placements.
+
+    :param size: board's size
+    :type size: int
+
+    :param warship_sizes: sizes of all warships to be found
+    :type warship_sizes: list[int]
+    """
+    scores = [0] * (size * size)
+    size_scores = {}
+    for warship_size in dict.fromkeys(warship_sizes):
+        coverage = [max(0, min(index, size - warship_size) -
+                        max(0, index - warship_size + 1) + 1)
+                    for index in range(size)]
+        size_scores[warship_size] = [coverage[x] + coverage[y]
+                                     for x in range(size)
+                                     for y in range(size)]
+        scores = [score + size_score for score, size_score
+                  in zip(scores, size_scores[warship_size])]
+    return scores, size_scores
+
+
+class Heatmap():
+    """
+    Heatmap class. Probability density of the opponent's warships,
+    used by the Ai to choose its hits. Every cell is scored with
+    the number of legal placements of the remaining warships covering it,
+    placements passing through unresolved hits are weighted higher.
+    Contains attributes:
+
+    :param size: board's size
+    :type size: int
+
+    :param index: feasible placements of the remaining warships
+    :type index: PlacementIndex
+
+    :param hits: unresolved hits assigned to the sizes of hit warships
+    :type hits: dict[int, set[tuple[int, int]]]
+
+    :param size_scores: cell scores contributed by every size
+    :type size_scores: dict[int, list[int]]
+
+    :param scores: cell scores summed over all sizes
+    :type scores: list[int]
+
+    :param shot: flags of cells already hit at
+    :type shot: bytearray
+    """
+
+    def __init__(self, size: int, warship_sizes: list[int],
+                 random: Random = None,
+                 index: PlacementIndex = None,
+                 cache: HeatmapCache = None) -> None:
+        """
+        Creates an instance of the Heatmap class for an empty board.\n
+        Initial scores are loaded from the cache if it contains them,
+        otherwise they're computed arithmetically, without
+        enumerating any placements.
+
+        :param size: board's size
+        :type size: int
+
+        :param warship_sizes: sizes of all warships to be found,
+        a size is repeated for every warship of that size
+        :type warship_sizes: list[int]
+
+        :param random: random number generator used for breaking ties,
+        defaults to None (the global one)
+        :type random: Random
+
+        :param index: placement index of an empty board pruned together
+        with the heatmap, defaults to None (a new one)
+        :type index: PlacementIndex
+
+        :param cache: cache of initial scores, defaults to None
+        (they're computed)
+        :type cache: HeatmapCache
+        """
+        self.__size = size
+        self.__random = random
+        self.__index = index or PlacementIndex(size, warship_sizes)
+        self.__hits = {warship_size: set()
+                       for warship_size in dict.fromkeys(warship_sizes)}
+        prior = None
+        if cache is not None:
+            prior = cache.get(size, warship_sizes)
+        if prior is None:
+            prior = prior_scores(size, warship_sizes)
+        self.__scores, self.__size_scores = prior
+        self.__shot = bytearray(size * size)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def index(self) -> PlacementIndex:
+        return self.__index
+
+    def score(self, location: tuple[int, int]) -> int:
+        """
+        Returns the score of a location
+
+        :param location: coordinates of a location
+        :type location: tuple[int, int]
+        """
+        x, y = location
+        return self.__scores[x * self.__size + y]
+
+    def best(self) -> tuple[int, int]:
+        """
+        Returns one of the locations, that weren't hit before,
+        with the highest score.\n
+        Raises IndexError if every location was hit before.
+        """
+        shot = self.__shot
+        best_score = -1
+        best = []
+        for index, score in enumerate(self.__scores):
+            if shot[index] or score < best_score:
+                continue
+            if score > best_score:
+                best_score = score
+                best = [index]
+            else:
+                best.append(index)
+        if self.__random is None:
+            index = choice(best)
+        else:
+            index = self.__random.choice(best)
+        return divmod(index, self.__size)
+
+    def update(self, location: tuple[int, int],
+               hit_result: tuple[bool, bool, int],
+               blocks: list[tuple[int, int]] = None) -> None:
+        """
+        Updates the scores with the result of a hit made at a location.\n
+        Hits repeated at the same location are ignored.
+
+        :param location: coordinates of the hit
+        :type location: tuple[int, int]
+
+        :param hit_result: result of the hit
+        :type hit_result: tuple[bool, bool, int]
+
+        :param blocks: blocks of the sunk warship, defaults to None
+        (only the hit location)
+        :type blocks: list[tuple[int, int]]
+        """
+        x, y = location
+        if self.__shot[x * self.__size + y]:
+            return
+        self.__shot[x * self.__size + y] = 1
+        was_hit, was_sunk, hit_size = hit_result
+        for warship_size in self.__index.sizes():
+            if not was_hit or warship_size != hit_size:
+                self._remove_covering(warship_size, x, y)
+        if not was_hit:
+            return
+        if was_sunk:
+            self._sink(hit_size, blocks or [location])
+            return
+        self._reweight_covering(hit_size, x, y)
+        self.__hits[hit_size].add(location)
+
+    def _cells(self, warship_size: int, x: int, y: int,
+               vertical: bool) -> list[int]:
+        """
+        Returns indexes of all cells of a placement
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param y: vertical axis coordinate of the first block
+        :type y: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+        """
+        first = x * self.__size + y
+        step = self.__size if vertical else 1
+        return list(range(first, first + step * warship_size, step))
+
+    def _weight(self, warship_size: int, cells: list[int]) -> int:
+        """
+        Returns the weight of a placement, which grows with
+        every unresolved hit of its size that it passes through
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param cells: indexes of the placement's cells
+        :type cells: list[int]
+        """
+        hits = self.__hits[warship_size]
+        weight = 1
+        for cell in cells:
+            if divmod(cell, self.__size) in hits:
+                weight *= HEATMAP_HIT_WEIGHT
+        return weight
+
+    def _add(self, warship_size: int, cells: list[int], delta: int) -> None:
+        """
+        Adds a value to the scores of specified cells
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param cells: indexes of cells
+        :type cells: list[int]
+
+        :param delta: value to be added
+        :type delta: int
+        """
+        scores = self.__scores
+        size_scores = self.__size_scores[warship_size]
+        for cell in cells:
+            scores[cell] += delta
+            size_scores[cell] += delta
+
+    def _remove_covering(self, warship_size: int, x: int, y: int) -> None:
+        """
+        Removes all placements of a specified size covering a location
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate
+        :type x: int
+
+        :param y: vertical axis coordinate
+        :type y: int
+        """
+        index = self.__index
+        for start_x, start_y, vertical in index.covering(warship_size, x, y):
+            cells = self._cells(warship_size, start_x, start_y, vertical)
+            self._add(warship_size, cells, -self._weight(warship_size, cells))
+        index.remove_covering(warship_size, x, y)
+
+    def _reweight_covering(self, warship_size: int, x: int, y: int) -> None:
+        """
+        Raises the weights of all placements of a specified size
+        passing through a newly hit location
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate
+        :type x: int
+
+        :param y: vertical axis coordinate
+        :type y: int
+        """
+        covering = self.__index.covering(warship_size, x, y)
+        for start_x, start_y, vertical in covering:
+            cells = self._cells(warship_size, start_x, start_y, vertical)
+            weight = self._weight(warship_size, cells)
+            self._add(warship_size, cells, weight * (HEATMAP_HIT_WEIGHT - 1))
+
+    def _sink(self, warship_size: int,
+              blocks: list[tuple[int, int]]) -> None:
+        """
+        Removes a sunk warship: all placements of its size if it was
+        the last one of that size, otherwise only placements
+        covering its blocks, which are no longer unresolved hits
+
+        :param warship_size: size of the sunk warship
+        :type warship_size: int
+
+        :param blocks: blocks of the sunk warship
+        :type blocks: list[tuple[int, int]]
+        """
+        if self.__index.count(warship_size) == 1:
+            self._remove_size(warship_size)
+            return
+        for x, y in blocks:
+            self._remove_covering(warship_size, x, y)
+        self.__hits[warship_size].difference_update(blocks)
+        self.__index.sink(warship_size, blocks)
+
+    def _remove_size(self, warship_size: int) -> None:
+        """
+        Removes all placements of a sunk warship's size
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        size_scores = self.__size_scores.pop(warship_size)
+        self.__scores = [score - size_score for score, size_score
+                         in zip(self.__scores, size_scores)]
+        self.__index.remove_size(warship_size)
+        del self.__hits[warship_size]
+
+
+def build_heatmap_cache(path: str,
+                        configurations: list[tuple[int, list[int]]]) -> None:
+    """
+    Computes initial heatmap scores of specified boards' sizes and fleets
+    and stores them in a cache file, together with all entries
+    of the existing cache file
+
+    :param path: path of the cache file
+    :type path: str
+
+    :param configurations: boards' sizes and sizes of their warships
+    e.g. [(10, [5, 4, 3, 3, 2])]
+    :type configurations: list[tuple[int, list[int]]]
+    """
+    entries = {}
+    if os.path.exists(path):
+        with HeatmapCache(path) as cache:
+            for board_size, sizes in cache.keys():
+                entries[(board_size, sizes)] = cache.get(board_size, sizes)
+    for board_size, warship_sizes in configurations:
+        sizes = tuple(sorted(set(warship_sizes)))
+        entries[(board_size, sizes)] = prior_scores(board_size, sizes)
+    write_heatmap_cache(path, entries)
@@ -0,0 +1,166 @@
+import mmap
+import os
+import struct
+from array import array
+
+
+MAGIC = 0x43484d57
+VERSION = 1
+_HEADER = struct.Struct("=III")
+_ENTRY = struct.Struct("=IIQ")
+
+
+class HeatmapCache():
+    """
+    HeatmapCache class. Read-only cache of initial heatmap scores
+    of empty boards, keyed by board's size and sizes of the fleet's
+    warships, stored in a file memory-mapped by every process using it,
+    so that all of them share a single copy of it.\n
+    The file starts with a header and an index of entries, scores of an
+    entry are stored as unsigned 32-bit integers: scores summed over all
+    sizes followed by scores contributed by every size, sorted ascending.
+    Contains attributes:
+
+    :param path: path of the cache file
+    :type path: str
+
+    :param entries: offsets of entries' scores in bytes, keyed by
+    board's size and sorted distinct warships' sizes
+    :type entries: dict[tuple[int, tuple[int]], int]
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Creates an instance of the HeatmapCache class,
+        maps the cache file into memory.\n
+        Raises ValueError if the file isn't a valid heatmap cache.
+
+        :param path: path of the cache file
+        :type path: str
+        """
+        self.__path = path
+        self.__entries = {}
+        with open(path, "rb") as file:
+            try:
+                self.__map = mmap.mmap(file.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("Invalid heatmap cache") from None
+        try:
+            self._read_index()
+            self.__words = memoryview(self.__map).cast("I")
+        except (struct.error, ValueError, TypeError):
+            self.__map.close()
+            raise ValueError("Invalid heatmap cache") from None
+
+    def __enter__(self) -> "HeatmapCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def _read_index(self) -> None:
+        """
+        Reads the header and the index of entries.\n
+        Raises ValueError if they're invalid or the file's length
+        doesn't match the scores of all entries following the index.
+        """
+        magic, version, count = _HEADER.unpack_from(self.__map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Invalid heatmap cache")
+        position = _HEADER.size
+        data_size = 0
+        for _ in range(count):
+            board_size, sizes_count, offset = _ENTRY.unpack_from(
+                self.__map, position)
+            position += _ENTRY.size
+            sizes = struct.unpack_from(f"={sizes_count}I", self.__map,
+                                       position)
+            position += 4 * sizes_count
+            cells = board_size * board_size
+            data_size += 4 * cells * (sizes_count + 1)
+            if offset % 4 or offset + 4 * cells * (
+                    sizes_count + 1) > len(self.__map):
+                raise ValueError("Invalid heatmap cache")
+            self.__entries[(board_size, sizes)] = offset
+        if position + data_size != len(self.__map) or any(
+                offset < position for offset in self.__entries.values()):
+            raise ValueError("Invalid heatmap cache")
+
+    def keys(self) -> list[tuple[int, tuple[int]]]:
+        """
+        Returns keys of all entries: board's size
+        and sorted distinct warships' sizes
+        """
+        return list(self.__entries)
+
+    def get(self, board_size: int, warship_sizes: list[int]) -> tuple[
+            list[int], dict[int, list[int]]]:
+        """
+        Returns copies of initial scores of an empty board's cells,
+        summed over all sizes and contributed by every size,
+        None if the cache doesn't contain them
+
+        :param board_size: board's size
+        :type board_size: int
+
+        :param warship_sizes: sizes of all warships to be found
+        :type warship_sizes: list[int]
+        """
+        sizes = tuple(sorted(set(warship_sizes)))
+        offset = self.__entries.get((board_size, sizes))
+        if offset is None:
+            return None
+        cells = board_size * board_size
+        start = offset // 4
+        scores = self.__words[start:start+cells].tolist()
+        size_scores = {}
+        for warship_size in dict.fromkeys(warship_sizes):
+            first = start + (sizes.index(warship_size) + 1) * cells
+            size_scores[warship_size] = (
+                self.__words[first:first+cells].tolist())
+        return scores, size_scores
+
+    def close(self) -> None:
+        """
+        Unmaps the cache file
+        """
+        self.__words.release()
+        self.__map.close()
+
+
+def write_heatmap_cache(path: str, entries: dict[
+        tuple[int, tuple[int]], tuple[list[int], dict[int, list[int]]]]
+        ) -> None:
+    """
+    Stores initial heatmap scores in a cache file.\n
+    The file is replaced atomically, so processes, that have
+    the previous version mapped, can keep using it.
+
+    :param path: path of the cache file
+    :type path: str
+
+    :param entries: scores summed over all sizes and contributed by
+    every size, keyed by board's size and sorted distinct warships' sizes
+    :type entries: dict[tuple[int, tuple[int]],
+    tuple[list[int], dict[int, list[int]]]]
+    """
+    index = bytearray(_HEADER.pack(MAGIC, VERSION, len(entries)))
+    offset = len(index) + sum(_ENTRY.size + 4 * len(sizes)
+                              for _, sizes in entries)
+    data = array("I")
+    for (board_size, sizes), (scores, size_scores) in entries.items():
+        index += _ENTRY.pack(board_size, len(sizes), offset + 4 * len(data))
+        index += struct.pack(f"={len(sizes)}I", *sizes)
+        data.extend(scores)
+        for warship_size in sizes:
+            data.extend(size_scores[warship_size])
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(index)
+        data.tofile(file)
+    os.replace(temporary, path)
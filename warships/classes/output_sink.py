@@ -0,0 +1,88 @@
+from abc import ABC, abstractmethod
+
+
+class OutputSink(ABC):
+    """
+    OutputSink (abstract) class. Receives messages presented by the board,
+    the player placing warships and the game, instead of printing them
+    directly.
+    """
+
+    @abstractmethod
+    def write(self, message: str) -> None:
+        """
+        Presents a single message
+
+        :param message: message e.g. Miss
+        :type message: str
+        """
+
+
+class ConsoleSink(OutputSink):
+    """
+    ConsoleSink class, derives from OutputSink class.
+    Prints messages in the console window, used for interactive play.
+    """
+
+    def write(self, message: str) -> None:
+        """
+        Prints a single message
+
+        :param message: message e.g. Miss
+        :type message: str
+        """
+        print(message)
+
+
+class NullSink(OutputSink):
+    """
+    NullSink class, derives from OutputSink class.
+    Discards all messages, used for simulations and by default.
+    """
+
+    def write(self, message: str) -> None:
+        """
+        Discards a single message
+
+        :param message: message e.g. Miss
+        :type message: str
+        """
+        pass
+
+
+class BufferedSink(OutputSink):
+    """
+    BufferedSink class, derives from OutputSink class.
+    Keeps messages until they're drained, used by servers.
+    Contains attributes:
+
+    :param messages: messages written since the last drain
+    :type messages: list[str]
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of the BufferedSink class without messages.
+        """
+        self.__messages = []
+
+    @property
+    def messages(self) -> list[str]:
+        return list(self.__messages)
+
+    def write(self, message: str) -> None:
+        """
+        Keeps a single message
+
+        :param message: message e.g. Miss
+        :type message: str
+        """
+        self.__messages.append(message)
+
+    def drain(self) -> list[str]:
+        """
+        Returns all kept messages and forgets them
+        """
+        messages = self.__messages
+        self.__messages = []
+        return messages
@@ -0,0 +1,141 @@
+from .board import Board
+from utils.board_io import viewport_around, overlay_io
+from utils.placements import placement_blocks
+
+
+VALID_CURSOR = "[*]"
+INVALID_CURSOR = "[!]"
+
+
+class PlacementCursor():
+    """
+    PlacementCursor class. A warship being placed by the user, moved and
+    rotated over the board one step at a time.\n
+    Only the cursor's own placement is validated after every step and
+    only the part of the board around it is rendered, so placing warships
+    doesn't depend on the number of all available placements.
+    Contains attributes:
+
+    :param board: a board, the warship is placed on
+    :type board: Board
+
+    :param warship_size: size of the placed warship
+    :type warship_size: int
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    (shown horizontally on the board)
+    :type vertical: bool
+    """
+
+    def __init__(self, board: Board, warship_size: int,
+                 location: tuple[int, int] = (0, 0),
+                 vertical: bool = True) -> None:
+        """
+        Creates an instance of the PlacementCursor class.\n
+        The location is moved to fit within the board.
+
+        :param board: a board, the warship is placed on
+        :type board: Board
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+
+        :param location: first block of the warship, defaults to (0, 0)
+        :type location: tuple[int, int]
+
+        :param vertical: True if the blocks go along the x axis,
+        defaults to True
+        :type vertical: bool
+        """
+        self.__board = board
+        self.__warship_size = warship_size
+        self.__x, self.__y = location
+        self.__vertical = vertical
+        self._clamp()
+
+    @property
+    def board(self) -> Board:
+        return self.__board
+
+    @property
+    def warship_size(self) -> int:
+        return self.__warship_size
+
+    @property
+    def location(self) -> tuple[int, int]:
+        return self.__x, self.__y
+
+    @property
+    def vertical(self) -> bool:
+        return self.__vertical
+
+    def _clamp(self) -> None:
+        """
+        Moves the cursor, so that all of its blocks are within the board
+        """
+        size = self.__board.size
+        length_x = self.__warship_size if self.__vertical else 1
+        length_y = 1 if self.__vertical else self.__warship_size
+        self.__x = min(max(0, self.__x), size - length_x)
+        self.__y = min(max(0, self.__y), size - length_y)
+
+    def move(self, dx: int, dy: int) -> None:
+        """
+        Moves the cursor by a specified number of columns and rows,
+        it stops at the board's edges
+
+        :param dx: number of columns
+        :type dx: int
+
+        :param dy: number of rows
+        :type dy: int
+        """
+        self.__x += dx
+        self.__y += dy
+        self._clamp()
+
+    def rotate(self) -> None:
+        """
+        Rotates the warship around its first block,
+        it's moved back if it would stick out of the board
+        """
+        self.__vertical = not self.__vertical
+        self._clamp()
+
+    def blocks(self) -> list[tuple[int, int]]:
+        """
+        Returns blocks of the warship at the cursor's placement
+        """
+        return placement_blocks(self.__x, self.__y, self.__vertical,
+                                self.__warship_size)
+
+    def is_valid(self) -> bool:
+        """
+        Checks if the warship can be added at the cursor's placement
+        """
+        return self.__board.is_placement_available(
+            self.__x, self.__y, self.__warship_size, self.__vertical)
+
+    def viewport(self) -> tuple[int, int, int, int]:
+        """
+        Returns the part of the board rendered around the cursor
+        """
+        x, y = self.blocks()[self.__warship_size // 2]
+        return viewport_around(self.__board.size, (x, y))
+
+    def render(self) -> str:
+        """
+        Returns the string representation of the board around the cursor
+        with the warship's blocks marked as [*], or [!] if the warship
+        cannot be added there
+        """
+        viewport = self.viewport()
+        symbol = VALID_CURSOR if self.is_valid() else INVALID_CURSOR
+        return overlay_io(self.__board.print_board(True, viewport),
+                          self.__board.size, self.blocks(), viewport, symbol)
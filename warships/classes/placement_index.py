@@ -0,0 +1,207 @@
+from utils.bitboard import run_mask, iter_bits
+
+
+class PlacementIndex():
+    """
+    PlacementIndex class. Set of all still feasible placements
+    of the opponent's remaining warships, pruned with every hit's result.
+    Placements are stored as bit masks of their first blocks.
+    Contains attributes:
+
+    :param size: board's size
+    :type size: int
+
+    :param horizontal: feasible horizontal placements of every size,
+    bit y of horizontal[size][x] is set if a warship can start at (x, y)
+    :type horizontal: dict[int, list[int]]
+
+    :param vertical: feasible vertical placements of every size,
+    bit x of vertical[size][y] is set if a warship can start at (x, y)
+    :type vertical: dict[int, list[int]]
+
+    :param counts: number of warships of every size, that haven't been
+    sunk yet
+    :type counts: dict[int, int]
+    """
+
+    def __init__(self, size: int, warship_sizes: list[int]) -> None:
+        """
+        Creates an instance of the PlacementIndex class
+        with all placements of an empty board.
+
+        :param size: board's size
+        :type size: int
+
+        :param warship_sizes: sizes of all warships to be found,
+        a size is repeated for every warship of that size
+        :type warship_sizes: list[int]
+        """
+        self.__size = size
+        self.__horizontal = {}
+        self.__vertical = {}
+        self.__counts = {}
+        for warship_size in warship_sizes:
+            self.__counts[warship_size] = (
+                self.__counts.get(warship_size, 0) + 1)
+            starts = run_mask(max(0, size - warship_size + 1))
+            self.__horizontal[warship_size] = [starts] * size
+            self.__vertical[warship_size] = [starts] * size
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def sizes(self) -> list[int]:
+        """
+        Returns sizes of all warships, that haven't been sunk yet
+        """
+        return list(self.__horizontal)
+
+    def count(self, warship_size: int) -> int:
+        """
+        Returns the number of warships of a specified size,
+        that haven't been sunk yet
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return self.__counts.get(warship_size, 0)
+
+    def horizontal(self, warship_size: int) -> list[int]:
+        """
+        Returns masks of feasible horizontal placements of a specified size,
+        bit y of the x-th mask is set if a warship can start at (x, y)
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return self.__horizontal[warship_size]
+
+    def vertical(self, warship_size: int) -> list[int]:
+        """
+        Returns masks of feasible vertical placements of a specified size,
+        bit x of the y-th mask is set if a warship can start at (x, y)
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return self.__vertical[warship_size]
+
+    def covering(self, warship_size: int, x: int,
+                 y: int) -> list[tuple[int, int, bool]]:
+        """
+        Returns all feasible placements of a specified size covering
+        a location, as tuples (x, y, vertical) of their first blocks.\n
+        Horizontal placements go first.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate
+        :type x: int
+
+        :param y: vertical axis coordinate
+        :type y: int
+        """
+        return list(self.iter_covering(warship_size, x, y))
+
+    def iter_covering(self, warship_size: int, x: int, y: int):
+        """
+        Yields all feasible placements of a specified size covering
+        a location, in the same order as covering() returns them
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate
+        :type x: int
+
+        :param y: vertical axis coordinate
+        :type y: int
+        """
+        low = max(0, y - warship_size + 1)
+        starts = self.__horizontal[warship_size][x] & run_mask(y - low + 1,
+                                                               low)
+        for start in iter_bits(starts):
+            yield x, start, False
+        low = max(0, x - warship_size + 1)
+        starts = self.__vertical[warship_size][y] & run_mask(x - low + 1,
+                                                             low)
+        for start in iter_bits(starts):
+            yield start, y, True
+
+    def remove_covering(self, warship_size: int, x: int, y: int) -> None:
+        """
+        Removes all placements of a specified size covering a location
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate
+        :type x: int
+
+        :param y: vertical axis coordinate
+        :type y: int
+        """
+        low = max(0, y - warship_size + 1)
+        self.__horizontal[warship_size][x] &= ~run_mask(y - low + 1, low)
+        low = max(0, x - warship_size + 1)
+        self.__vertical[warship_size][y] &= ~run_mask(x - low + 1, low)
+
+    def remove_size(self, warship_size: int) -> None:
+        """
+        Removes all placements of a sunk warship's size
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        del self.__horizontal[warship_size]
+        del self.__vertical[warship_size]
+        del self.__counts[warship_size]
+
+    def sink(self, warship_size: int,
+             blocks: list[tuple[int, int]]) -> None:
+        """
+        Removes a sunk warship: all placements of its size if it was
+        the last one of that size, otherwise only placements
+        covering its blocks
+
+        :param warship_size: size of the sunk warship
+        :type warship_size: int
+
+        :param blocks: blocks of the sunk warship
+        :type blocks: list[tuple[int, int]]
+        """
+        if self.__counts[warship_size] == 1:
+            self.remove_size(warship_size)
+            return
+        self.__counts[warship_size] -= 1
+        for x, y in blocks:
+            self.remove_covering(warship_size, x, y)
+
+    def update(self, location: tuple[int, int],
+               hit_result: tuple[bool, bool, int],
+               blocks: list[tuple[int, int]] = None) -> None:
+        """
+        Prunes the placements with the result of a hit made at a location:\n
+        - a miss removes all placements covering that location\n
+        - a hit removes placements of other sizes covering that location\n
+        - a sink removes the sunk warship, see sink()
+
+        :param location: coordinates of the hit
+        :type location: tuple[int, int]
+
+        :param hit_result: result of the hit
+        :type hit_result: tuple[bool, bool, int]
+
+        :param blocks: blocks of the sunk warship, defaults to None
+        (only the hit location)
+        :type blocks: list[tuple[int, int]]
+        """
+        x, y = location
+        was_hit, was_sunk, hit_size = hit_result
+        for warship_size in self.sizes():
+            if not was_hit or warship_size != hit_size:
+                self.remove_covering(warship_size, x, y)
+        if was_sunk:
+            self.sink(hit_size, blocks or [location])
@@ -1,9 +1,25 @@
-from .board import Board
-from utils.player_io import pick_location
-from utils.consts import MAX_NUM_OF_WARSHIPS
-from random import choice
+from .board import Board, InvalidWarshipError, NoAvailableLocationError
+from .heatmap import Heatmap
+from .heatmap_cache import HeatmapCache
+from .fleet_sampler import FleetSampler
+from .placement_index import PlacementIndex
+from .placement_cursor import PlacementCursor
+from utils.player_io import pick_location, cursor_location
+from utils.consts import (TARGETING_RANDOM, TARGETING_HEATMAP,
+                          TARGETING_MONTE_CARLO)
+from utils.consts import (PLACEMENT_PICK, PLACEMENT_TYPED, PLACEMENT_CURSOR,
+                          MAX_PICK_BOARD_SIZE, VIEWPORT_SIZE)
+from utils.fleet import fleet_types
+from utils.placements import (placement_blocks, placement_table,
+                              table_available, table_blocks)
+from utils.board_io import column_label, column_index, viewport_around
+from utils.bitboard import (run_mask, window_starts, iter_bits,
+                            spread, nth_bit)
+from random import choice, Random
+from string import ascii_letters
 from utils.system_io import clear
 from time import sleep
+from os import name
 
 
 class InvalidHitInputError(Exception):
@@ -16,6 +32,16 @@ class InvalidHitInputError(Exception):
         super().__init__("Invalid Input")
 
 
+class InvalidPlacementInputError(Exception):
+    """
+    InvalidPlacementInputError Exception.\n
+    Raised if entered placement of a warship is invalid
+    """
+
+    def __init__(self) -> None:
+        super().__init__("Invalid Input")
+
+
 class BasePlayer():
     """
     BasePlayer (abstract) class. Contains attributes:
@@ -36,10 +62,7 @@ class BasePlayer():
         :type board: Board
         """
         self.__board = board
-        self.__warship_types = {
-            size: 1 for size in range(board.size if
-                                      board.size < MAX_NUM_OF_WARSHIPS
-                                      else MAX_NUM_OF_WARSHIPS, 0, -1)}
+        self.__warship_types = fleet_types(board.fleet)
 
     @property
     def board(self) -> Board:
@@ -76,18 +99,15 @@ class Player(BasePlayer):
         Parses a hit entered by the user to a tuple of integers.\n
         Raises InvalidHitInputError if entered hit is invalid.
 
-        :param hit_input: hit entered by the user e.g. A0 -> (0,0)
+        :param hit_input: hit entered by the user e.g. A0 -> (0,0),
+        AB12 -> (27,12)
         :type hit: str
 
         """
-        if not hit_input:
-            raise InvalidHitInputError()
-        x = str.title(hit_input[0])
-        if not x.isalpha():
-            raise InvalidHitInputError()
-        x = ord(x)-65
+        letters = len(hit_input) - len(hit_input.lstrip(ascii_letters))
         try:
-            y = int(hit_input[1:])
+            x = column_index(hit_input[:letters])
+            y = int(hit_input[letters:])
         except ValueError:
             raise InvalidHitInputError()
         return x, y
@@ -107,37 +127,172 @@ class Player(BasePlayer):
             formatted_inner = []
             for location_inner in location:
                 x, y = location_inner
-                formatted_inner.append(chr(x+65) + str(y))
+                formatted_inner.append(column_label(x) + str(y))
             formatted.append(formatted_inner)
 
         return formatted
 
-    def place_warships(self) -> None:
+    def parse_placement(self, placement_input: str,
+                        warship_size: int) -> list[tuple[int, int]]:
+        """
+        Parses a placement entered by the user to blocks of a warship.\n
+        A placement is made of the first block and the direction,
+        in which the warship goes on the printed board:
+        H (along the row) or V (along the column), e.g. for a 3 mast warship
+        A0 H -> [(0,0), (1,0), (2,0)], A0 V -> [(0,0), (0,1), (0,2)].\n
+        The direction of a 1 mast warship may be omitted.\n
+        Raises InvalidPlacementInputError if entered placement is invalid.
+
+        :param placement_input: placement entered by the user e.g. A0 H
+        :type placement_input: str
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+        """
+        parts = placement_input.split()
+        if len(parts) == 1 and warship_size == 1:
+            parts.append("H")
+        if len(parts) != 2 or parts[1].upper() not in ("H", "V"):
+            raise InvalidPlacementInputError()
+        try:
+            x, y = self.hit(parts[0])
+        except InvalidHitInputError:
+            raise InvalidPlacementInputError()
+        if y < 0:
+            raise InvalidPlacementInputError()
+        # blocks going along the x axis are printed in a single row
+        return placement_blocks(x, y, parts[1].upper() == "H", warship_size)
+
+    def _viewport(self, location: tuple[int, int]) -> tuple[
+            int, int, int, int]:
+        """
+        Returns the part of the board to be printed around a location,
+        None if the board is small enough to be printed whole
+
+        :param location: coordinates of the viewport's center
+        :type location: tuple[int, int]
+        """
+        if self.board.size <= VIEWPORT_SIZE:
+            return None
+        return viewport_around(self.board.size, location)
+
+    def _check_available(self, warship_size: int) -> None:
+        """
+        Raises NoAvailableLocationError if a warship of a specified size
+        cannot be added anywhere on the board
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        if not (self.board.count_available_locations_horizontal(warship_size)
+                or self.board.count_available_locations_vertical(
+                    warship_size)):
+            raise NoAvailableLocationError(warship_size)
+
+    def placement_options(self, warship_size: int) -> tuple[
+            list[list[tuple[int, int]]], list[list[str]]]:
+        """
+        Returns all available placements of a warship together with
+        their formatted options presented to the user
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+        """
+        unique_available_locations = list(
+            self.board.iter_available_locations_horizontal(warship_size))
+        if warship_size > 1:
+            # 1 mast locations are the same in both directions
+            unique_available_locations.extend(
+                self.board.iter_available_locations_vertical(warship_size))
+        return (unique_available_locations,
+                self._format_locations(unique_available_locations))
+
+    def _place_pick(self, warship_size: int) -> list[tuple[int, int]]:
+        """
+        Lets the user choose the placement of a warship from
+        all available placements, returns its blocks
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+        """
+        unique_available_locations, options = self.placement_options(
+            warship_size)
+        index = pick_location(options, warship_size, self.board.sink)
+        blocks = unique_available_locations[index]
+        self.board.add_warship(blocks)
+        return blocks
+
+    def _place_typed(self, warship_size: int) -> list[tuple[int, int]]:
+        """
+        Lets the user enter the placement of a warship until
+        it can be added to the board, returns its blocks
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+        """
+        self._check_available(warship_size)
+        while True:
+            placement_input = input(
+                f"Place your {warship_size} mast warship (e.g. A0 H): ")
+            try:
+                blocks = self.parse_placement(placement_input, warship_size)
+                self.board.add_warship(blocks)
+                return blocks
+            except (InvalidPlacementInputError, InvalidWarshipError) as error:
+                self.board.sink.write(str(error))
+
+    def _place_cursor(self, warship_size: int) -> list[tuple[int, int]]:
+        """
+        Lets the user move a warship over the board until
+        it's placed where it can be added, returns its blocks
+
+        :param warship_size: size of the placed warship
+        :type warship_size: int
+        """
+        self._check_available(warship_size)
+        blocks = cursor_location(PlacementCursor(self.board, warship_size))
+        self.board.add_warship(blocks)
+        return blocks
+
+    def place_warships(self, mode: str = None) -> None:
         """
         Allows the user to choose their wanted locations for
         all assigned warships.\n
-        The order is descending, biggest ships are to be chosen first.
-        """
+        The order is descending, biggest ships are to be chosen first.\n
+        Raises ValueError if the mode is invalid.
+
+        :param mode: placement mode, either PLACEMENT_PICK (choosing from
+        all available placements), PLACEMENT_TYPED (entering placements
+        e.g. A0 H) or PLACEMENT_CURSOR (moving warships over the board),
+        defaults to None (PLACEMENT_PICK for boards up to
+        MAX_PICK_BOARD_SIZE, otherwise PLACEMENT_TYPED on Windows and
+        PLACEMENT_CURSOR on other systems)
+        :type mode: str
+        """
+        if mode is None:
+            if self.board.size <= MAX_PICK_BOARD_SIZE:
+                mode = PLACEMENT_PICK
+            elif name == "nt":
+                mode = PLACEMENT_TYPED
+            else:
+                mode = PLACEMENT_CURSOR
+        if mode not in (PLACEMENT_PICK, PLACEMENT_TYPED, PLACEMENT_CURSOR):
+            raise ValueError(mode)
+        place = {
+            PLACEMENT_PICK: self._place_pick,
+            PLACEMENT_TYPED: self._place_typed,
+            PLACEMENT_CURSOR: self._place_cursor,
+        }[mode]
         sleep(1)
         for size in self.warship_types:
             clear()
             to_add = self.warship_types.get(size)
             added = 0
             while added < to_add:
-                available_locations = (
-                    self.board.get_available_locations_horizontal(size)) + (
-                        self.board.get_available_locations_vertical(size))
-                unique_available_locations = []
-                [unique_available_locations.append(
-                    location) for location in available_locations if
-                    location not in unique_available_locations]
-                options = self._format_locations(unique_available_locations)
-                index = pick_location(options, size)
-                self.board.add_warship(
-                    unique_available_locations[index]
-                )
+                blocks = place(size)
                 added += 1
-                print(self.board.print_board(True))
+                self.board.sink.write(self.board.print_board(
+                    True, self._viewport(blocks[0])))
                 sleep(1)
         clear()
 
@@ -159,11 +314,59 @@ class Ai(BasePlayer):
     the sizes of hit warships
     :type warships_hit: dict[int, list[tuple[int,int]]]
 
-    :param next_hit: hit to be made next by the ai
+    :param next_hit: hit to be made next by the ai, 0 if it's drawn
+    randomly, None if it's chosen only after a recorded hit
     :type next_hit: tuple[int,int]
+
+    :param last_result: result of the last recorded hit
+    :type last_result: tuple[bool, bool, int]
+
+    :param hit_set: all hits made by the ai, for constant time lookups
+    :type hit_set: set[tuple[int, int]]
+
+    :param shot_rows: bitboard of all hits made by the ai, bit y of
+    shot_rows[x] is set if (x, y) was hit
+    :type shot_rows: list[int]
+
+    :param shot_columns: transposed bitboard of all hits made by the ai
+    :type shot_columns: list[int]
+
+    :param index: feasible placements of the opponent's remaining warships
+    :type index: PlacementIndex
+
+    :param open_rows: bitboard of open candidate locations, bit y of
+    open_rows[x] is set if (x, y) wasn't hit before and is covered by
+    a possible location of a warship that hasn't been sunk yet
+    :type open_rows: list[int]
+
+    :param open_counts: number of open candidate locations in every row
+    :type open_counts: list[int]
+
+    :param open_size: size of the smallest warship, that hasn't been
+    sunk yet, it determines the open candidate locations
+    :type open_size: int
+
+    :param open_stale: True if open candidate locations have to be
+    recomputed after recorded hits
+    :type open_stale: bool
+
+    :param random: random number generator used for drawing hits,
+    None if the global one is used
+    :type random: Random
+
+    :param heatmap: probability density of the opponent's warships,
+    None unless the heatmap targeting is used
+    :type heatmap: Heatmap
+
+    :param sampler: Monte Carlo estimate of the opponent's warships,
+    None unless the Monte Carlo targeting is used
+    :type sampler: FleetSampler
     """
 
-    def __init__(self, board: Board) -> None:
+    def __init__(self, board: Board, random: Random = None,
+                 targeting: str = TARGETING_RANDOM,
+                 sampler: FleetSampler = None,
+                 heatmap_cache: HeatmapCache = None) -> None:
         """
         Creates an instance of the Ai class.\n
         When initialized, hit, success_hit, warships_hit.values() are empty &
@@ -171,12 +374,70 @@ class Ai(BasePlayer):
 
         :param board: a board with ai's warships
         :type board: Board
+
+        :param random: random number generator, defaults to None
+        (the global one)
+        :type random: Random
+
+        :param targeting: targeting mode, either TARGETING_RANDOM
+        (random hits around possible locations) or TARGETING_HEATMAP
+        (hits at the most probable locations) or TARGETING_MONTE_CARLO
+        (hits at the locations covered by the most sampled fleets),
+        defaults to TARGETING_RANDOM
+        :type targeting: str
+
+        :param sampler: sampler used by the Monte Carlo targeting,
+        defaults to None (a sampler with the default budget)
+        :type sampler: FleetSampler
+
+        :param heatmap_cache: cache of initial scores used by the heatmap
+        targeting, defaults to None (they're computed)
+        :type heatmap_cache: HeatmapCache
         """
+        if targeting not in (TARGETING_RANDOM, TARGETING_HEATMAP,
+                             TARGETING_MONTE_CARLO):
+            raise ValueError(targeting)
         super().__init__(board)
         self.__hit = []
         self.__success_hit = []
         self.__warships_hit = {size: [] for size in self.warship_types.keys()}
         self.__next_hit = 0
+        self.__last_result = None
+        self.__hit_set = set()
+        self.__shot_rows = [0] * board.size
+        self.__shot_columns = [0] * board.size
+        self.__index = PlacementIndex(board.size, list(board.fleet))
+        self.__open_size = None
+        self.__open_rows = [0] * board.size
+        self.__open_counts = [0] * board.size
+        self.__open_stale = False
+        self._rebuild_open_cells()
+        self.__random = random
+        self.__targeting = targeting
+        self.__heatmap = None
+        if targeting == TARGETING_HEATMAP:
+            self.__heatmap = Heatmap(
+                board.size, list(board.fleet), random, self.__index,
+                heatmap_cache)
+        self.__sampler = None
+        if targeting == TARGETING_MONTE_CARLO:
+            self.__sampler = sampler or FleetSampler(board.size, random)
+
+    @property
+    def targeting(self) -> str:
+        return self.__targeting
+
+    def _choice(self, sequence):
+        """
+        Returns a random element of a non-empty sequence, drawn with
+        the ai's random number generator if it has one
+
+        :param sequence: sequence to choose from
+        :type sequence: Sequence
+        """
+        if self.__random is None:
+            return choice(sequence)
+        return self.__random.choice(sequence)
 
     def remove_hit_before(self,
                           locations: list[
@@ -188,20 +449,102 @@ class Ai(BasePlayer):
         :type locations: list[tuple[int,int]]
 
         """
-        return [coors for coors in locations if coors not in self.__hit]
+        hit = self.__hit_set
+        return [coors for coors in locations if tuple(coors) not in hit]
 
     def draw_coordinates(self) -> tuple[int, int]:
         """
         Returns a randomly chosen pair of available coordinates on the board.
+        Raises IndexError if there are no available coordinates.
         """
-        all_locations = []
-        warships_coordinates = sum(self.__warships_hit.values(), [])
-        for x in range(self.board.size):
-            for y in range(self.board.size):
-                if ((x, y) not in warships_coordinates and
-                        (x, y) in self.get_all_possible_locations()):
-                    all_locations.append((x, y))
-        return choice(self.remove_hit_before(all_locations))
+        return self._draw_open_cell()
+
+    def _draw_open_cell(self) -> tuple[int, int]:
+        """
+        Returns a randomly chosen open candidate location.\n
+        Raises IndexError if there are no open candidate locations.
+        """
+        self._refresh_stale_open_cells()
+        number = self._choice(range(sum(self.__open_counts)))
+        for x, count in enumerate(self.__open_counts):
+            if number < count:
+                return x, nth_bit(self.__open_rows[x], number)
+            number -= count
+
+    def open_cells(self) -> list[tuple[int, int]]:
+        """
+        Returns all open candidate locations, ordered by x and then y
+        """
+        self._refresh_stale_open_cells()
+        return [(x, y) for x, row in enumerate(self.__open_rows)
+                for y in iter_bits(row)]
+
+    def _open_row(self, x: int) -> int:
+        """
+        Returns a mask of open candidate locations in a row, covered by
+        either horizontal or vertical windows of open_size locations,
+        that weren't hit before
+
+        :param x: index of the row
+        :type x: int
+        """
+        size = self.__open_size
+        board_size = self.board.size
+        shot_rows = self.__shot_rows
+        row = spread(window_starts(shot_rows[x], size, board_size), size)
+        full = run_mask(board_size)
+        for start in range(max(0, x - size + 1),
+                           min(x, board_size - size) + 1):
+            taken = 0
+            for shots in shot_rows[start:start + size]:
+                taken |= shots
+            row |= ~taken & full
+        return row
+
+    def _refresh_open_rows(self, first: int, last: int) -> None:
+        """
+        Recomputes open candidate locations in a range of rows
+
+        :param first: index of the first row
+        :type first: int
+
+        :param last: index of the last row
+        :type last: int
+        """
+        for x in range(max(0, first), min(self.board.size, last + 1)):
+            row = self._open_row(x)
+            self.__open_rows[x] = row
+            self.__open_counts[x] = row.bit_count()
+
+    def _rebuild_open_cells(self) -> None:
+        """
+        Recomputes all open candidate locations, if the smallest
+        warship, that hasn't been sunk yet, has changed
+        """
+        if self.__open_stale:
+            return
+        sizes = self.__warships_hit.keys()
+        size = min(sizes) if sizes else None
+        if size == self.__open_size:
+            return
+        self.__open_size = size
+        if size is None:
+            self.__open_rows = [0] * self.board.size
+            self.__open_counts = [0] * self.board.size
+            return
+        self._refresh_open_rows(0, self.board.size - 1)
+
+    def _refresh_stale_open_cells(self) -> None:
+        """
+        Recomputes all open candidate locations, if they weren't
+        kept up to date while hits were recorded
+        """
+        if not self.__open_stale:
+            return
+        self.__open_stale = False
+        # no warship has size 0, so the open cells are always rebuilt
+        self.__open_size = 0
+        self._rebuild_open_cells()
 
     def get_possible_locations_horizontal(self,
                                           warship_size: int) -> list[tuple[int, int]]:
@@ -212,15 +555,7 @@ class Ai(BasePlayer):
         :param warship_size: size of a warship
         :type warship_size: int
         """
-        locations = []
-        for x in range(self.board.size):
-            for y in range(self.board.size - warship_size + 1):
-                locations_inner = []
-                for size in range(warship_size):
-                    locations_inner.append((x, y+size))
-                if (len(locations_inner) == warship_size):
-                    locations.append(locations_inner)
-        return locations
+        return list(self.iter_possible_locations_horizontal(warship_size))
 
     def get_possible_locations_vertical(self,
                                         warship_size: int) -> list[tuple[int, int]]:
@@ -231,29 +566,102 @@ class Ai(BasePlayer):
         :param warship_size: size of a warship
         :type warship_size: int
         """
-        locations = []
+        return list(self.iter_possible_locations_vertical(warship_size))
+
+    def iter_possible_locations_horizontal(self, warship_size: int):
+        """
+        Yields all possible horizontal locations for warships
+        of a specified size, ordered by x and then y.\n
+        On small boards they're copied from the memoized placement table.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        if table_available(self.board.size):
+            for blocks in placement_table(self.board.size, warship_size,
+                                          False):
+                yield list(blocks)
+            return
+        for x in range(self.board.size):
+            for y in range(self.board.size - warship_size + 1):
+                yield placement_blocks(x, y, False, warship_size)
+
+    def iter_possible_locations_vertical(self, warship_size: int):
+        """
+        Yields all possible vertical locations for warships
+        of a specified size, ordered by x and then y.\n
+        On small boards they're copied from the memoized placement table.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        if table_available(self.board.size):
+            for blocks in placement_table(self.board.size, warship_size,
+                                          True):
+                yield list(blocks)
+            return
         for x in range(self.board.size - warship_size + 1):
             for y in range(self.board.size):
-                locations_inner = []
-                for size in range(warship_size):
-                    locations_inner.append((x+size, y))
-                if (len(locations_inner) == warship_size):
-                    locations.append(locations_inner)
-        return locations
+                yield placement_blocks(x, y, True, warship_size)
+
+    def count_possible_locations_horizontal(self, warship_size: int) -> int:
+        """
+        Returns the number of all possible horizontal locations
+        for warships of a specified size, computed arithmetically.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return self.board.size * max(0, self.board.size - warship_size + 1)
+
+    def count_possible_locations_vertical(self, warship_size: int) -> int:
+        """
+        Returns the number of all possible vertical locations
+        for warships of a specified size, computed arithmetically.
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        return self.board.size * max(0, self.board.size - warship_size + 1)
 
     def get_all_possible_locations(self) -> list[tuple[int, int]]:
         """
         Returns all possible locations of warships that haven't been sunk yet
         """
+        board_size = self.board.size
         all_locations = []
         for size in self.__warships_hit.keys():
-            for locations in self.get_possible_locations_horizontal(size):
-                if self.check_if_not_hit_before(locations):
-                    all_locations.append(locations)
-            for locations in self.get_possible_locations_vertical(size):
-                if self.check_if_not_hit_before(locations):
-                    all_locations.append(locations)
-        return sum(all_locations, [])
+            for x, y, vertical in self._possible_placements(size):
+                all_locations.extend(
+                    table_blocks(board_size, x, y, vertical, size))
+        return all_locations
+
+    def _possible_placements(self,
+                             size: int) -> list[tuple[int, int, bool]]:
+        """
+        Returns all placements of a specified size from the placement index,
+        that don't cover any location hit before, as tuples (x, y, vertical)
+        of their first blocks.\n
+        Horizontal placements go first, both ordered by x and then y.
+
+        :param size: size of a warship
+        :type size: int
+        """
+        board_size = self.board.size
+        placements = []
+        horizontal = self.__index.horizontal(size)
+        for x, shots in enumerate(self.__shot_rows):
+            starts = horizontal[x] & window_starts(shots, size, board_size)
+            for y in iter_bits(starts):
+                placements.append((x, y, False))
+        vertical_placements = []
+        vertical = self.__index.vertical(size)
+        for y, shots in enumerate(self.__shot_columns):
+            starts = vertical[y] & window_starts(shots, size, board_size)
+            for x in iter_bits(starts):
+                vertical_placements.append((x, y, True))
+        vertical_placements.sort()
+        return placements + vertical_placements
 
     def check_if_not_hit_before(self,
                                 locations: list[tuple[int, int]]) -> bool:
@@ -264,11 +672,10 @@ class Ai(BasePlayer):
         :param locations: list of locations
         :type locations: list[tuple[int, int]]
         """
-        valid = True
         for location in locations:
-            if location in self.__hit:
-                valid = False
-        return valid
+            if location in self.__hit_set:
+                return False
+        return True
 
     def flatten_valid_locations(self, locations: list[list[tuple[int, int]]],
                                 hits: list[tuple[int, int]]) -> list[tuple[int, int]]:
@@ -290,7 +697,9 @@ class Ai(BasePlayer):
         return sum(flattened_locations, [])
 
     def get_next_possible_locations(self, size: int,
-                                    hits: list[tuple[int, int]]) -> list[tuple[int, int]]:
+                                    hits: list[tuple[int, int]],
+                                    other_hits: list[tuple[int, int]] = ()
+                                    ) -> list[tuple[int, int]]:
         """
         Returns a list of next possible locations based on
         what hits were made before.
@@ -300,17 +709,27 @@ class Ai(BasePlayer):
 
         :param hits: list of hit locations of a particular hit warship
         :type hits: list[tuple[int, ints]]
+
+        :param other_hits: hit locations, that may belong to the warship
+        as well, defaults to none
+        :type other_hits: list[tuple[int, int]]
         """
-        possible_locations = self.get_possible_locations_horizontal(size) + \
-            self.get_possible_locations_vertical(size)
+        if not hits or size not in self.__index.sizes():
+            return []
+        x, y = hits[0]
+        board_size = self.board.size
         valid_locations = []
-        for locations in possible_locations:
+        for start_x, start_y, vertical in self.__index.iter_covering(size,
+                                                                     x, y):
+            locations = table_blocks(board_size, start_x, start_y, vertical,
+                                     size)
             valid = True
             for hit in hits:
                 if hit not in locations:
                     valid = False
-            for hit in self.__hit:
-                if hit not in hits and hit in locations:
+            for location in locations:
+                if (location in self.__hit_set and location not in hits
+                        and location not in other_hits):
                     valid = False
             if valid:
                 valid_locations.append(locations)
@@ -336,11 +755,68 @@ class Ai(BasePlayer):
         :param key: size of a warship, hit before
         :type key: int
         """
-        possible_locations = self.get_next_possible_locations(
-            key, self.__warships_hit[key])
+        hits = self.__warships_hit[key]
+        possible_locations = self.get_next_possible_locations(key, hits)
         possible_locations_cleaned_up = self.remove_hit_before(
             possible_locations)
-        return choice(possible_locations_cleaned_up)
+        if not possible_locations_cleaned_up and len(hits) > 1:
+            # hits of more than one warship of that size
+            for hit in reversed(hits):
+                possible_locations_cleaned_up = self.remove_hit_before(
+                    self.get_next_possible_locations(key, [hit], hits))
+                if possible_locations_cleaned_up:
+                    break
+            else:
+                return self.draw_coordinates()
+        return self._choice(possible_locations_cleaned_up)
+
+    def _sunk_blocks(self, size: int,
+                     location: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        Returns blocks of a warship sunk with a hit at a location.\n
+        If it's the last warship of its size, those are all hits
+        of that size, otherwise the first line of hits of that size
+        going through the location.
+
+        :param size: sunk warship's size
+        :type size: int
+
+        :param location: coordinates of the sinking hit
+        :type location: tuple[int, int]
+        """
+        hits = self.__warships_hit[size] + [location]
+        if self.__index.count(size) <= 1:
+            return hits
+        hits_set = set(hits)
+        x, y = location
+        for vertical in (False, True):
+            for offset in range(size):
+                if vertical:
+                    blocks = placement_blocks(x - offset, y, True, size)
+                else:
+                    blocks = placement_blocks(x, y - offset, False, size)
+                if all(block in hits_set for block in blocks):
+                    return blocks
+        return [location]
+
+    def _remove_sunk(self, size: int,
+                     blocks: list[tuple[int, int]]) -> None:
+        """
+        Removes blocks of a sunk warship from the successful hits,
+        forgets its size if no warships of that size are left
+
+        :param size: sunk warship's size
+        :type size: int
+
+        :param blocks: blocks of the sunk warship
+        :type blocks: list[tuple[int, int]]
+        """
+        for coors in blocks:
+            self.__success_hit.remove(coors)
+            self.__warships_hit[size].remove(coors)
+        if not self.__index.count(size):
+            self.__warships_hit.pop(size)
+            self._rebuild_open_cells()
 
     def set_next_hit(self, last_hit: tuple[bool, bool, int]) -> None:
         """
@@ -357,33 +833,95 @@ class Ai(BasePlayer):
         If last_hit was successful but didn't sink a warship, it:\n
         - sets next hit based on the last successful hit\n
 
+        :param last_hit: result of the last hit
+        :type last_hit: tuple[bool, bool, int]
+        """
+        if self.__heatmap is not None:
+            self.set_next_hit_heatmap(last_hit)
+            return
+        self._update_hits(last_hit)
+        if self.__sampler is not None:
+            self.__next_hit = None
+            self.__last_result = last_hit
+            return
+        self.__next_hit = self._choose_next_hit(last_hit)
+
+    def _update_hits(self, last_hit: tuple[bool, bool, int]) -> None:
+        """
+        Updates the placement index and the successful hits
+        with the result of the last hit
+
         :param last_hit: result of the last hit
         :type last_hit: tuple[bool, bool, int]
         """
         was_hit, was_sunk, size = last_hit
+        blocks = self._sunk_blocks(size, self.__hit[-1]) if was_sunk else None
+        self.__index.update(self.__hit[-1], last_hit, blocks)
         if not was_hit:
-            if self.__success_hit == []:
-                self.__next_hit = self.draw_coordinates()
-            else:
-                self.__next_hit = self.set_next_hit_with_key(
-                    self.get_warship_key(self.__success_hit[-1]))
             return
-        else:
-            self.__success_hit.append(self.__hit[-1])
-            self.__warships_hit[size].append(self.__hit[-1])
-            if was_sunk:
-                for coors in self.__warships_hit[size]:
-                    self.__success_hit.remove(coors)
-                self.__warships_hit.pop(size)
-                if len(self.__success_hit) == 0:
-                    self.__next_hit = 0
-                    return
-                else:
-                    self.__next_hit = self.set_next_hit_with_key(
-                        self.get_warship_key(self.__success_hit[-1]))
-                    return
-            self.__next_hit = self.set_next_hit_with_key(size)
+        self.__success_hit.append(self.__hit[-1])
+        self.__warships_hit[size].append(self.__hit[-1])
+        if was_sunk:
+            self._remove_sunk(size, blocks)
+
+    def _choose_next_hit(self, last_hit: tuple[bool, bool, int]):
+        """
+        Returns the next hit chosen after the last hit was recorded,
+        0 if it should be drawn randomly
+
+        :param last_hit: result of the last hit
+        :type last_hit: tuple[bool, bool, int]
+        """
+        was_hit, was_sunk, size = last_hit
+        if was_hit and not was_sunk:
+            return self.set_next_hit_with_key(size)
+        if self.__success_hit == []:
+            return 0 if was_hit else self.draw_coordinates()
+        return self.set_next_hit_with_key(
+            self.get_warship_key(self.__success_hit[-1]))
+
+    def record_hit(self, location: tuple[int, int],
+                   hit_result: tuple[bool, bool, int]) -> None:
+        """
+        Records a hit made at a location and its result, the same way
+        as if the location was returned by smart_hit() and the result
+        passed to set_next_hit().\n
+        The next hit and open candidate locations aren't updated until
+        they're needed, so that recorded games can be replayed quickly.
+
+        :param location: coordinates of the hit
+        :type location: tuple[int, int]
+
+        :param hit_result: result of the hit
+        :type hit_result: tuple[bool, bool, int]
+        """
+        self.__open_stale = True
+        self._shoot(location)
+        if self.__heatmap is not None:
+            self.set_next_hit_heatmap(hit_result)
             return
+        self._update_hits(hit_result)
+        self.__next_hit = None
+        self.__last_result = hit_result
+
+    def set_next_hit_heatmap(self, last_hit: tuple[bool, bool, int]) -> None:
+        """
+        Updates the heatmap and the successful hits
+        with the result of the last hit.\n
+        The next hit is chosen from the heatmap by smart_hit().
+
+        :param last_hit: result of the last hit
+        :type last_hit: tuple[bool, bool, int]
+        """
+        was_hit, was_sunk, size = last_hit
+        blocks = self._sunk_blocks(size, self.__hit[-1]) if was_sunk else None
+        self.__heatmap.update(self.__hit[-1], last_hit, blocks)
+        if not was_hit:
+            return
+        self.__success_hit.append(self.__hit[-1])
+        self.__warships_hit[size].append(self.__hit[-1])
+        if was_sunk:
+            self._remove_sunk(size, blocks)
 
     def smart_hit(self) -> tuple[int, int]:
         """
@@ -392,11 +930,55 @@ class Ai(BasePlayer):
         If next_hit is 0 and there weren't any hits before:\n
         - the hit will by drawn randomly\n
 
-        Otherwise returns the next_hit parameter's value
-        """
-        if len(self.__hit) == 0 or self.__next_hit == 0:
+        Otherwise returns the next_hit parameter's value.\n
+        With the heatmap targeting it's always the most probable location.\n
+        With the Monte Carlo targeting it's the location covered by
+        the most sampled fleets, unless none of them was sampled.
+        """
+        if self.__sampler is not None:
+            coordinates = self._sampled_hit()
+            if coordinates is not None:
+                self._shoot(coordinates)
+                return coordinates
+        if self.__next_hit is None:
+            self.__next_hit = self._choose_next_hit(self.__last_result)
+        if self.__heatmap is not None:
+            coordinates = self.__heatmap.best()
+        elif len(self.__hit) == 0 or self.__next_hit == 0:
             coordinates = self.draw_coordinates()
         else:
             coordinates = self.__next_hit
-        self.__hit.append(coordinates)
+        self._shoot(coordinates)
         return coordinates
+
+    def _sampled_hit(self) -> tuple[int, int]:
+        """
+        Returns the location covered by the most fleets sampled
+        consistently with all hits made so far,
+        None if no fleet was sampled
+        """
+        remaining = {size: self.__index.count(size)
+                     for size in self.__index.sizes()}
+        hits = {size: list(blocks)
+                for size, blocks in self.__warships_hit.items() if blocks}
+        blocked = list(self.__shot_rows)
+        for x, y in self.__success_hit:
+            blocked[x] &= ~(1 << y)
+        return self.__sampler.best(remaining, blocked, hits,
+                                   self.__shot_rows)
+
+    def _shoot(self, coordinates: tuple[int, int]) -> None:
+        """
+        Marks a location as hit by the ai
+
+        :param coordinates: coordinates of the hit
+        :type coordinates: tuple[int, int]
+        """
+        self.__hit.append(coordinates)
+        self.__hit_set.add(coordinates)
+        x, y = coordinates
+        self.__shot_rows[x] |= 1 << y
+        self.__shot_columns[y] |= 1 << x
+        if self.__open_size is not None and not self.__open_stale:
+            self._refresh_open_rows(x - self.__open_size + 1,
+                                    x + self.__open_size - 1)
@@ -0,0 +1,149 @@
+from contextlib import nullcontext
+from time import perf_counter
+from typing import NamedTuple
+
+
+PHASE_PLACEMENT = "placement"
+PHASE_PARSE = "parse"
+PHASE_HIT = "hit"
+PHASE_SMART_HIT = "smart_hit"
+PHASE_SET_NEXT_HIT = "set_next_hit"
+PHASE_RENDER = "render"
+
+
+class PhaseStats(NamedTuple):
+    """
+    PhaseStats record. Contains attributes:
+
+    :param calls: number of times the phase was measured
+    :type calls: int
+
+    :param seconds: total wall time of the phase in seconds
+    :type seconds: float
+    """
+    calls: int
+    seconds: float
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+class _Measurement():
+    """
+    _Measurement class. Context manager measuring
+    a single call of a phase.
+    """
+    __slots__ = ("_profiler", "_phase", "_start")
+
+    def __init__(self, profiler: "Profiler", phase: str) -> None:
+        self._profiler = profiler
+        self._phase = phase
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler.record(self._phase, perf_counter() - self._start)
+
+
+class Profiler():
+    """
+    Profiler class. Records wall time and number of calls
+    of every phase of a game, e.g. Ai's smart_hit.
+    Contains attributes:
+
+    :param calls: number of calls of every phase
+    :type calls: dict[str, int]
+
+    :param seconds: total wall time of every phase in seconds
+    :type seconds: dict[str, float]
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of the Profiler class without measurements.
+        """
+        self.__calls = {}
+        self.__seconds = {}
+
+    def measure(self, phase: str):
+        """
+        Returns a context manager measuring a single call of a phase
+        e.g. with profiler.measure(PHASE_HIT): ...
+
+        :param phase: phase's name e.g. smart_hit
+        :type phase: str
+        """
+        return _Measurement(self, phase)
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Adds a single call of a phase
+
+        :param phase: phase's name e.g. smart_hit
+        :type phase: str
+
+        :param seconds: wall time of the call in seconds
+        :type seconds: float
+        """
+        self.__calls[phase] = self.__calls.get(phase, 0) + 1
+        self.__seconds[phase] = self.__seconds.get(phase, 0.0) + seconds
+
+    def report(self) -> dict[str, PhaseStats]:
+        """
+        Returns measurements of all phases keyed by phase's name,
+        in the order the phases were first measured
+        """
+        return {phase: PhaseStats(calls, self.__seconds[phase])
+                for phase, calls in self.__calls.items()}
+
+    def format_report(self) -> str:
+        """
+        Returns measurements of all phases as a table,
+        a phase per line
+        """
+        lines = [f"{'phase':<14}{'calls':>8}{'total ms':>12}{'mean us':>12}"]
+        for phase, stats in self.report().items():
+            lines.append(f"{phase:<14}{stats.calls:>8}"
+                         f"{stats.seconds * 1e3:>12.3f}"
+                         f"{stats.mean * 1e6:>12.2f}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Forgets all measurements
+        """
+        self.__calls = {}
+        self.__seconds = {}
+
+
+class NullProfiler(Profiler):
+    """
+    NullProfiler class, derives from Profiler class.
+    Measures nothing, used by default, so that a game
+    isn't slowed down by profiling.
+    """
+
+    __measurement = nullcontext()
+
+    def measure(self, phase: str):
+        """
+        Returns a context manager doing nothing
+
+        :param phase: phase's name e.g. smart_hit
+        :type phase: str
+        """
+        return self.__measurement
+
+    def record(self, phase: str, seconds: float) -> None:
+        """
+        Discards a single call of a phase
+
+        :param phase: phase's name e.g. smart_hit
+        :type phase: str
+
+        :param seconds: wall time of the call in seconds
+        :type seconds: float
+        """
+        pass
@@ -0,0 +1,129 @@
+from typing import NamedTuple
+from random import Random
+from .board import Board
+from .player import Ai
+from .heatmap_cache import HeatmapCache
+from utils.consts import MAX_NUM_OF_WARSHIPS, TARGETING_RANDOM
+
+
+class SimulationResult(NamedTuple):
+    """
+    SimulationResult record. Contains attributes:
+
+    :param winner: index of the Ai, that has sunk all opponent's warships
+    :type winner: int
+
+    :param turns: number of rounds played
+    :type turns: int
+
+    :param shots: number of hits made by each of the Ai players
+    :type shots: tuple[int, int]
+    """
+    winner: int
+    turns: int
+    shots: tuple[int, int]
+
+
+class Simulation():
+    """
+    Simulation class. Plays a headless game between two Ai players,
+    without any sleeping or console output. Contains attributes:
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param ais: both Ai players, the first one starts the game
+    :type ais: tuple[Ai, Ai]
+    """
+
+    def __init__(self, board_size: int, random: Random = None,
+                 targeting: tuple[str, str] = (TARGETING_RANDOM,
+                                               TARGETING_RANDOM),
+                 fleet: list[int] = None,
+                 heatmap_cache: HeatmapCache = None) -> None:
+        """
+        Creates an instance of the Simulation class.\n
+        Randomly draws locations for both Ai players' warships.\n
+        Raises ValueError if board size is invalid.
+
+        :param board_size: board's size
+        :type board_size: int
+
+        :param random: random number generator shared by both boards
+        and Ai players, defaults to None (the global one)
+        :type random: Random
+
+        :param targeting: targeting modes of both Ai players,
+        defaults to TARGETING_RANDOM for both
+        :type targeting: tuple[str, str]
+
+        :param fleet: sizes of both Ai players' warships, defaults to None
+        (the default fleet of the board's size)
+        :type fleet: list[int]
+
+        :param heatmap_cache: cache of initial scores used by
+        the heatmap targeting, defaults to None (they're computed)
+        :type heatmap_cache: HeatmapCache
+        """
+        self.__board_size = int(board_size)
+        num_warships = None if fleet else (
+            self.__board_size if self.__board_size < MAX_NUM_OF_WARSHIPS
+            else MAX_NUM_OF_WARSHIPS)
+        self.__ais = tuple(
+            Ai(Board(self.__board_size, num_warships, random, fleet),
+               random, mode, heatmap_cache=heatmap_cache)
+            for mode in targeting)
+        for ai in self.__ais:
+            ai.board.draw_locations()
+
+    @property
+    def board_size(self) -> int:
+        return self.__board_size
+
+    @property
+    def ais(self) -> tuple[Ai, Ai]:
+        return self.__ais
+
+    def run(self) -> SimulationResult:
+        """
+        Exchanges hits between both Ai players until one of them
+        sinks all of the opponent's warships.\n
+        Returns the result of the game.
+        """
+        shots = [0, 0]
+        turns = 0
+        while True:
+            turns += 1
+            for index, ai in enumerate(self.__ais):
+                target = self.__ais[1 - index].board
+                hit_result = target.resolve_hit(ai.smart_hit())
+                shots[index] += 1
+                if target.all_sunk():
+                    return SimulationResult(index, turns, tuple(shots))
+                ai.set_next_hit(hit_result)
+
+
+def simulate_game(board_size: int, random: Random = None,
+                  targeting: tuple[str, str] = (TARGETING_RANDOM,
+                                                TARGETING_RANDOM),
+                  fleet: list[int] = None) -> SimulationResult:
+    """
+    Plays a single headless game between two Ai players
+    on boards of a specified size and returns its result.
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param random: random number generator, defaults to None
+    (the global one)
+    :type random: Random
+
+    :param targeting: targeting modes of both Ai players,
+    defaults to TARGETING_RANDOM for both
+    :type targeting: tuple[str, str]
+
+    :param fleet: sizes of both Ai players' warships, defaults to None
+    (the default fleet of the board's size)
+    :type fleet: list[int]
+    """
+    return Simulation(board_size, random, targeting, fleet).run()
@@ -0,0 +1,238 @@
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from os import cpu_count
+from random import Random
+from .simulation import Simulation, SimulationResult
+from .heatmap_cache import HeatmapCache
+from utils.consts import (MAX_BOARD_SIZE, TARGETING_RANDOM,
+                          TOURNAMENT_SHARD_GAMES)
+
+
+class TournamentStats():
+    """
+    TournamentStats class. Aggregated results of simulated games.
+    Contains attributes:
+
+    :param games: number of games played
+    :type games: int
+
+    :param wins: number of games won by each of the Ai players
+    :type wins: list[int]
+
+    :param turns: total number of rounds played
+    :type turns: int
+
+    :param shots: total number of hits made by each of the Ai players
+    :type shots: list[int]
+
+    :param winning_shots: total number of hits made by the winners
+    :type winning_shots: int
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates an instance of the TournamentStats class.\n
+        When initialized, all counters are set to 0.
+        """
+        self.games = 0
+        self.wins = [0, 0]
+        self.turns = 0
+        self.shots = [0, 0]
+        self.winning_shots = 0
+
+    def add(self, result: SimulationResult) -> None:
+        """
+        Adds the result of a single game to the statistics
+
+        :param result: result of a simulated game
+        :type result: SimulationResult
+        """
+        self.games += 1
+        self.wins[result.winner] += 1
+        self.turns += result.turns
+        self.shots[0] += result.shots[0]
+        self.shots[1] += result.shots[1]
+        self.winning_shots += result.shots[result.winner]
+
+    def merge(self, other: 'TournamentStats') -> None:
+        """
+        Adds statistics gathered by another worker to these statistics
+
+        :param other: statistics to be merged
+        :type other: TournamentStats
+        """
+        self.games += other.games
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.turns += other.turns
+        self.shots[0] += other.shots[0]
+        self.shots[1] += other.shots[1]
+        self.winning_shots += other.winning_shots
+
+    def average_turns(self) -> float:
+        """
+        Returns the average number of rounds per game
+        """
+        return self.turns / self.games if self.games else 0.0
+
+    def average_winning_shots(self) -> float:
+        """
+        Returns the average number of hits needed to win a game
+        """
+        return self.winning_shots / self.games if self.games else 0.0
+
+    def average_shots(self, index: int) -> float:
+        """
+        Returns the average number of hits per game made
+        by one of the Ai players
+
+        :param index: index of the Ai player
+        :type index: int
+        """
+        return self.shots[index] / self.games if self.games else 0.0
+
+    def __str__(self) -> str:
+        """
+        Returns a short summary of the statistics
+        """
+        return (f"games: {self.games}\n"
+                f"wins: {self.wins[0]} - {self.wins[1]}\n"
+                f"average rounds: {self.average_turns():.2f}\n"
+                f"average shots: {self.average_shots(0):.2f} - "
+                f"{self.average_shots(1):.2f}")
+
+
+def derive_seed(seed: int, shard: int) -> int:
+    """
+    Returns a seed of a specified shard derived from the tournament's seed.\n
+    Seeds of different shards are independent of each other.
+
+    :param seed: tournament's seed
+    :type seed: int
+
+    :param shard: index of the shard
+    :type shard: int
+    """
+    return Random(f"{seed}/{shard}").getrandbits(64)
+
+
+def play_shard(board_size: int, games: int, seed: int,
+               targeting: tuple[str, str] = (TARGETING_RANDOM,
+                                             TARGETING_RANDOM),
+               fleet: list[int] = None,
+               heatmap_cache: str = None) -> TournamentStats:
+    """
+    Plays a specified number of simulated games with its own
+    random number generator and returns their statistics
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param games: number of games to be played
+    :type games: int
+
+    :param seed: seed of the shard's random number generator
+    :type seed: int
+
+    :param targeting: targeting modes of both Ai players,
+    defaults to TARGETING_RANDOM for both
+    :type targeting: tuple[str, str]
+
+    :param fleet: sizes of both Ai players' warships, defaults to None
+    (the default fleet of the board's size)
+    :type fleet: list[int]
+
+    :param heatmap_cache: path of the cache of initial heatmap scores,
+    mapped once for all games, defaults to None (they're computed)
+    :type heatmap_cache: str
+    """
+    random = Random(seed)
+    stats = TournamentStats()
+    with (HeatmapCache(heatmap_cache) if heatmap_cache
+          else nullcontext()) as cache:
+        for _ in range(games):
+            stats.add(Simulation(board_size, random, targeting, fleet,
+                                 cache).run())
+    return stats
+
+
+def shard_sizes(games: int, shards: int) -> list[int]:
+    """
+    Splits games into a specified number of nearly equal shards
+
+    :param games: number of games
+    :type games: int
+
+    :param shards: number of shards
+    :type shards: int
+    """
+    return [games // shards + (1 if shard < games % shards else 0)
+            for shard in range(shards)]
+
+
+def run_tournament(board_size: int, games: int, seed: int = 0,
+                   workers: int = None, shards: int = None,
+                   targeting: tuple[str, str] = (TARGETING_RANDOM,
+                                                 TARGETING_RANDOM),
+                   fleet: list[int] = None,
+                   heatmap_cache: str = None) -> TournamentStats:
+    """
+    Plays a specified number of simulated games split into shards
+    across a pool of worker processes and returns merged statistics.\n
+    Results depend only on the seed and the number of shards,
+    not on the number of workers.\n
+    Raises ValueError if board size, games or shards are invalid.
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param games: number of games to be played
+    :type games: int
+
+    :param seed: tournament's seed, defaults to 0
+    :type seed: int
+
+    :param workers: number of worker processes,
+    defaults to the number of cores
+    :type workers: int
+
+    :param shards: number of shards, defaults to None (as many as needed
+    for TOURNAMENT_SHARD_GAMES games per shard, so that there are enough
+    small shards to keep all workers busy)
+    :type shards: int
+
+    :param targeting: targeting modes of both Ai players,
+    defaults to TARGETING_RANDOM for both
+    :type targeting: tuple[str, str]
+
+    :param fleet: sizes of both Ai players' warships, defaults to None
+    (the default fleet of the board's size)
+    :type fleet: list[int]
+
+    :param heatmap_cache: path of the cache of initial heatmap scores
+    shared by all worker processes, defaults to None (they're computed)
+    :type heatmap_cache: str
+    """
+    board_size = int(board_size)
+    if board_size <= 1 or board_size > MAX_BOARD_SIZE:
+        raise ValueError(board_size)
+    if games < 0:
+        raise ValueError(games)
+    workers = workers or cpu_count() or 1
+    if shards is None:
+        shards = max(1, -(-games // TOURNAMENT_SHARD_GAMES))
+    if shards <= 0:
+        raise ValueError(shards)
+    sizes = shard_sizes(games, shards)
+    seeds = [derive_seed(seed, shard) for shard in range(shards)]
+    arguments = ([board_size] * shards, sizes, seeds, [targeting] * shards,
+                 [fleet] * shards, [heatmap_cache] * shards)
+    stats = TournamentStats()
+    if workers == 1:
+        for result in map(play_shard, *arguments):
+            stats.merge(result)
+        return stats
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(play_shard, *arguments):
+            stats.merge(result)
+    return stats
@@ -1,20 +1,31 @@
 class Warship():
     """
     Warship class. Represents a single warship on the board built
-    of blocks
+    of blocks.\n
+    A straight warship is stored as its first block, direction and size,
+    blocks of any other shape are stored as a tuple.
+    Hit blocks are stored as a bit mask of their indexes.
 
-    :param blocks: Represents the lists of blocks
-    :type blocks: list[tuple[int, int]]
+    :param origin: Represents warship's first block
+    :type origin: tuple[int, int]
+
+    :param direction: Represents the step between consecutive blocks,
+    None if the warship isn't straight
+    :type direction: tuple[int, int]
+
+    :param shape: Represents blocks of a warship, that isn't straight,
+    None otherwise
+    :type shape: tuple[tuple[int, int]]
 
     :param size: Represents warship's size.
     :type size: int
 
-    :param hits: Represents warship's hit count
-    :type hits: int
-
-    :param hit_blocks: Represents warship's blocks that were hit
-    :type hit_blocks: list[tuple[int, int]]
+    :param hit_mask: Represents warship's blocks that were hit,
+    bit i is set if the i-th block was hit
+    :type hit_mask: int
     """
+    __slots__ = ("__x", "__y", "__dx", "__dy", "__shape", "__size",
+                 "__hit_mask")
 
     def __init__(self, blocks: list[tuple[int, int]]) -> None:
         """
@@ -28,15 +39,36 @@ class Warship():
             raise ValueError("Warship cannot be empty")
         elif not self.evaluate_blocks(blocks):
             raise ValueError("Invalid blocks")
-        else:
-            self.__blocks = blocks
+        self.__x, self.__y = blocks[0]
+        self.__dx, self.__dy = 0, 1
+        if len(blocks) > 1:
+            self.__dx = blocks[1][0] - self.__x
+            self.__dy = blocks[1][1] - self.__y
+        self.__shape = None
+        for index, (x, y) in enumerate(blocks):
+            if (x, y) != (self.__x + index * self.__dx,
+                          self.__y + index * self.__dy):
+                self.__shape = tuple(tuple(block) for block in blocks)
+                break
         self.__size = len(blocks)
-        self.__hits = 0
-        self.__hit_blocks = []
+        self.__hit_mask = 0
+
+    @property
+    def blocks(self) -> list[tuple[int, int]]:
+        if self.__shape is not None:
+            return list(self.__shape)
+        return [(self.__x + index * self.__dx, self.__y + index * self.__dy)
+                for index in range(self.__size)]
+
+    @property
+    def origin(self) -> tuple[int, int]:
+        return self.__x, self.__y
 
     @property
-    def blocks(self):
-        return self.__blocks
+    def direction(self) -> tuple[int, int]:
+        if self.__shape is not None:
+            return None
+        return self.__dx, self.__dy
 
     @property
     def size(self) -> int:
@@ -44,7 +76,11 @@ class Warship():
 
     @property
     def hits(self) -> int:
-        return self.__hits
+        return self.__hit_mask.bit_count()
+
+    @property
+    def hit_mask(self) -> int:
+        return self.__hit_mask
 
     def evaluate_blocks(self, blocks: list[tuple[int, int]]) -> bool:
         """
@@ -69,7 +105,28 @@ class Warship():
         Returns a simple description of a warship:
         e.g. 1 mast warship.
         """
-        return f"{len(self.__blocks)} mast warship"
+        return f"{self.__size} mast warship"
+
+    def block_index(self, location: tuple[int, int]) -> int:
+        """
+        Returns the index of the warship's block at a location,
+        None if the warship doesn't cover that location
+
+        :param location: coordinates e.g. (1,1)
+        :type location: tuple[int]
+        """
+        x, y = location
+        if self.__shape is not None:
+            try:
+                return self.__shape.index((x, y))
+            except ValueError:
+                return None
+        index = (x - self.__x) * self.__dx + (y - self.__y) * self.__dy
+        if (0 <= index < self.__size
+                and x == self.__x + index * self.__dx
+                and y == self.__y + index * self.__dy):
+            return index
+        return None
 
     def was_hit(self, location: tuple[int, int]) -> bool:
         """
@@ -80,14 +137,14 @@ class Warship():
         :param location: coordinates e.g. (1,1)
         :type location: tuple[int]
         """
-        if location in self.__blocks and location not in self.__hit_blocks:
-            self.__hits += 1
-            self.__hit_blocks.append(location)
-            return True
-        return False
+        index = self.block_index(location)
+        if index is None or self.__hit_mask >> index & 1:
+            return False
+        self.__hit_mask |= 1 << index
+        return True
 
     def was_sunk(self) -> bool:
         """
         Checks if a warship has been sunk.
         """
-        return self.__hits == self.__size
+        return self.__hit_mask == (1 << self.__size) - 1
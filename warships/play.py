@@ -1,7 +1,10 @@
 from classes.game import Game
+from classes.game_log import GameLog
+from classes.profiler import Profiler
+from utils.consts import GAME_LOG_PATH, PROFILE_ENV_VAR
 from time import sleep
 from utils.system_io import clear
-from os import name
+from os import name, environ
 
 
 def menu() -> None:
@@ -24,21 +27,27 @@ def menu() -> None:
 def start() -> None:
     """
     Initializes the Game object & enters the
-    game's main loop
+    game's main loop, the game is recorded to the game log.\n
+    If the WARSHIPS_PROFILE environment variable is set, timings of
+    the game's phases are printed after the game
 
     Raises ValueError if passed board size is invalid
     """
     print("\nLet the game begin!")
     sleep(1)
     clear()
-    while True:
-        try:
-            board_size = input("Enter the size of your board: ")
-            game = Game(board_size)
-            break
-        except ValueError:
-            print("Invalid board size")
-    game.play()
+    profiler = Profiler() if environ.get(PROFILE_ENV_VAR) else None
+    with GameLog(GAME_LOG_PATH) as log:
+        while True:
+            try:
+                board_size = input("Enter the size of your board: ")
+                game = Game(board_size, log=log, profiler=profiler)
+                break
+            except ValueError:
+                print("Invalid board size")
+        game.play()
+    if profiler is not None:
+        print(profiler.format_report())
 
 
 def instructions() -> None:
@@ -55,6 +64,10 @@ def instructions() -> None:
     else:
         print(
             "2 > Use the arrow keys to place your warships")
+    print(
+        "    On large boards enter them e.g. A0 H (from A0 along row 0)"
+        if name == "nt" else
+        "    On large boards move them with the arrow keys, R rotates them")
     sleep(1)
     print("\nGAME ON\n")
     print("1 > Take turns with the AI on hitting the opponent's ships")
@@ -0,0 +1,58 @@
+import asyncio
+from argparse import ArgumentParser
+from classes.game_server import GameServer
+
+
+async def serve(host: str, port: int, path: str, pace: float,
+                fleet: list[int]) -> None:
+    """
+    Runs the game server until it's interrupted
+
+    :param host: TCP host
+    :type host: str
+
+    :param port: TCP port
+    :type port: int
+
+    :param path: path of a Unix socket used instead of TCP, None for TCP
+    :type path: str
+
+    :param pace: delay between the player's and the Ai's shot in seconds
+    :type pace: float
+
+    :param fleet: sizes of warships, None for the default fleet
+    :type fleet: list[int]
+    """
+    server = await GameServer(pace, fleet).start(host, port, path)
+    for socket in server.sockets:
+        print(f"Serving on {socket.getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """
+    Hosts games played over a line protocol, e.g. with
+    telnet localhost 8765, many concurrent games in a single process
+    """
+    parser = ArgumentParser(description="Warships game server")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="TCP host")
+    parser.add_argument("--port", type=int, default=8765,
+                        help="TCP port")
+    parser.add_argument("--unix", default=None,
+                        help="path of a Unix socket used instead of TCP")
+    parser.add_argument("--pace", type=float, default=0.5,
+                        help="delay before the Ai's shot in seconds")
+    parser.add_argument("--fleet", type=int, nargs="+", default=None,
+                        help="sizes of warships e.g. 4 3 3 2 2 2 1 1 1 1")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.pace,
+                          args.fleet))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
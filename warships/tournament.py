@@ -0,0 +1,58 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from os.path import exists
+from classes.tournament import run_tournament
+from classes.heatmap import build_heatmap_cache
+from classes.heatmap_cache import HeatmapCache
+from utils.fleet import default_fleet
+from utils.consts import (TARGETING_RANDOM, TARGETING_HEATMAP,
+                          TARGETING_MONTE_CARLO, MAX_NUM_OF_WARSHIPS)
+
+
+def main() -> None:
+    """
+    Plays a tournament of headless Ai-vs-Ai games spread across
+    worker processes and prints out its statistics
+    """
+    parser = ArgumentParser(description="Warships Ai-vs-Ai tournament")
+    parser.add_argument("--size", type=int, default=10,
+                        help="board's size")
+    parser.add_argument("--games", type=int, default=1000,
+                        help="number of games to be played")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="tournament's seed")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="number of shards the games are split into")
+    parser.add_argument("--targeting", nargs=2,
+                        default=[TARGETING_RANDOM, TARGETING_RANDOM],
+                        choices=[TARGETING_RANDOM, TARGETING_HEATMAP,
+                                 TARGETING_MONTE_CARLO],
+                        help="targeting modes of both Ai players")
+    parser.add_argument("--fleet", type=int, nargs="+", default=None,
+                        help="sizes of warships e.g. 4 3 3 2 2 2 1 1 1 1")
+    parser.add_argument("--heatmap-cache", default=None,
+                        help="path of the cache of initial heatmap scores, "
+                        "built if it doesn't contain the board yet")
+    args = parser.parse_args()
+    if args.heatmap_cache:
+        fleet = args.fleet or default_fleet(
+            args.size, min(args.size, MAX_NUM_OF_WARSHIPS))
+        cached = False
+        if exists(args.heatmap_cache):
+            with HeatmapCache(args.heatmap_cache) as cache:
+                cached = cache.get(args.size, fleet) is not None
+        if not cached:
+            build_heatmap_cache(args.heatmap_cache, [(args.size, fleet)])
+    start = perf_counter()
+    stats = run_tournament(args.size, args.games, args.seed,
+                           args.workers, args.shards, tuple(args.targeting),
+                           args.fleet, args.heatmap_cache)
+    elapsed = perf_counter() - start
+    print(stats)
+    print(f"time: {elapsed:.2f}s ({stats.games / elapsed:.0f} games/s)")
+
+
+if __name__ == "__main__":
+    main()
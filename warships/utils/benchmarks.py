@@ -0,0 +1,343 @@
+import json
+from random import Random
+from time import perf_counter
+from classes.board import Board
+from classes.player import Player, Ai
+from utils.board_io import print_board_io
+from utils.consts import MAX_NUM_OF_WARSHIPS, BENCHMARK_MIN_TIME
+
+
+CALIBRATION_SIZE = 1000
+
+
+def _fleet_board(size: int, random: Random) -> Board:
+    """
+    Returns a board of a specified size with the default fleet drawn
+
+    :param size: board's size
+    :type size: int
+
+    :param random: random number generator
+    :type random: Random
+    """
+    board = Board(size, min(size, MAX_NUM_OF_WARSHIPS), random)
+    board.draw_locations()
+    return board
+
+
+def _bench_board_hit(size: int, random: Random):
+    """
+    Hitting every location of a board with a fleet, per hit
+    """
+    board = _fleet_board(size, random)
+    locations = board.all_locations()
+    random.shuffle(locations)
+
+    def run() -> int:
+        for location in locations:
+            board.hit(location)
+        return len(locations)
+    return run
+
+
+def _bench_board_draw_locations(size: int, random: Random):
+    """
+    Creating a board and drawing locations of its fleet
+    """
+    def run() -> int:
+        _fleet_board(size, random)
+        return 1
+    return run
+
+
+def _bench_board_available_locations(size: int, random: Random):
+    """
+    Listing available locations of the biggest warship
+    in both directions next to a placed warship
+    """
+    board = Board(size, min(size, MAX_NUM_OF_WARSHIPS), random)
+    warship_size = board.fleet[0]
+    board.add_warship(board.draw_location(warship_size))
+
+    def run() -> int:
+        board.get_available_locations_horizontal(warship_size)
+        board.get_available_locations_vertical(warship_size)
+        return 1
+    return run
+
+
+def _bench_ai_turn(size: int, random: Random):
+    """
+    Ai's turns (smart_hit() and set_next_hit()) until it sinks
+    the fleet or makes 200 hits, per turn
+    """
+    board = _fleet_board(size, random)
+    ai = Ai(Board(size, min(size, MAX_NUM_OF_WARSHIPS)), random)
+
+    def run() -> int:
+        turns = 0
+        while not board.all_sunk() and turns < 200:
+            ai.set_next_hit(board.resolve_hit(ai.smart_hit()))
+            turns += 1
+        return turns
+    return run
+
+
+def _bench_player_place_options(size: int, random: Random):
+    """
+    Building options presented to the user placing
+    the biggest warship on an empty board
+    """
+    player = Player(Board(size, min(size, MAX_NUM_OF_WARSHIPS), random))
+    warship_size = player.board.fleet[0]
+
+    def run() -> int:
+        player.placement_options(warship_size)
+        return 1
+    return run
+
+
+def _bench_print_board_io(size: int, random: Random):
+    """
+    Rendering a board with a fleet and a hit per row
+    with print_board_io()
+    """
+    board = _fleet_board(size, random)
+    warships = [block for warship in board.placed_warships()
+                for block in warship.blocks]
+    hits = random.sample(board.all_locations(), size)
+
+    def run() -> int:
+        print_board_io(size, warships, hits, True)
+        return 1
+    return run
+
+
+def _bench_board_render(size: int, random: Random):
+    """
+    A hit followed by an incremental render of the board, per hit
+    """
+    board = _fleet_board(size, random)
+    locations = random.sample(board.all_locations(), size)
+
+    def run() -> int:
+        for location in locations:
+            board.resolve_hit(location)
+            board.print_board(True)
+        return len(locations)
+    return run
+
+
+def _calibration(size: int, random: Random):
+    """
+    Pure Python work independent of the engine: sorting a shuffled list
+    of integers and summing their set bits, per integer.\n
+    Other benchmarks are compared with it, so that their baseline
+    doesn't depend on the speed of the machine.
+    """
+    numbers = list(range(CALIBRATION_SIZE))
+    random.shuffle(numbers)
+
+    def run() -> int:
+        total = 0
+        for number in sorted(numbers):
+            total += number.bit_count()
+        return len(numbers)
+    return run
+
+
+BENCHMARKS = {
+    "board.hit": _bench_board_hit,
+    "board.draw_locations": _bench_board_draw_locations,
+    "board.get_available_locations": _bench_board_available_locations,
+    "ai.turn": _bench_ai_turn,
+    "player.placement_options": _bench_player_place_options,
+    "print_board_io": _bench_print_board_io,
+    "board.print_board": _bench_board_render,
+}
+
+
+def time_benchmark(name: str, size: int, repeat: int = 5, seed: int = 0,
+                   min_time: float = BENCHMARK_MIN_TIME) -> float:
+    """
+    Returns the shortest time in seconds of a single operation
+    of a benchmark, measured a number of times.\n
+    Every measurement runs the benchmark, every time on a freshly
+    prepared board, until it has taken at least min_time seconds
+    (not counting the preparation), and divides the total time
+    by the number of operations
+
+    :param name: benchmark's name, one of the BENCHMARKS' keys
+    :type name: str
+
+    :param size: board's size
+    :type size: int
+
+    :param repeat: number of measurements, defaults to 5
+    :type repeat: int
+
+    :param seed: seed of the random number generator, defaults to 0
+    :type seed: int
+
+    :param min_time: minimum duration of a measurement in seconds,
+    defaults to BENCHMARK_MIN_TIME
+    :type min_time: float
+    """
+    return _measure(BENCHMARKS[name], size, repeat, seed, min_time)
+
+
+def time_calibration(repeat: int = 5, seed: int = 0,
+                     min_time: float = BENCHMARK_MIN_TIME) -> float:
+    """
+    Returns the shortest time in seconds of a single operation
+    of the calibration benchmark, measured the same way as others
+
+    :param repeat: number of measurements, defaults to 5
+    :type repeat: int
+
+    :param seed: seed of the random number generator, defaults to 0
+    :type seed: int
+
+    :param min_time: minimum duration of a measurement in seconds,
+    defaults to BENCHMARK_MIN_TIME
+    :type min_time: float
+    """
+    return _measure(_calibration, 0, repeat, seed, min_time)
+
+
+def _measure(prepare, size: int, repeat: int, seed: int,
+             min_time: float) -> float:
+    """
+    Returns the shortest time in seconds of a single operation
+    of a benchmark prepared by a factory, see time_benchmark()
+
+    :param prepare: factory returning the benchmark's run() function
+    :type prepare: Callable
+
+    :param size: board's size
+    :type size: int
+
+    :param repeat: number of measurements
+    :type repeat: int
+
+    :param seed: seed of the random number generator
+    :type seed: int
+
+    :param min_time: minimum duration of a measurement in seconds
+    :type min_time: float
+    """
+    random = Random(seed)
+    best = None
+    for _ in range(repeat):
+        elapsed = 0.0
+        operations = 0
+        while True:
+            run = prepare(size, random)
+            start = perf_counter()
+            operations += run()
+            elapsed += perf_counter() - start
+            if elapsed >= min_time:
+                break
+        elapsed /= max(1, operations)
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def run_benchmarks(sizes: list[int], names: list[str] = None,
+                   repeat: int = 5,
+                   min_time: float = BENCHMARK_MIN_TIME) -> dict[str, float]:
+    """
+    Returns times of single operations of benchmarks at
+    specified board sizes, keyed by name@size e.g. ai.turn@26
+
+    :param sizes: boards' sizes
+    :type sizes: list[int]
+
+    :param names: names of benchmarks, defaults to None (all of them)
+    :type names: list[str]
+
+    :param repeat: number of measurements of every benchmark,
+    defaults to 5
+    :type repeat: int
+
+    :param min_time: minimum duration of a measurement in seconds,
+    defaults to BENCHMARK_MIN_TIME
+    :type min_time: float
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        for size in sizes:
+            results[f"{name}@{size}"] = time_benchmark(
+                name, size, repeat, min_time=min_time)
+    return results
+
+
+def relative_to(results: dict[str, float],
+                calibration: float) -> dict[str, float]:
+    """
+    Returns times of benchmarks as multiples of the time of
+    the calibration benchmark measured in the same session,
+    which can be compared across machines
+
+    :param results: measured times keyed by name@size
+    :type results: dict[str, float]
+
+    :param calibration: time of a single calibration operation
+    :type calibration: float
+    """
+    return {key: elapsed / calibration for key, elapsed in results.items()}
+
+
+def find_regressions(results: dict[str, float], baseline: dict[str, float],
+                     threshold: float) -> dict[str, float]:
+    """
+    Returns relative slowdowns of benchmarks, that are slower than
+    their baseline by more than the threshold e.g. 0.5 -> 50% slower.\n
+    Benchmarks missing from the baseline are skipped.\n
+    Both results and the baseline have to be in the same units,
+    usually relative to the calibration benchmark.
+
+    :param results: measured times keyed by name@size
+    :type results: dict[str, float]
+
+    :param baseline: baseline times keyed by name@size
+    :type baseline: dict[str, float]
+
+    :param threshold: allowed relative slowdown e.g. 0.25
+    :type threshold: float
+    """
+    regressions = {}
+    for key, elapsed in results.items():
+        expected = baseline.get(key)
+        if expected and elapsed > expected * (1 + threshold):
+            regressions[key] = elapsed / expected - 1
+    return regressions
+
+
+def load_baseline(path: str) -> dict[str, float]:
+    """
+    Returns baseline times stored in a JSON file,
+    relative to the calibration benchmark
+
+    :param path: path of the baseline file
+    :type path: str
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def save_baseline(path: str, results: dict[str, float]) -> None:
+    """
+    Stores measured times as the baseline in a JSON file
+
+    :param path: path of the baseline file
+    :type path: str
+
+    :param results: measured times keyed by name@size,
+    relative to the calibration benchmark
+    :type results: dict[str, float]
+    """
+    with open(path, "w") as file:
+        json.dump(results, file, indent=4, sort_keys=True)
+        file.write("\n")
@@ -0,0 +1,135 @@
+def run_mask(length: int, start: int = 0) -> int:
+    """
+    Returns a mask of `length` consecutive bits starting at `start`
+    e.g. run_mask(3, 1) -> 0b1110
+
+    :param length: number of set bits
+    :type length: int
+
+    :param start: index of the lowest set bit
+    :type start: int
+    """
+    return ((1 << length) - 1) << start
+
+
+def locations_masks(locations: list[tuple[int, int]]) -> dict[int, int]:
+    """
+    Returns a mask of passed locations split into rows,
+    bit y of masks[x] is set if (x, y) is one of the locations.
+
+    :param locations: list of coordinates
+    :type locations: list[tuple[int, int]]
+    """
+    masks = {}
+    for x, y in locations:
+        masks[x] = masks.get(x, 0) | (1 << y)
+    return masks
+
+
+def window_starts(line: int, length: int, size: int) -> int:
+    """
+    Returns a mask of all start positions of `length` consecutive
+    free bits within a line of `size` bits, bit i is set if
+    bits i..i+length-1 are all clear in the line.
+
+    :param line: mask of occupied bits in a line
+    :type line: int
+
+    :param length: length of the window
+    :type length: int
+
+    :param size: number of bits in the line
+    :type size: int
+    """
+    if length > size:
+        return 0
+    free = ~line & run_mask(size)
+    starts = free
+    for shift in range(1, length):
+        starts &= free >> shift
+    return starts & run_mask(size - length + 1)
+
+
+def iter_bits(mask: int):
+    """
+    Yields indexes of all set bits of the mask in ascending order
+
+    :param mask: bit mask
+    :type mask: int
+    """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def spread(starts: int, length: int) -> int:
+    """
+    Returns a mask of all bits covered by windows of `length` bits
+    starting at the set bits of `starts`
+
+    :param starts: mask of windows' start positions
+    :type starts: int
+
+    :param length: length of the windows
+    :type length: int
+    """
+    covered = 0
+    for shift in range(length):
+        covered |= starts << shift
+    return covered
+
+
+def nth_bit(mask: int, n: int) -> int:
+    """
+    Returns the index of the n-th (counting from 0) lowest set bit
+    of the mask.\n
+    Raises IndexError if the mask has n or fewer set bits.
+
+    :param mask: bit mask
+    :type mask: int
+
+    :param n: number of lower set bits to be skipped
+    :type n: int
+    """
+    if n < 0 or mask.bit_count() <= n:
+        raise IndexError(n)
+    low, high = 0, mask.bit_length()
+    while high - low > 1:
+        middle = (low + high) // 2
+        count = (mask & run_mask(middle - low, low)).bit_count()
+        if n < count:
+            high = middle
+        else:
+            n -= count
+            low = middle
+    return low
+
+
+def start_masks(rows: list[int], length: int,
+                size: int) -> tuple[list[int], list[int]]:
+    """
+    Returns masks of start positions of all free windows of `length`
+    consecutive bits going along and across the rows of a bitboard,
+    as a tuple (vertical, horizontal), where bit y of vertical[x]
+    is set if bits y of rows x..x+length-1 are all clear and
+    bit y of horizontal[x] is set if bits y..y+length-1 of row x are clear
+
+    :param rows: bitboard of occupied bits, split into rows
+    :type rows: list[int]
+
+    :param length: length of the windows
+    :type length: int
+
+    :param size: number of rows and bits in every row
+    :type size: int
+    """
+    full = run_mask(size)
+    vertical = [0] * size
+    for x in range(size - length + 1):
+        taken = 0
+        for row in rows[x:x+length]:
+            taken |= row
+        vertical[x] = ~taken & full
+    horizontal = [window_starts(row, length, size) for row in rows]
+    return vertical, horizontal
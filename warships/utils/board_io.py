@@ -1,16 +1,95 @@
 from classes.warship import Warship
+from utils.consts import VIEWPORT_SIZE
 
 
-def print_labels_horizontal_io(size: int) -> str:
+def column_label(x: int) -> str:
+    """
+    Returns the label of a column in the form of
+    A, B, ..., Z, AA, AB, ..., e.g. 0 -> A, 26 -> AA
+
+    :param x: index of the column
+    :type x: int
+    """
+    label = ""
+    x += 1
+    while x > 0:
+        x, letter = divmod(x - 1, 26)
+        label = chr(letter+65) + label
+    return label
+
+
+def column_index(label: str) -> int:
+    """
+    Returns the index of a column with a specified label,
+    letters' case is ignored, e.g. A -> 0, aa -> 26.\n
+    Raises ValueError if the label isn't made of latin letters only.
+
+    :param label: label of the column
+    :type label: str
+    """
+    if not label or not label.isascii() or not label.isalpha():
+        raise ValueError(label)
+    x = 0
+    for letter in label.upper():
+        x = x * 26 + ord(letter) - 64
+    return x - 1
+
+
+def row_label_width(size: int) -> int:
+    """
+    Returns the width of row labels for a board of a specified size,
+    at least 2 characters
+
+    :param size: board's size
+    :type size: int
+    """
+    return max(2, len(str(size - 1)))
+
+
+def viewport_around(size: int, location: tuple[int, int],
+                    span: int = VIEWPORT_SIZE) -> tuple[int, int, int, int]:
+    """
+    Returns a square viewport (x, y, width, height) of at most
+    span columns and rows, centered on a location
+    and shifted to fit within the board
+
+    :param size: board's size
+    :type size: int
+
+    :param location: coordinates of the viewport's center
+    :type location: tuple[int, int]
+
+    :param span: maximal number of columns and rows,
+    defaults to VIEWPORT_SIZE
+    :type span: int
+    """
+    span = min(span, size)
+    x, y = location
+    x = min(max(0, x - span // 2), size - span)
+    y = min(max(0, y - span // 2), size - span)
+    return x, y, span, span
+
+
+def print_labels_horizontal_io(size: int, first: int = 0,
+                               count: int = None) -> str:
     """
     Returns horizontal labels in the form of
     A B C D ..., depending on the board's size.
 
     :param size: board's size
     :type size: int
+
+    :param first: index of the first labeled column, defaults to 0
+    :type first: int
+
+    :param count: number of labeled columns, defaults to None (all)
+    :type count: int
     """
-    labels_horizontal = [chr(num+65) for num in range(0, size)]
-    labels_horizontal_as_str = "   "
+    if count is None:
+        count = size - first
+    labels_horizontal = [column_label(num)
+                         for num in range(first, first + count)]
+    labels_horizontal_as_str = " " * (row_label_width(size) + 1)
     for letter in labels_horizontal:
         labels_horizontal_as_str += f"{letter:^3}"
     return labels_horizontal_as_str
@@ -40,8 +119,9 @@ def print_board_io(size: int, locations_warships: list[tuple[int, int]],
     """
     board_str = print_labels_horizontal_io(size)
     board_str += "\n"
+    width = row_label_width(size)
     for index in range(size):
-        board_str += f"{index:<2} "
+        board_str += f"{index:<{width}} "
         for index_inner in range(size):
             if (index_inner, index) not in locations_warships:
                 if (index_inner, index) not in locations_hit:
@@ -59,6 +139,41 @@ def print_board_io(size: int, locations_warships: list[tuple[int, int]],
     return board_str
 
 
+def overlay_io(board_str: str, size: int, blocks: list[tuple[int, int]],
+               viewport: tuple[int, int, int, int], symbol: str) -> str:
+    """
+    Returns a board's string representation, rendered within a viewport,
+    with the cells of specified blocks replaced by a symbol.\n
+    Blocks outside the viewport are skipped.
+
+    :param board_str: board's string representation within the viewport
+    :type board_str: str
+
+    :param size: board's size
+    :type size: int
+
+    :param blocks: coordinates of the replaced cells
+    :type blocks: list[tuple[int, int]]
+
+    :param viewport: rendered part of the board (x, y, width, height)
+    :type viewport: tuple[int, int, int, int]
+
+    :param symbol: symbol of the replaced cells e.g. [*]
+    :type symbol: str
+    """
+    first_x, first_y, width, height = viewport
+    lines = board_str.split("\n")
+    offset = row_label_width(size) + 1
+    for x, y in blocks:
+        if not (first_x <= x < first_x + width
+                and first_y <= y < first_y + height):
+            continue
+        line = lines[y - first_y + 1]
+        start = offset + (x - first_x) * 3
+        lines[y - first_y + 1] = line[:start] + symbol + line[start+3:]
+    return "\n".join(lines)
+
+
 def print_warships_io(warships: list[Warship]) -> str:
     """
     Returns a string representation of all warships and
@@ -68,20 +183,32 @@ def print_warships_io(warships: list[Warship]) -> str:
     :param warships: list of warships
     :type warships: list[Warship]
     """
-    warships_sizes = [
-        warship.size for warship in warships if not warship.was_sunk()]
-    warships_sizes_dict = {size: warships_sizes.count(
-        size) for size in warships_sizes}
+    warships_sizes_dict = {}
+    for warship in warships:
+        if not warship.was_sunk():
+            warships_sizes_dict[warship.size] = (
+                warships_sizes_dict.get(warship.size, 0) + 1)
+    return format_warships_io(warships_sizes_dict)
+
+
+def format_warships_io(warships_sizes: dict[int, int]) -> str:
+    """
+    Returns a string representation of numbers of warships
+    of particular sizes e.g. {1: 1} -> 1 mast warship: x1
+
+    :param warships_sizes: number of warships of every size
+    :type warships_sizes: dict[int, int]
+    """
     warship_str = ""
-    for size in warships_sizes_dict:
-        warship_str += f"{size} mast warship: x{warships_sizes_dict[size]}\n"
+    for size, count in warships_sizes.items():
+        warship_str += f"{size} mast warship: x{count}\n"
     return warship_str
 
 
-def print_hit_warships_io(was_hit: bool, was_sunk: bool,
-                          warship: Warship = None) -> None:
+def format_hit_warships_io(was_hit: bool, was_sunk: bool,
+                           warship: Warship = None) -> str:
     """
-    Presents an appropriate message depending on the
+    Returns an appropriate message depending on the
     result of the hit\n
 
     :param was_hit: indicates whether the warship was hit
@@ -97,14 +224,200 @@ def print_hit_warships_io(was_hit: bool, was_sunk: bool,
     """
     match was_hit, was_sunk:
         case True, True:
-            print(f"{str(warship)} sunk")
-            return
+            return f"{str(warship)} sunk"
         case True, False:
-            print(f"{str(warship)} hit")
-            return
-        case False, False:
+            return f"{str(warship)} hit"
+        case _:
             if warship == 0:
-                print("You've already hit here before")
-            else:
-                print("Miss")
+                return "You've already hit here before"
+            return "Miss"
+
+
+EMPTY = 0
+WARSHIP = 1
+MISS = 2
+HIT = 3
+CELLS = {
+    False: ("[ ]", "[ ]", "[#]", "[x]"),
+    True: ("[ ]", "[o]", "[#]", "[x]"),
+}
+
+
+class BoardRenderer():
+    """
+    BoardRenderer class. Incremental version of print_board_io(),
+    keeps the state of every cell and the rendered rows, so that
+    only rows with changed cells are rendered again. Contains attributes:
+
+    :param size: board's size
+    :type size: int
+
+    :param states: states of all non-empty cells (WARSHIP, MISS or HIT),
+    indexed by y * size + x, so that large boards stay sparse
+    :type states: dict[int, int]
+
+    :param frames: rendered rows of the whole board for hidden
+    and visible warships, None until the first full render
+    :type frames: dict[bool, list[str]]
+
+    :param cells: rendered cells of every row, for hidden and visible
+    warships
+    :type cells: dict[bool, list[list[str]]]
+
+    :param dirty: indexes of rows changed since the last render,
+    for hidden and visible warships
+    :type dirty: dict[bool, set[int]]
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Creates an instance of the BoardRenderer class
+        for an empty board.
+
+        :param size: board's size
+        :type size: int
+        """
+        self.__size = size
+        self.__states = {}
+        self.__frames = {False: None, True: None}
+        self.__cells = {False: None, True: None}
+        self.__dirty = {False: set(), True: set()}
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def state(self, location: tuple[int, int]) -> int:
+        """
+        Returns the state of a cell
+
+        :param location: coordinates of the cell
+        :type location: tuple[int, int]
+        """
+        x, y = location
+        return self.__states.get(y * self.__size + x, EMPTY)
+
+    def set_state(self, location: tuple[int, int], state: int) -> None:
+        """
+        Changes the state of a cell, its row will be rendered again
+
+        :param location: coordinates of the cell
+        :type location: tuple[int, int]
+
+        :param state: new state (EMPTY, WARSHIP, MISS or HIT)
+        :type state: int
+        """
+        x, y = location
+        index = y * self.__size + x
+        if self.__states.get(index, EMPTY) == state:
             return
+        if state == EMPTY:
+            del self.__states[index]
+        else:
+            self.__states[index] = state
+        for show_warships, cells in self.__cells.items():
+            if cells is not None:
+                cells[y][x] = CELLS[show_warships][state]
+                self.__dirty[show_warships].add(y)
+
+    def render(self, show_warships: bool = False,
+               viewport: tuple[int, int, int, int] = None) -> str:
+        """
+        Returns the board's string representation, the same as
+        print_board_io() does.\n
+        The whole frame is rendered only once, later only changed rows.\n
+        A viewport is rendered from scratch, it costs only as much
+        as the number of its cells.
+
+        :param show_warships: indicates whether warships should be visible
+        :type show_warships: bool
+
+        :param viewport: rendered part of the board (x, y, width, height),
+        defaults to None (the whole board)
+        :type viewport: tuple[int, int, int, int]
+        """
+        show_warships = bool(show_warships)
+        if viewport is not None:
+            return self._render_viewport(show_warships, viewport)
+        frame = self.__frames[show_warships]
+        if frame is None:
+            frame = self._render_frame(show_warships)
+        for y in self.__dirty[show_warships]:
+            frame[y + 1] = self._render_row(
+                y, self.__cells[show_warships][y])
+        self.__dirty[show_warships].clear()
+        return "\n".join(frame) + "\n"
+
+    def write(self, stream, show_warships: bool = False,
+              viewport: tuple[int, int, int, int] = None) -> None:
+        """
+        Writes the board's string representation to a stream
+
+        :param stream: text stream e.g. sys.stdout
+        :type stream: TextIO
+
+        :param show_warships: indicates whether warships should be visible
+        :type show_warships: bool
+
+        :param viewport: rendered part of the board (x, y, width, height),
+        defaults to None (the whole board)
+        :type viewport: tuple[int, int, int, int]
+        """
+        stream.write(self.render(show_warships, viewport))
+
+    def _render_frame(self, show_warships: bool) -> list[str]:
+        """
+        Renders all rows of the board
+
+        :param show_warships: indicates whether warships should be visible
+        :type show_warships: bool
+        """
+        size = self.__size
+        symbols = CELLS[show_warships]
+        states = self.__states
+        cells = [[symbols[states.get(y * size + x, EMPTY)]
+                  for x in range(size)] for y in range(size)]
+        frame = [print_labels_horizontal_io(size)]
+        frame.extend(self._render_row(y, row) for y, row in enumerate(cells))
+        self.__cells[show_warships] = cells
+        self.__frames[show_warships] = frame
+        self.__dirty[show_warships].clear()
+        return frame
+
+    def _render_row(self, y: int, cells: list[str]) -> str:
+        """
+        Renders a single row of the board
+
+        :param y: index of the row
+        :type y: int
+
+        :param cells: rendered cells of the row
+        :type cells: list[str]
+        """
+        return f"{y:<{row_label_width(self.__size)}} " + "".join(cells)
+
+    def _render_viewport(self, show_warships: bool,
+                         viewport: tuple[int, int, int, int]) -> str:
+        """
+        Renders a part of the board, labeled with
+        the original columns' and rows' labels
+
+        :param show_warships: indicates whether warships should be visible
+        :type show_warships: bool
+
+        :param viewport: rendered part of the board (x, y, width, height)
+        :type viewport: tuple[int, int, int, int]
+        """
+        size = self.__size
+        symbols = CELLS[show_warships]
+        states = self.__states
+        first_x, first_y, width, height = viewport
+        last_x = min(size, first_x + width)
+        last_y = min(size, first_y + height)
+        first_x, first_y = max(0, first_x), max(0, first_y)
+        frame = [print_labels_horizontal_io(size, first_x, last_x - first_x)]
+        for y in range(first_y, last_y):
+            frame.append(self._render_row(y, [
+                symbols[states.get(y * size + x, EMPTY)]
+                for x in range(first_x, last_x)]))
+        return "\n".join(frame) + "\n"
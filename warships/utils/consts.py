@@ -1,2 +1,20 @@
 MAX_NUM_OF_WARSHIPS = 5
-MAX_BOARD_SIZE = 26
+MAX_BOARD_SIZE = 1000
+VIEWPORT_SIZE = 26
+TARGETING_RANDOM = "random"
+TARGETING_HEATMAP = "heatmap"
+HEATMAP_HIT_WEIGHT = 50
+PLACEMENT_PICK = "pick"
+PLACEMENT_TYPED = "typed"
+PLACEMENT_CURSOR = "cursor"
+MAX_PICK_BOARD_SIZE = 10
+GAME_LOG_PATH = "games.log"
+PROFILE_ENV_VAR = "WARSHIPS_PROFILE"
+TARGETING_MONTE_CARLO = "monte_carlo"
+MONTE_CARLO_SAMPLES = 200
+PLACEMENT_TABLE_CACHE_SIZE = 64
+MAX_PLACEMENT_TABLE_BOARD_SIZE = 64
+FLEET_SOLVER_MAX_NODES = 100000
+BENCHMARK_MIN_TIME = 0.1
+TOURNAMENT_SHARD_GAMES = 20
+FLEET_SOLVER_FIRST_PASS_NODES = 1000
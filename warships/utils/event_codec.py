@@ -0,0 +1,176 @@
+START = 0
+PLACEMENT = 1
+SHOT = 2
+
+
+def write_varint(buffer: bytearray, value: int) -> None:
+    """
+    Appends a non-negative integer to a buffer, encoded with 7 bits
+    per byte, the highest bit is set in all bytes but the last one
+    e.g. 300 -> b"\xac\x02"
+
+    :param buffer: buffer, the encoded value is appended to
+    :type buffer: bytearray
+
+    :param value: non-negative integer
+    :type value: int
+    """
+    while value > 0x7f:
+        buffer.append(value & 0x7f | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """
+    Returns an integer encoded by write_varint() at an offset
+    together with the offset of the next value.\n
+    Raises ValueError if the data ends before the integer does.
+
+    :param data: encoded data
+    :type data: bytes
+
+    :param offset: offset of the encoded integer
+    :type offset: int
+    """
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ValueError("Truncated event")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_start(buffer: bytearray, board_size: int,
+                 fleet: list[int]) -> None:
+    """
+    Appends the start of a game to a buffer:
+    its board's size and fleet
+
+    :param buffer: buffer, the event is appended to
+    :type buffer: bytearray
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param fleet: sizes of both players' warships
+    :type fleet: list[int]
+    """
+    write_varint(buffer, START)
+    write_varint(buffer, board_size)
+    write_varint(buffer, len(fleet))
+    for warship_size in fleet:
+        write_varint(buffer, warship_size)
+
+
+def encode_placement(buffer: bytearray, board_size: int, side: int,
+                     x: int, y: int, vertical: bool,
+                     warship_size: int) -> None:
+    """
+    Appends a placement of a straight warship to a buffer,
+    the first block, direction and side are packed into a single integer
+
+    :param buffer: buffer, the event is appended to
+    :type buffer: bytearray
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param side: side owning the board, 0 or 1
+    :type side: int
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+
+    :param warship_size: size of the warship
+    :type warship_size: int
+    """
+    cell = x * board_size + y
+    write_varint(buffer, (((cell << 1 | vertical) << 1 | side) << 2)
+                 | PLACEMENT)
+    write_varint(buffer, warship_size)
+
+
+def encode_shot(buffer: bytearray, board_size: int, side: int,
+                location: tuple[int, int],
+                hit_result: tuple[bool, bool, int]) -> None:
+    """
+    Appends a shot and its result to a buffer, the location, side and
+    result flags are packed into a single integer, the hit warship's size
+    follows only if the shot was successful
+
+    :param buffer: buffer, the event is appended to
+    :type buffer: bytearray
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param side: shooting side, 0 or 1
+    :type side: int
+
+    :param location: coordinates of the shot
+    :type location: tuple[int, int]
+
+    :param hit_result: result of the shot (was_hit, was_sunk, size)
+    :type hit_result: tuple[bool, bool, int]
+    """
+    x, y = location
+    was_hit, was_sunk, warship_size = hit_result
+    cell = x * board_size + y
+    write_varint(buffer, ((((cell << 1 | side) << 1 | was_hit) << 1
+                           | was_sunk) << 2) | SHOT)
+    if was_hit:
+        write_varint(buffer, warship_size)
+
+
+def decode_events(data: bytes):
+    """
+    Yields events encoded in the data as tuples:\n
+    (START, board_size, fleet)\n
+    (PLACEMENT, side, x, y, vertical, warship_size)\n
+    (SHOT, side, location, hit_result)\n
+    Raises ValueError if the data is malformed.
+
+    :param data: encoded events
+    :type data: bytes
+    """
+    offset = 0
+    board_size = None
+    while offset < len(data):
+        code, offset = read_varint(data, offset)
+        kind = code & 3
+        code >>= 2
+        if kind == START and not code:
+            board_size, offset = read_varint(data, offset)
+            count, offset = read_varint(data, offset)
+            fleet = []
+            for _ in range(count):
+                warship_size, offset = read_varint(data, offset)
+                fleet.append(warship_size)
+            yield START, board_size, tuple(fleet)
+        elif board_size is None or kind not in (PLACEMENT, SHOT):
+            raise ValueError("Invalid event")
+        elif kind == PLACEMENT:
+            warship_size, offset = read_varint(data, offset)
+            x, y = divmod(code >> 2, board_size)
+            yield PLACEMENT, code & 1, x, y, bool(code >> 1 & 1), warship_size
+        else:
+            was_sunk = bool(code & 1)
+            was_hit = bool(code >> 1 & 1)
+            warship_size = 0
+            if was_hit:
+                warship_size, offset = read_varint(data, offset)
+            x, y = divmod(code >> 3, board_size)
+            yield SHOT, code >> 2 & 1, (x, y), (was_hit, was_sunk,
+                                                 warship_size)
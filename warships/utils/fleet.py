@@ -0,0 +1,32 @@
+from .consts import MAX_NUM_OF_WARSHIPS
+
+
+def default_fleet(board_size: int, num_warships: int) -> list[int]:
+    """
+    Returns sizes of a specified number of warships placed on a board
+    by default: the biggest one is either MAX_NUM_OF_WARSHIPS
+    or board's size mast, every next one is one mast smaller,
+    those that don't fit are 1 mast warships e.g. (6, 7) -> [5,4,3,2,1,1,1]
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param num_warships: number of warships
+    :type num_warships: int
+    """
+    biggest = min(board_size, MAX_NUM_OF_WARSHIPS)
+    return [max(1, biggest - index) for index in range(num_warships)]
+
+
+def fleet_types(fleet: list[int]) -> dict[int, int]:
+    """
+    Returns counts of warships of particular sizes,
+    ordered from the biggest size e.g. [1,2,1] -> {2: 1, 1: 2}
+
+    :param fleet: sizes of warships
+    :type fleet: list[int]
+    """
+    types = {}
+    for size in sorted(fleet, reverse=True):
+        types[size] = types.get(size, 0) + 1
+    return types
@@ -0,0 +1,187 @@
+from random import Random
+from time import perf_counter
+from .bitboard import run_mask, start_masks
+from .placements import PlacementSequence, placement_blocks
+
+
+def _covering_options(rows: list[int], warship_size: int, x: int, y: int,
+                      size: int) -> list[tuple[int, int, bool]]:
+    """
+    Returns placements (x, y, vertical) of a warship covering a location,
+    that don't overlap any occupied location
+
+    :param rows: bitboard of occupied locations, split into rows
+    :type rows: list[int]
+
+    :param warship_size: size of the warship
+    :type warship_size: int
+
+    :param x: horizontal axis coordinate of the covered location
+    :type x: int
+
+    :param y: vertical axis coordinate of the covered location
+    :type y: int
+
+    :param size: board's size
+    :type size: int
+    """
+    options = []
+    for start in range(max(0, y - warship_size + 1),
+                       min(y, size - warship_size) + 1):
+        if not rows[x] & run_mask(warship_size, start):
+            options.append((x, start, False))
+    if warship_size == 1:
+        return options
+    bit = 1 << y
+    for start in range(max(0, x - warship_size + 1),
+                       min(x, size - warship_size) + 1):
+        if not any(row & bit for row in rows[start:start+warship_size]):
+            options.append((start, y, True))
+    return options
+
+
+def _occupy(rows: list[int], warship_size: int, x: int, y: int,
+            vertical: bool) -> None:
+    """
+    Marks locations of a warship as occupied
+
+    :param rows: bitboard of occupied locations, updated in place
+    :type rows: list[int]
+
+    :param warship_size: size of the warship
+    :type warship_size: int
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+    """
+    if vertical:
+        for row in range(x, x + warship_size):
+            rows[row] |= 1 << y
+    else:
+        rows[x] |= run_mask(warship_size, y)
+
+
+def sample_fleet(size: int, remaining: dict[int, int], blocked: list[int],
+                 hits: dict[int, list[tuple[int, int]]],
+                 random: Random) -> list[tuple[int, int, bool, int]]:
+    """
+    Returns a random arrangement of the remaining warships consistent
+    with the shots made so far, as placements (x, y, vertical, size),
+    None if the attempt failed.\n
+    Unresolved hits are covered first by warships of their sizes,
+    the rest of the warships is placed randomly, the largest first.
+
+    :param size: board's size
+    :type size: int
+
+    :param remaining: number of warships of every size, that haven't
+    been sunk yet
+    :type remaining: dict[int, int]
+
+    :param blocked: bitboard of locations, that cannot be occupied:
+    misses and blocks of sunk warships
+    :type blocked: list[int]
+
+    :param hits: unresolved hits assigned to the sizes of hit warships
+    :type hits: dict[int, list[tuple[int, int]]]
+
+    :param random: random number generator
+    :type random: Random
+    """
+    rows = list(blocked)
+    left = dict(remaining)
+    placements = []
+    hit_rows = {}
+    for warship_size, cells in hits.items():
+        masks = hit_rows.setdefault(warship_size, [0] * size)
+        for x, y in cells:
+            masks[x] |= 1 << y
+    for warship_size, cells in hits.items():
+        uncovered = set(cells)
+        while uncovered:
+            if not left.get(warship_size):
+                return None
+            forbidden = list(rows)
+            for other, masks in hit_rows.items():
+                if other != warship_size:
+                    forbidden = [row | mask for row, mask
+                                 in zip(forbidden, masks)]
+            x, y = random.choice(sorted(uncovered))
+            options = _covering_options(forbidden, warship_size, x, y, size)
+            if not options:
+                return None
+            start_x, start_y, vertical = random.choice(options)
+            _occupy(rows, warship_size, start_x, start_y, vertical)
+            uncovered.difference_update(placement_blocks(
+                start_x, start_y, vertical, warship_size))
+            left[warship_size] -= 1
+            placements.append((start_x, start_y, vertical, warship_size))
+    for warship_size in sorted(left, reverse=True):
+        for _ in range(left[warship_size]):
+            vertical, horizontal = start_masks(rows, warship_size, size)
+            if warship_size == 1:
+                vertical = [0] * size
+            sequence = PlacementSequence(vertical, horizontal)
+            if not len(sequence):
+                return None
+            x, y, is_vertical = sequence[random.randrange(len(sequence))]
+            _occupy(rows, warship_size, x, y, is_vertical)
+            placements.append((x, y, is_vertical, warship_size))
+    return placements
+
+
+def count_samples(size: int, remaining: dict[int, int], blocked: list[int],
+                  hits: dict[int, list[tuple[int, int]]], samples: int,
+                  seed: int, time_budget: float = None) -> tuple[
+                      int, list[int]]:
+    """
+    Samples arrangements of the remaining warships and returns
+    the number of successful samples together with the number of
+    samples covering every location, indexed by x * size + y.\n
+    Sampling stops early once the time budget is spent,
+    but at least one arrangement is always attempted.
+
+    :param size: board's size
+    :type size: int
+
+    :param remaining: number of warships of every size, that haven't
+    been sunk yet
+    :type remaining: dict[int, int]
+
+    :param blocked: bitboard of locations, that cannot be occupied
+    :type blocked: list[int]
+
+    :param hits: unresolved hits assigned to the sizes of hit warships
+    :type hits: dict[int, list[tuple[int, int]]]
+
+    :param samples: maximal number of attempted arrangements
+    :type samples: int
+
+    :param seed: seed of the random number generator
+    :type seed: int
+
+    :param time_budget: time budget in seconds, defaults to None
+    (no limit)
+    :type time_budget: float
+    """
+    random = Random(seed)
+    deadline = None if time_budget is None else perf_counter() + time_budget
+    counts = [0] * (size * size)
+    successful = 0
+    for _ in range(samples):
+        placements = sample_fleet(size, remaining, blocked, hits, random)
+        if placements is not None:
+            successful += 1
+            for x, y, vertical, warship_size in placements:
+                for block_x, block_y in placement_blocks(
+                        x, y, vertical, warship_size):
+                    counts[block_x * size + block_y] += 1
+        if deadline is not None and perf_counter() >= deadline:
+            break
+    return successful, counts
@@ -0,0 +1,423 @@
+from random import choice
+from .bitboard import run_mask, start_masks, spread
+from .placements import PlacementSequence
+from .consts import FLEET_SOLVER_MAX_NODES, FLEET_SOLVER_FIRST_PASS_NODES
+
+
+class FleetSolver():
+    """
+    FleetSolver class. Finds locations for a whole fleet of warships
+    by backtracking over occupancy bitboards.\n
+    The warship with the fewest available placements is placed first,
+    every placement is tried beginning with a randomly chosen one.
+    Placements that failed for a warship aren't tried again for
+    other warships of the same size, so that an impossible fleet
+    is rejected without trying its permutations, and branches, in which
+    the remaining warships cannot cover enough locations, are cut off.
+    Once there are fewer spare locations than rows, locations are decided
+    one by one instead, which settles tight fleets quickly.\n
+    The first pass of the search visits at most FLEET_SOLVER_FIRST_PASS_NODES
+    nodes, which is plenty for regular fleets. If it's spent, warships are
+    packed into free runs of rows and columns instead, which places dense
+    fleets, that fit, at once, and only if that fails, the search is run
+    again until max_nodes nodes are visited in total. A fleet, that isn't
+    placed by then, is reported as exhausted rather than impossible.
+    Contains attributes:
+
+    :param size: board's size
+    :type size: int
+
+    :param fleet: sizes of all warships to be placed
+    :type fleet: list[int]
+
+    :param rows: occupancy bitboard, bit y of rows[x] is set
+    if (x, y) is taken by a warship
+    :type rows: list[int]
+
+    :param remaining: number of warships of every size left to be placed
+    :type remaining: dict[int, int]
+
+    :param excluded: placements of every size known to fail,
+    as masks of their first blocks (vertical, horizontal)
+    :type excluded: dict[int, tuple[list[int], list[int]]]
+
+    :param placed: placements (x, y, vertical) chosen for every size
+    :type placed: dict[int, list[tuple[int, int, bool]]]
+
+    :param free: number of free locations
+    :type free: int
+
+    :param needed: number of locations needed by the remaining warships
+    :type needed: int
+
+    :param choose: function choosing a random element of a range
+    :type choose: Callable
+
+    :param max_nodes: maximal number of visited search nodes
+    :type max_nodes: int
+
+    :param nodes: number of search nodes visited so far
+    :type nodes: int
+
+    :param limit: number of search nodes, that may be visited
+    in the current pass
+    :type limit: int
+
+    :param exhausted: True if the search stopped because
+    the limit of search nodes was reached
+    :type exhausted: bool
+    """
+
+    def __init__(self, size: int, fleet: list[int],
+                 rows: list[int] = None, choose=None,
+                 max_nodes: int = FLEET_SOLVER_MAX_NODES) -> None:
+        """
+        Creates an instance of the FleetSolver class.
+
+        :param size: board's size
+        :type size: int
+
+        :param fleet: sizes of all warships to be placed
+        :type fleet: list[int]
+
+        :param rows: occupancy bitboard of warships already placed,
+        defaults to None (an empty board)
+        :type rows: list[int]
+
+        :param choose: function choosing a random element of a range,
+        defaults to None (random.choice)
+        :type choose: Callable
+
+        :param max_nodes: maximal number of visited search nodes,
+        defaults to FLEET_SOLVER_MAX_NODES
+        :type max_nodes: int
+        """
+        self.__size = size
+        self.__fleet = list(fleet)
+        self.__rows = list(rows) if rows is not None else [0] * size
+        self.__remaining = {}
+        for warship_size in sorted(fleet, reverse=True):
+            self.__remaining[warship_size] = (
+                self.__remaining.get(warship_size, 0) + 1)
+        self.__excluded = {warship_size: ([0] * size, [0] * size)
+                           for warship_size in self.__remaining}
+        self.__placed = {warship_size: [] for warship_size in self.__remaining}
+        self.__free = size * size - sum(row.bit_count() for row in self.__rows)
+        self.__needed = sum(fleet)
+        self.__choose = choose or choice
+        self.__max_nodes = max_nodes
+        self.__nodes = 0
+        self.__limit = min(max_nodes, FLEET_SOLVER_FIRST_PASS_NODES)
+        self.__exhausted = False
+
+    @property
+    def nodes(self) -> int:
+        return self.__nodes
+
+    @property
+    def exhausted(self) -> bool:
+        return self.__exhausted
+
+    def solve(self) -> list[tuple[int, int, bool]]:
+        """
+        Returns placements (x, y, vertical) of the first blocks
+        of all warships, ordered the same way as the fleet,
+        None if the fleet cannot be placed or no placement was found
+        within the budget of search nodes, in which case exhausted is True.\n
+        Can be called only once.
+        """
+        if not self._search():
+            if not self.__exhausted:
+                return None
+            self.__exhausted = False
+            if not self._pack():
+                self.__limit = self.__max_nodes
+                if not self._search():
+                    return None
+        placed = {warship_size: list(reversed(placements))
+                  for warship_size, placements in self.__placed.items()}
+        return [placed[warship_size].pop() for warship_size in self.__fleet]
+
+    def _start_masks(self, warship_size: int) -> tuple[list[int], list[int]]:
+        """
+        Returns masks of the first blocks of all placements of a specified
+        size, that are available and weren't excluded,
+        as a tuple (vertical, horizontal)
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        vertical, horizontal = start_masks(
+            self.__rows, warship_size, self.__size)
+        excluded_vertical, excluded_horizontal = self.__excluded[warship_size]
+        if warship_size == 1:
+            vertical = [0] * self.__size
+        else:
+            vertical = [mask & ~excluded for mask, excluded
+                        in zip(vertical, excluded_vertical)]
+        horizontal = [mask & ~excluded for mask, excluded
+                      in zip(horizontal, excluded_horizontal)]
+        return vertical, horizontal
+
+    def _cover(self, covered: list[int], warship_size: int,
+               vertical: list[int], horizontal: list[int]) -> None:
+        """
+        Marks all locations covered by the placements of a specified size
+
+        :param covered: bitboard of covered locations, updated in place
+        :type covered: list[int]
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param vertical: masks of vertical placements' first blocks
+        :type vertical: list[int]
+
+        :param horizontal: masks of horizontal placements' first blocks
+        :type horizontal: list[int]
+        """
+        for x, starts in enumerate(horizontal):
+            covered[x] |= spread(starts, warship_size)
+        for x, starts in enumerate(vertical):
+            if starts:
+                for row in range(x, x + warship_size):
+                    covered[row] |= starts
+
+    def _toggle(self, warship_size: int, x: int, y: int,
+                vertical: bool) -> None:
+        """
+        Places or removes a warship on the occupancy bitboard
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+
+        :param x: horizontal axis coordinate of the first block
+        :type x: int
+
+        :param y: vertical axis coordinate of the first block
+        :type y: int
+
+        :param vertical: True if the blocks go along the x axis
+        :type vertical: bool
+        """
+        if vertical:
+            for row in range(x, x + warship_size):
+                self.__rows[row] ^= 1 << y
+        else:
+            self.__rows[x] ^= run_mask(warship_size, y)
+
+    def _search(self) -> bool:
+        """
+        Places all remaining warships, returns False if it's impossible
+        or the budget of search nodes is spent
+        """
+        remaining = self.__remaining
+        if not remaining:
+            return True
+        if not self._visit():
+            return False
+        if self.__free < self.__needed:
+            return False
+        if self.__free - self.__needed < self.__size:
+            return self._search_first_free()
+        best_size, best = None, None
+        covered = [0] * self.__size
+        for warship_size, count in remaining.items():
+            masks = self._start_masks(warship_size)
+            sequence = PlacementSequence(*masks)
+            if len(sequence) < count:
+                return False
+            if best is None or len(sequence) < len(best):
+                best_size, best = warship_size, sequence
+            self._cover(covered, warship_size, *masks)
+        if sum(row.bit_count() for row in covered) < self.__needed:
+            return False
+        excluded_vertical, excluded_horizontal = self.__excluded[best_size]
+        saved = (list(excluded_vertical), list(excluded_horizontal))
+        self._take(best_size)
+        start = self.__choose(range(len(best)))
+        for x, y, vertical in best.rotated(start):
+            self._toggle(best_size, x, y, vertical)
+            self.__placed[best_size].append((x, y, vertical))
+            if self._search():
+                return True
+            self.__placed[best_size].pop()
+            self._toggle(best_size, x, y, vertical)
+            if self.__exhausted:
+                break
+            if vertical:
+                excluded_vertical[x] |= 1 << y
+            else:
+                excluded_horizontal[x] |= 1 << y
+        self._give_back(best_size)
+        excluded_vertical[:], excluded_horizontal[:] = saved
+        return False
+
+    def _search_first_free(self) -> bool:
+        """
+        Places all remaining warships on a nearly full board,
+        returns False if it's impossible.\n
+        The first free location has to be either left empty or
+        covered by a warship starting there, since all locations
+        before it are already decided.
+        """
+        if not self._visit():
+            return False
+        size = self.__size
+        full = run_mask(size)
+        x = 0
+        while not ~self.__rows[x] & full:
+            x += 1
+        free = ~self.__rows[x] & full
+        y = (free & -free).bit_length() - 1
+        options = []
+        for warship_size in self.__remaining:
+            excluded_vertical, excluded_horizontal = (
+                self.__excluded[warship_size])
+            if (warship_size > 1 and x + warship_size <= size
+                    and not excluded_vertical[x] >> y & 1
+                    and not any(row >> y & 1 for row
+                                in self.__rows[x:x+warship_size])):
+                options.append((warship_size, True))
+            window = run_mask(warship_size, y)
+            if (y + warship_size <= size
+                    and not excluded_horizontal[x] >> y & 1
+                    and not self.__rows[x] & window):
+                options.append((warship_size, False))
+        if options:
+            start = self.__choose(range(len(options)))
+            options = options[start:] + options[:start]
+        for warship_size, vertical in options:
+            self._take(warship_size)
+            self._toggle(warship_size, x, y, vertical)
+            self.__placed[warship_size].append((x, y, vertical))
+            if self._search():
+                return True
+            self.__placed[warship_size].pop()
+            self._toggle(warship_size, x, y, vertical)
+            self._give_back(warship_size)
+            if self.__exhausted:
+                return False
+        if self.__free == self.__needed:
+            return False
+        self.__rows[x] |= 1 << y
+        self.__free -= 1
+        solved = self._search()
+        self.__rows[x] ^= 1 << y
+        self.__free += 1
+        return solved
+
+    def _visit(self) -> bool:
+        """
+        Counts a visited search node, returns False and marks
+        the search as exhausted if the limit of search nodes is reached
+        """
+        if self.__nodes >= self.__limit:
+            self.__exhausted = True
+            return False
+        self.__nodes += 1
+        return True
+
+    def _pack(self) -> bool:
+        """
+        Places all remaining warships greedily, biggest first: free runs
+        of locations in rows taken in random order are filled from
+        their starts with the biggest warships fitting into them, warships
+        left over are placed the same way into runs in columns.\n
+        Returns False and leaves the board as it was if some warship
+        doesn't fit.
+        """
+        size = self.__size
+        full = run_mask(size)
+        sizes = sorted((warship_size for warship_size, count
+                        in self.__remaining.items() for _ in range(count)),
+                       reverse=True)
+        packed = []
+        for vertical in (False, True):
+            lines = list(range(size))
+            for index in range(size - 1, 0, -1):
+                other = self.__choose(range(index + 1))
+                lines[index], lines[other] = lines[other], lines[index]
+            for line in lines:
+                if vertical:
+                    free = 0
+                    for x, row in enumerate(self.__rows):
+                        free |= (~row >> line & 1) << x
+                else:
+                    free = ~self.__rows[line] & full
+                while free and sizes:
+                    start = (free & -free).bit_length() - 1
+                    end = start
+                    while free >> end & 1:
+                        end += 1
+                    free &= ~run_mask(end - start, start)
+                    index = 0
+                    while index < len(sizes) and start < end:
+                        warship_size = sizes[index]
+                        if warship_size > end - start:
+                            index += 1
+                            continue
+                        sizes.pop(index)
+                        x, y = (start, line) if vertical else (line, start)
+                        self._take(warship_size)
+                        self._toggle(warship_size, x, y, vertical)
+                        packed.append((warship_size, (x, y, vertical)))
+                        start += warship_size
+        if sizes:
+            for warship_size, (x, y, vertical) in packed:
+                self._toggle(warship_size, x, y, vertical)
+                self._give_back(warship_size)
+            return False
+        for warship_size, placement in packed:
+            self.__placed[warship_size].append(placement)
+        return True
+
+    def _take(self, warship_size: int) -> None:
+        """
+        Marks a warship of a specified size as placed
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        self.__remaining[warship_size] -= 1
+        if not self.__remaining[warship_size]:
+            del self.__remaining[warship_size]
+        self.__free -= warship_size
+        self.__needed -= warship_size
+
+    def _give_back(self, warship_size: int) -> None:
+        """
+        Marks a warship of a specified size as not placed
+
+        :param warship_size: size of a warship
+        :type warship_size: int
+        """
+        self.__remaining[warship_size] = (
+            self.__remaining.get(warship_size, 0) + 1)
+        self.__free += warship_size
+        self.__needed += warship_size
+
+
+def solve_fleet(size: int, fleet: list[int], rows: list[int] = None,
+                choose=None) -> list[tuple[int, int, bool]]:
+    """
+    Returns placements (x, y, vertical) of the first blocks of
+    all warships of a fleet, ordered the same way as the fleet,
+    None if the fleet cannot be placed on the board or the solver
+    runs out of its budget of search nodes
+
+    :param size: board's size
+    :type size: int
+
+    :param fleet: sizes of all warships to be placed
+    :type fleet: list[int]
+
+    :param rows: occupancy bitboard of warships already placed,
+    defaults to None (an empty board)
+    :type rows: list[int]
+
+    :param choose: function choosing a random element of a range,
+    defaults to None (random.choice)
+    :type choose: Callable
+    """
+    return FleetSolver(size, fleet, rows, choose).solve()
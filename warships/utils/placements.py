@@ -0,0 +1,189 @@
+from functools import lru_cache
+from .bitboard import iter_bits, nth_bit
+from .consts import (PLACEMENT_TABLE_CACHE_SIZE,
+                     MAX_PLACEMENT_TABLE_BOARD_SIZE)
+
+
+def placement_blocks(x: int, y: int, vertical: bool,
+                     warship_size: int) -> list[tuple[int, int]]:
+    """
+    Returns blocks of a straight warship starting at (x, y)
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+
+    :param warship_size: size of a warship
+    :type warship_size: int
+    """
+    if vertical:
+        return [(x+size, y) for size in range(warship_size)]
+    return [(x, y+size) for size in range(warship_size)]
+
+
+@lru_cache(maxsize=PLACEMENT_TABLE_CACHE_SIZE)
+def placement_table(board_size: int, warship_size: int,
+                    vertical: bool) -> tuple[tuple[tuple[int, int], ...], ...]:
+    """
+    Returns blocks of all placements of a specified size and orientation
+    on an empty board as immutable tuples, ordered by x and then y.\n
+    Tables depend only on the board's and warship's size, so they're
+    memoized in a bounded LRU cache shared by all boards and Ai players.
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param warship_size: size of a warship
+    :type warship_size: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+    """
+    if vertical:
+        return tuple(tuple((x+size, y) for size in range(warship_size))
+                     for x in range(board_size - warship_size + 1)
+                     for y in range(board_size))
+    return tuple(tuple((x, y+size) for size in range(warship_size))
+                 for x in range(board_size)
+                 for y in range(board_size - warship_size + 1))
+
+
+def table_available(board_size: int) -> bool:
+    """
+    Checks if placement tables of a board are small enough to be memoized
+
+    :param board_size: board's size
+    :type board_size: int
+    """
+    return board_size <= MAX_PLACEMENT_TABLE_BOARD_SIZE
+
+
+def table_blocks(board_size: int, x: int, y: int, vertical: bool,
+                 warship_size: int) -> tuple[tuple[int, int], ...]:
+    """
+    Returns blocks of a straight warship starting at (x, y) as a tuple,
+    looked up in the memoized placement table if the board
+    is small enough, otherwise computed
+
+    :param board_size: board's size
+    :type board_size: int
+
+    :param x: horizontal axis coordinate of the first block
+    :type x: int
+
+    :param y: vertical axis coordinate of the first block
+    :type y: int
+
+    :param vertical: True if the blocks go along the x axis
+    :type vertical: bool
+
+    :param warship_size: size of a warship
+    :type warship_size: int
+    """
+    if not table_available(board_size):
+        return tuple(placement_blocks(x, y, vertical, warship_size))
+    table = placement_table(board_size, warship_size, vertical)
+    if vertical:
+        return table[x * board_size + y]
+    return table[x * (board_size - warship_size + 1) + y]
+
+
+class PlacementSequence():
+    """
+    PlacementSequence class. Lazy, read-only sequence of placements
+    (x, y, vertical), described only by masks of their first blocks
+    in every row, vertical placements go first.
+    Placements are counted arithmetically and located on access,
+    without building any lists. Contains attributes:
+
+    :param vertical_starts: bit y of vertical_starts[x] is set if
+    a vertical warship can start at (x, y)
+    :type vertical_starts: list[int]
+
+    :param horizontal_starts: bit y of horizontal_starts[x] is set if
+    a horizontal warship can start at (x, y)
+    :type horizontal_starts: list[int]
+
+    :param counts: number of placements in every mask
+    :type counts: list[int]
+    """
+
+    def __init__(self, vertical_starts: list[int],
+                 horizontal_starts: list[int]) -> None:
+        """
+        Creates an instance of the PlacementSequence class.
+
+        :param vertical_starts: masks of vertical placements in every row
+        :type vertical_starts: list[int]
+
+        :param horizontal_starts: masks of horizontal placements
+        in every row
+        :type horizontal_starts: list[int]
+        """
+        self.__masks = [(x, mask, True)
+                        for x, mask in enumerate(vertical_starts) if mask]
+        self.__masks += [(x, mask, False)
+                         for x, mask in enumerate(horizontal_starts) if mask]
+        self.__counts = [mask.bit_count() for _, mask, _ in self.__masks]
+        self.__length = sum(self.__counts)
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def __getitem__(self, index: int) -> tuple[int, int, bool]:
+        """
+        Returns the placement of a specified index as a tuple
+        (x, y, vertical) of its first block.\n
+        Raises IndexError if the index is out of range.
+
+        :param index: index of the placement
+        :type index: int
+        """
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError(index)
+        for (x, mask, vertical), count in zip(self.__masks, self.__counts):
+            if index < count:
+                return x, nth_bit(mask, index), vertical
+            index -= count
+
+    def __iter__(self):
+        """
+        Yields all placements in order
+        """
+        for x, mask, vertical in self.__masks:
+            for y in iter_bits(mask):
+                yield x, y, vertical
+
+    def rotated(self, start: int):
+        """
+        Yields all placements in order, beginning with the one
+        of a specified index and wrapping around to the first one
+
+        :param start: index of the first yielded placement
+        :type start: int
+        """
+        if not self.__length:
+            return
+        start %= self.__length
+        for line, (x, mask, vertical) in enumerate(self.__masks):
+            count = self.__counts[line]
+            if start < count:
+                break
+            start -= count
+        split = nth_bit(mask, start)
+        lower = mask & ((1 << split) - 1)
+        for y in iter_bits(mask ^ lower):
+            yield x, y, vertical
+        for x, other, vertical in self.__masks[line + 1:] + self.__masks[:line]:
+            for y in iter_bits(other):
+                yield x, y, vertical
+        x, _, vertical = self.__masks[line]
+        for y in iter_bits(lower):
+            yield x, y, vertical
@@ -1,8 +1,16 @@
 from os import name
 from pick import pick
+from classes.placement_cursor import PlacementCursor
+from classes.output_sink import OutputSink, ConsoleSink
+from utils.consts import VIEWPORT_SIZE
+try:
+    import curses
+except ImportError:
+    curses = None
 
 
-def pick_location(options: list[list[tuple[int, int]]], size: int) -> int:
+def pick_location(options: list[list[tuple[int, int]]], size: int,
+                  sink: OutputSink = None) -> int:
     """
     Lets the user choose locations for their assigned warships.\n
     Depending on the OS the user has to either:\n
@@ -14,21 +22,84 @@ def pick_location(options: list[list[tuple[int, int]]], size: int) -> int:
 
     :param size: size of a warship that has to be placed
     :type size: int
+
+    :param sink: sink of the presented options and messages,
+    defaults to None (ConsoleSink)
+    :type sink: OutputSink
     """
     if name == "nt":
-        print(f"Place your {size} mast warship\n")
+        sink = sink or ConsoleSink()
+        sink.write(f"Place your {size} mast warship\n")
         for count, locations in enumerate(options):
-            print(f"{count:>3}: {locations}")
-        print("\n")
+            sink.write(f"{count:>3}: {locations}")
+        sink.write("\n")
         while True:
             choice = input(f"Enter your choice (0-{count}): ")
             if choice in [f"{num}" for num in range(count+1)]:
                 return int(choice)
             else:
-                print(
+                sink.write(
                     f"Invalid choice. Enter a number between 1 and {count}\n")
     else:
         title = f"Place your {size} mast warship"
         option, index = pick(
             options, title, indicator="->", default_index=0)
         return index
+
+
+def cursor_location(cursor: PlacementCursor) -> list[tuple[int, int]]:
+    """
+    Lets the user move a warship over the board with their arrow keys
+    (PageUp, PageDown, Home and End move it by a whole viewport),
+    rotate it with R and place it with Enter.\n
+    Returns blocks of the chosen placement.\n
+    Raises OSError if the terminal doesn't support curses.
+
+    :param cursor: cursor of the placed warship
+    :type cursor: PlacementCursor
+    """
+    if curses is None:
+        raise OSError("curses isn't available")
+    return curses.wrapper(_cursor_loop, cursor)
+
+
+def _cursor_loop(screen, cursor: PlacementCursor) -> list[tuple[int, int]]:
+    """
+    Main loop of cursor_location(), run within a curses screen
+
+    :param screen: curses window
+    :type screen: curses.window
+
+    :param cursor: cursor of the placed warship
+    :type cursor: PlacementCursor
+    """
+    moves = {
+        curses.KEY_LEFT: (-1, 0),
+        curses.KEY_RIGHT: (1, 0),
+        curses.KEY_UP: (0, -1),
+        curses.KEY_DOWN: (0, 1),
+        curses.KEY_HOME: (-VIEWPORT_SIZE, 0),
+        curses.KEY_END: (VIEWPORT_SIZE, 0),
+        curses.KEY_PPAGE: (0, -VIEWPORT_SIZE),
+        curses.KEY_NPAGE: (0, VIEWPORT_SIZE),
+    }
+    curses.curs_set(0)
+    while True:
+        screen.erase()
+        height, width = screen.getmaxyx()
+        lines = [
+            f"Place your {cursor.warship_size} mast warship",
+            "Arrows - move, R - rotate, Enter - place",
+            "",
+        ]
+        lines.extend(cursor.render().split("\n"))
+        for row, line in enumerate(lines[:height - 1]):
+            screen.addstr(row, 0, line[:width - 1])
+        screen.refresh()
+        key = screen.getch()
+        if key in moves:
+            cursor.move(*moves[key])
+        elif key in (ord("r"), ord("R")):
+            cursor.rotate()
+        elif key in (curses.KEY_ENTER, 10, 13) and cursor.is_valid():
+            return cursor.blocks()